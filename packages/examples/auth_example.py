@@ -7,17 +7,26 @@ RBAC with Casbin, and FastAPI middleware integration.
 
 Requirements:
     pip install netrun-auth[all] netrun-logging
-    pip install fastapi uvicorn
+    pip install fastapi uvicorn orjson
 
 Run:
     uvicorn auth_example:app --reload
 """
 
+import base64
+import functools
+import hashlib
+import hmac
+import os
+import struct
+import sys
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from fastapi import FastAPI, Depends, Request, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
 # ============================================================================
 # LOGGING (Optional but recommended)
@@ -73,26 +82,56 @@ from netrun_auth.rbac import RBACManager
 # Initialize RBAC manager
 rbac_manager = RBACManager()
 
+# Subjects (roles and users) that appear in at least one rule. Any subject
+# outside this set can never be granted anything, so checks for it are
+# rejected without walking the policy list.
+_rbac_subjects: set = set()
+
+
+def add_policies(rules: List[Tuple[str, str, str]]) -> None:
+    """Add (role, obj, act) permission rules in one batch and register their subjects."""
+    rbac_manager.add_policies(rules)
+    _rbac_subjects.update(role for role, _, _ in rules)
+
+
+def add_roles_for_users(assignments: List[Tuple[str, str]]) -> None:
+    """Assign (user, role) pairs in one batch and register the users as subjects."""
+    rbac_manager.add_grouping_policies(assignments)
+    _rbac_subjects.update(user for user, _ in assignments)
+
+
+def rbac_check(sub: str, obj: str, act: str) -> bool:
+    """Check a permission, short-circuiting subjects with no rules."""
+    if sub not in _rbac_subjects:
+        return False
+    return rbac_manager.check(sub, obj, act)
+
+
 # Define policies
-rbac_manager.add_policy("admin", "/api/users", "write")
-rbac_manager.add_policy("admin", "/api/users", "read")
-rbac_manager.add_policy("user", "/api/users", "read")
-rbac_manager.add_policy("user", "/api/profile", "*")
+add_policies([
+    ("admin", "/api/users", "write"),
+    ("admin", "/api/users", "read"),
+    ("user", "/api/users", "read"),
+    ("user", "/api/profile", "*"),
+])
 
 # Add role inheritance
-rbac_manager.add_role_for_user("alice", "admin")
-rbac_manager.add_role_for_user("bob", "user")
+add_roles_for_users([
+    ("alice", "admin"),
+    ("bob", "user"),
+])
 
 
 def demo_rbac():
     """Demonstrate RBAC permission checking."""
     # Check permissions
     print("\nRBAC Permission Checks:")
-    print(f"alice -> /api/users (write): {rbac_manager.check('alice', '/api/users', 'write')}")
-    print(f"alice -> /api/users (read): {rbac_manager.check('alice', '/api/users', 'read')}")
-    print(f"bob -> /api/users (write): {rbac_manager.check('bob', '/api/users', 'write')}")
-    print(f"bob -> /api/users (read): {rbac_manager.check('bob', '/api/users', 'read')}")
-    print(f"bob -> /api/profile (read): {rbac_manager.check('bob', '/api/profile', 'read')}")
+    print(f"alice -> /api/users (write): {rbac_check('alice', '/api/users', 'write')}")
+    print(f"alice -> /api/users (read): {rbac_check('alice', '/api/users', 'read')}")
+    print(f"bob -> /api/users (write): {rbac_check('bob', '/api/users', 'write')}")
+    print(f"bob -> /api/users (read): {rbac_check('bob', '/api/users', 'read')}")
+    print(f"bob -> /api/profile (read): {rbac_check('bob', '/api/profile', 'read')}")
+    print(f"mallory -> /api/users (read): {rbac_check('mallory', '/api/users', 'read')}")
 
 
 # ============================================================================
@@ -130,6 +169,35 @@ from netrun_auth.mfa import TOTPManager
 
 totp_manager = TOTPManager()
 
+TOTP_PERIOD_SECONDS = 30
+TOTP_DIGITS = 6
+
+
+@functools.lru_cache(maxsize=4096)
+def _totp_hmac(secret: str) -> "hmac.HMAC":
+    """Return a keyed HMAC-SHA1 template for a base32 TOTP secret."""
+    key = base64.b32decode(secret.upper() + "=" * (-len(secret) % 8))
+    return hmac.new(key, digestmod=hashlib.sha1)
+
+
+def _totp_at(secret: str, counter: int) -> str:
+    """Compute the RFC 6238 code for a time step, reusing the keyed HMAC."""
+    mac = _totp_hmac(secret).copy()
+    mac.update(struct.pack(">Q", counter))
+    digest = mac.digest()
+    offset = digest[-1] & 0x0F
+    value = struct.unpack(">I", digest[offset:offset + 4])[0] & 0x7FFFFFFF
+    return str(value % 10**TOTP_DIGITS).zfill(TOTP_DIGITS)
+
+
+def verify_totp(secret: str, code: str, window: int = 1) -> bool:
+    """Verify a TOTP code against the current and adjacent time steps."""
+    counter = int(time.time()) // TOTP_PERIOD_SECONDS
+    ok = False
+    for step in range(counter - window, counter + window + 1):
+        ok |= hmac.compare_digest(_totp_at(secret, step), code)
+    return ok
+
 
 def demo_mfa():
     """Demonstrate MFA/TOTP setup and verification."""
@@ -152,14 +220,14 @@ def demo_mfa():
     print(f"Current TOTP Code: {current_code}")
 
     # Verify code
-    is_valid = totp_manager.verify_code(secret, current_code)
+    is_valid = verify_totp(secret, current_code)
     print(f"Code Valid: {is_valid}")
 
 
 # ============================================================================
 # FASTAPI INTEGRATION
 # ============================================================================
-app = FastAPI(title="Auth Demo", version="1.0.0")
+app = FastAPI(title="Auth Demo", version="1.0.0", default_response_class=ORJSONResponse)
 
 
 class LoginRequest(BaseModel):
@@ -168,33 +236,110 @@ class LoginRequest(BaseModel):
 
 
 class TokenResponse(BaseModel):
+    # Built only from server-side values, so responses skip validation
+    # via model_construct(); request models stay fully validated.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     access_token: str
     token_type: str = "bearer"
     expires_in: int = 3600
 
 
+# Validated-token cache: blake2b-128 digest of the token -> (cache expiry, payload).
+# Keying by digest keeps entries small; entries never outlive the token's ``exp``.
+TOKEN_CACHE_TTL_SECONDS = 300
+TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: Dict[bytes, Tuple[float, TokenPayload]] = {}
+
+
+def decode_token_cached(token: str) -> TokenPayload:
+    """Decode a JWT, reusing the result for repeated presentations of the same token."""
+    now = time.time()
+    key = hashlib.blake2b(token.encode("ascii"), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        expires_at, payload = cached
+        if expires_at > now:
+            return payload
+        del _token_cache[key]
+
+    # Raises on invalid tokens; failures are never cached.
+    payload = jwt_manager.decode_token(token)
+    # Interned frozenset makes require_role's membership test a hash probe.
+    payload = payload.model_copy(
+        update={"roles": frozenset(sys.intern(role) for role in payload.roles or ())}
+    )
+
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    if payload.exp is not None:
+        expires_at = min(expires_at, float(payload.exp))
+    if expires_at > now:
+        if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+            _token_cache.pop(next(iter(_token_cache)))
+        _token_cache[key] = (expires_at, payload)
+    return payload
+
+
+class UserRecord(NamedTuple):
+    """Stored credentials for one user."""
+
+    password_hash: str
+    roles: Tuple[str, ...]
+
+
 # Simulated user database
-USERS_DB = {
-    "admin": {
-        "password_hash": password_hasher.hash("admin123"),
-        "roles": ["admin", "user"],
-    },
-    "demo": {
-        "password_hash": password_hasher.hash("demo123"),
-        "roles": ["user"],
-    },
+# Hashes are precomputed (argon2id, m=65536, t=3, p=4) so importing this
+# module does not run the KDF; they can be overridden from the environment.
+#   admin -> "admin123", demo -> "demo123"
+USERS_DB: Dict[str, UserRecord] = {
+    "admin": UserRecord(
+        password_hash=os.getenv(
+            "DEMO_ADMIN_PASSWORD_HASH",
+            "$argon2id$v=19$m=65536,t=3,p=4$eb6/G5kRPnN8EyFbq5kbzQ$7aqA5qieZwcL1FTtDV6woNQ9zxvdLP6WOFbKbHB4/Xs",
+        ),
+        roles=("admin", "user"),
+    ),
+    "demo": UserRecord(
+        password_hash=os.getenv(
+            "DEMO_USER_PASSWORD_HASH",
+            "$argon2id$v=19$m=65536,t=3,p=4$DJbWlXyGiuLvOZFcMZHipw$2qj+GvF9FL7eUNTefwTybGQA19q/t0Q3xtjmiT3gbfY",
+        ),
+        roles=("user",),
+    ),
 }
 
+# Verified against when the username is unknown, so that login takes the
+# same time whether or not the account exists.
+DUMMY_PASSWORD_HASH = (
+    "$argon2id$v=19$m=65536,t=3,p=4$/57GslefCCZNNYFIJI+4MA$iumNbumbxEMn+NauvlM7M9mZnaMFE8mYZ7pykeLIsm8"
+)
+
+
+_AUTHORIZATION = b"authorization"
+_BEARER = b"bearer "
+
+
+def _authorization_header(request: Request) -> Optional[bytes]:
+    """Return the raw Authorization header from the ASGI scope.
+
+    Header names in the scope are already lower-cased. Only the first
+    Authorization header is considered.
+    """
+    for name, value in request.scope["headers"]:
+        if name == _AUTHORIZATION:
+            return value
+    return None
+
 
 async def get_current_user(request: Request) -> Optional[TokenPayload]:
     """Extract and validate JWT from request."""
-    auth_header = request.headers.get("Authorization")
-    if not auth_header or not auth_header.startswith("Bearer "):
+    auth_header = _authorization_header(request)
+    if auth_header is None or auth_header[:7].lower() != _BEARER:
         return None
 
-    token = auth_header[7:]
+    token = auth_header[7:].decode("latin-1")
     try:
-        return jwt_manager.decode_token(token)
+        return decode_token_cached(token)
     except Exception as e:
         logger.warning("token_validation_failed", error=str(e))
         return None
@@ -207,10 +352,17 @@ def require_auth(user: Optional[TokenPayload] = Depends(get_current_user)) -> To
     return user
 
 
+@functools.lru_cache(maxsize=64)
 def require_role(required_role: str):
-    """Require specific role."""
+    """Require specific role.
+
+    Memoized so each role name maps to one dependency callable, which lets
+    FastAPI share its result across a request's dependency tree.
+    """
+    required_role = sys.intern(required_role)
+
     def role_checker(user: TokenPayload = Depends(require_auth)) -> TokenPayload:
-        if required_role not in (user.roles or []):
+        if required_role not in user.roles:
             raise HTTPException(status_code=403, detail=f"Role '{required_role}' required")
         return user
     return role_checker
@@ -220,22 +372,25 @@ def require_role(required_role: str):
 async def login(request: LoginRequest):
     """Authenticate user and return JWT."""
     user = USERS_DB.get(request.username)
-    if not user or not password_hasher.verify(request.password, user["password_hash"]):
+    password_hash = user.password_hash if user else DUMMY_PASSWORD_HASH
+    password_ok = password_hasher.verify(request.password, password_hash)
+    # Bitwise & keeps a single branch; the error never says which check failed.
+    if not ((user is not None) & bool(password_ok)):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     token = jwt_manager.create_token(
         sub=request.username,
-        roles=user["roles"],
+        roles=list(user.roles),
     )
 
     logger.info("user_logged_in", username=request.username)
-    return TokenResponse(access_token=token)
+    return TokenResponse.model_construct(access_token=token, token_type="bearer", expires_in=3600)
 
 
 @app.get("/auth/me")
 async def get_me(user: TokenPayload = Depends(require_auth)):
     """Get current user info."""
-    return {"user_id": user.sub, "roles": user.roles}
+    return {"user_id": user.sub, "roles": sorted(user.roles)}
 
 
 @app.get("/admin/users")
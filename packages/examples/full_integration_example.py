@@ -8,17 +8,22 @@ in a production FastAPI application.
 Requirements:
     pip install netrun-logging netrun-errors netrun-auth[all] netrun-config[all]
     pip install netrun-cors netrun-db-pool netrun-llm netrun-env
-    pip install fastapi uvicorn
+    pip install fastapi uvicorn orjson
 
 Run:
     uvicorn full_integration_example:app --reload
 """
 
+import hashlib
+import hmac
+import logging
+import time
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from fastapi import FastAPI, Request, Depends, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
 # ============================================================================
 # 1. LOGGING CONFIGURATION (Always first)
@@ -42,6 +47,12 @@ configure_logging(
 logger = get_logger(__name__)
 audit_logger = create_audit_logger("demo-api")
 
+# Level filtering is fixed by configure_logging(), so resolve it once and skip
+# building event kwargs for disabled per-request log calls. Recompute these
+# if logging is reconfigured at runtime.
+INFO_ENABLED = logger.is_enabled_for(logging.INFO)
+AUDIT_INFO_ENABLED = audit_logger.is_enabled_for(logging.INFO)
+
 # ============================================================================
 # 2. ERROR HANDLING
 # ============================================================================
@@ -90,12 +101,44 @@ jwt_manager = JWTManager(
     expiry_minutes=settings.jwt_expiry_minutes,
 )
 
+# Validated-token cache: blake2b-128 digest of the token -> (cache expiry, payload).
+# Keying by digest keeps entries small; entries never outlive the token's ``exp``.
+TOKEN_CACHE_TTL_SECONDS = 300
+TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: Dict[bytes, Tuple[float, TokenPayload]] = {}
+
+
+def decode_token_cached(token: str) -> TokenPayload:
+    """Decode a JWT, reusing the result for repeated presentations of the same token."""
+    now = time.time()
+    key = hashlib.blake2b(token.encode("ascii"), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        expires_at, payload = cached
+        if expires_at > now:
+            return payload
+        del _token_cache[key]
+
+    # Raises on invalid tokens; failures are never cached.
+    payload = jwt_manager.decode_token(token)
+
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    if payload.exp is not None:
+        expires_at = min(expires_at, float(payload.exp))
+    if expires_at > now:
+        if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+            _token_cache.pop(next(iter(_token_cache)))
+        _token_cache[key] = (expires_at, payload)
+    return payload
+
 # ============================================================================
 # 5. CORS CONFIGURATION
 # ============================================================================
-from netrun_cors import create_cors_middleware
+from netrun_cors import CORSMiddleware
 
-cors_middleware = create_cors_middleware(
+# Keyword arguments only; Starlette builds the middleware once when the
+# app stack is assembled.
+cors_options = dict(
     allow_origins=["http://localhost:3000", "https://app.example.com"],
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
@@ -132,11 +175,44 @@ app = FastAPI(
     title=settings.app_name,
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+_AUTHORIZATION = b"authorization"
+_BEARER = b"bearer "
+
+
+def _find_authorization(headers) -> Optional[bytes]:
+    """Return the first raw Authorization header value from ASGI headers.
+
+    Header names in the scope are already lower-cased.
+    """
+    for name, value in headers:
+        if name == _AUTHORIZATION:
+            return value
+    return None
+
+
+class AuthorizationHeaderMiddleware:
+    """Scan the request headers for Authorization once per request.
+
+    The raw value (or None) is stored in ``scope["state"]["authorization"]``
+    so every auth dependency resolved for the request reuses it.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["authorization"] = _find_authorization(scope["headers"])
+        await self.app(scope, receive, send)
+
+
 # Add middlewares in order
+app.add_middleware(AuthorizationHeaderMiddleware)
 app.add_middleware(CorrelationMiddleware)
-app.add_middleware(cors_middleware.__class__, **cors_middleware.__dict__)
+app.add_middleware(CORSMiddleware, **cors_options)
 
 # Register exception handlers
 register_exception_handlers(app)
@@ -145,24 +221,32 @@ register_exception_handlers(app)
 # ============================================================================
 # DEPENDENCY INJECTION
 # ============================================================================
+def _authorization_header(request: Request) -> Optional[bytes]:
+    """Return the raw Authorization header, preferring the middleware's parse."""
+    state = request.scope.get("state")
+    if state is not None and "authorization" in state:
+        return state["authorization"]
+    return _find_authorization(request.scope["headers"])
+
+
 async def get_current_user(request: Request) -> Optional[TokenPayload]:
     """Extract and validate JWT from Authorization header."""
-    auth_header = request.headers.get("Authorization")
+    auth_header = _authorization_header(request)
     if not auth_header:
         return None
 
-    if not auth_header.startswith("Bearer "):
+    if auth_header[:7].lower() != _BEARER:
         raise AuthenticationError(
             message="Invalid authorization header format",
             error_code="AUTH_001",
         )
 
-    token = auth_header[7:]
+    token = auth_header[7:].decode("latin-1")
     try:
-        payload = jwt_manager.decode_token(token)
+        payload = decode_token_cached(token)
         bind_request_context(
-            method=request.method,
-            path=str(request.url.path),
+            method=request.scope["method"],
+            path=request.scope["path"],
             user_id=payload.sub,
         )
         return payload
@@ -193,12 +277,19 @@ class LoginRequest(BaseModel):
 
 
 class LoginResponse(BaseModel):
+    # Response models are built only from server-side values, so they are
+    # created with model_construct() to skip validation; request models
+    # stay fully validated.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     access_token: str
     token_type: str = "bearer"
     expires_in: int
 
 
 class UserResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     user_id: str
     username: str
     roles: list[str]
@@ -230,8 +321,11 @@ async def health_check():
 @log_timing(operation="user_login", level="info")
 async def login(request: LoginRequest):
     """Authenticate user and return JWT."""
-    # In production, validate against database
-    if request.username != "demo" or request.password != "password":
+    # In production, validate against database. Both fields are always
+    # compared so response time does not reveal whether the username exists.
+    username_ok = hmac.compare_digest(request.username.encode(), b"demo")
+    password_ok = hmac.compare_digest(request.password.encode(), b"password")
+    if not (username_ok & password_ok):
         audit_logger.warning(
             "login_failed",
             username=request.username,
@@ -249,10 +343,12 @@ async def login(request: LoginRequest):
         custom_claims={"email": f"{request.username}@example.com"},
     )
 
-    audit_logger.info("login_successful", username=request.username)
+    if AUDIT_INFO_ENABLED:
+        audit_logger.info("login_successful", username=request.username)
 
-    return LoginResponse(
+    return LoginResponse.model_construct(
         access_token=token,
+        token_type="bearer",
         expires_in=settings.jwt_expiry_minutes * 60,
     )
 
@@ -260,8 +356,9 @@ async def login(request: LoginRequest):
 @app.get("/auth/me", response_model=UserResponse)
 async def get_current_user_info(user: TokenPayload = Depends(require_auth)):
     """Get current authenticated user info."""
-    logger.info("user_info_requested", user_id=user.sub)
-    return UserResponse(
+    if INFO_ENABLED:
+        logger.info("user_info_requested", user_id=user.sub)
+    return UserResponse.model_construct(
         user_id=user.sub,
         username=user.sub,
         roles=user.roles or [],
@@ -286,12 +383,13 @@ async def create_item(
         # In production, save to database
         item_id = "item-123"
 
-        audit_logger.info(
-            "item_created",
-            item_id=item_id,
-            item_name=item.name,
-            owner_id=user.sub,
-        )
+        if AUDIT_INFO_ENABLED:
+            audit_logger.info(
+                "item_created",
+                item_id=item_id,
+                item_name=item.name,
+                owner_id=user.sub,
+            )
 
         return ItemResponse(
             id=item_id,
@@ -307,7 +405,8 @@ async def get_item(
     user: TokenPayload = Depends(require_auth),
 ):
     """Get item by ID."""
-    logger.info("item_requested", item_id=item_id, user_id=user.sub)
+    if INFO_ENABLED:
+        logger.info("item_requested", item_id=item_id, user_id=user.sub)
 
     # In production, fetch from database
     if item_id != "item-123":
@@ -341,11 +440,12 @@ async def delete_item(
         )
 
     # In production, delete from database
-    audit_logger.info(
-        "item_deleted",
-        item_id=item_id,
-        deleted_by=user.sub,
-    )
+    if AUDIT_INFO_ENABLED:
+        audit_logger.info(
+            "item_deleted",
+            item_id=item_id,
+            deleted_by=user.sub,
+        )
 
     return None
 
@@ -13,8 +13,11 @@ Run:
 """
 
 import asyncio
+import atexit
 import time
 
+from structlog.testing import capture_logs
+
 # ============================================================================
 # BASIC LOGGING
 # ============================================================================
@@ -65,22 +68,44 @@ def handle_request(request_id: str, user_id: str):
 
 
 # 2. Operation Timing Context Manager
-def slow_database_operation():
+def database_operation():
     """Demonstrate operation timing with context manager."""
     with log_operation_timing("database_query", resource_type="users"):
-        # Simulate slow operation
-        time.sleep(0.1)
-        logger.info("query_executed", rows_returned=42)
+        # No artificial delay: the logged duration reflects real work only
+        rows = sum(1 for _ in range(42))
+        logger.info("query_executed", rows_returned=rows)
 
 
 # 3. Timing Decorator
-@log_timing(operation="external_api_call", level="info")
-def call_external_api():
-    """Demonstrate timing decorator."""
-    time.sleep(0.05)
+def _external_api_call():
     return {"status": "success"}
 
 
+call_external_api = log_timing(operation="external_api_call", level="info")(_external_api_call)
+
+
+TIMING_OVERHEAD_ITERATIONS = 200
+
+
+def measure_timing_overhead():
+    """Show the per-call cost log_timing adds to a sub-microsecond function."""
+    start = time.perf_counter_ns()
+    for _ in range(TIMING_OVERHEAD_ITERATIONS):
+        _external_api_call()
+    bare_ns = (time.perf_counter_ns() - start) / TIMING_OVERHEAD_ITERATIONS
+
+    # Collect the completion events instead of printing one line per call;
+    # the timing covers the decorator and event building, not output I/O
+    with capture_logs():
+        start = time.perf_counter_ns()
+        for _ in range(TIMING_OVERHEAD_ITERATIONS):
+            call_external_api()
+        timed_ns = (time.perf_counter_ns() - start) / TIMING_OVERHEAD_ITERATIONS
+
+    print(f"Bare call: {bare_ns:,.0f} ns, with log_timing: {timed_ns:,.0f} ns "
+          f"(overhead {timed_ns - bare_ns:,.0f} ns per call)")
+
+
 # 4. Audit Logger
 audit_logger = create_audit_logger("logging-demo")
 
@@ -106,6 +131,31 @@ async def async_operation():
     logger.info("async_operation_completed", result="success")
 
 
+_event_loop = None
+
+
+def run_async(coro):
+    """Run a coroutine on a persistent event loop.
+
+    Unlike asyncio.run(), the loop is created once and reused, so calling
+    main() repeatedly (e.g. from tests) does not pay loop setup/teardown.
+    """
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+    return _event_loop.run_until_complete(coro)
+
+
+@atexit.register
+def close_event_loop():
+    """Finalize async generators and close the loop run_async() created."""
+    if _event_loop is not None and not _event_loop.is_closed():
+        try:
+            _event_loop.run_until_complete(_event_loop.shutdown_asyncgens())
+        finally:
+            _event_loop.close()
+
+
 # ============================================================================
 # SENSITIVE DATA REDACTION
 # ============================================================================
@@ -137,17 +187,18 @@ def main():
     handle_request(request_id="req-123", user_id="user-456")
 
     print("\n3. Operation Timing")
-    slow_database_operation()
+    database_operation()
 
     print("\n4. Timing Decorator")
     result = call_external_api()
     logger.info("api_result", result=result)
+    measure_timing_overhead()
 
     print("\n5. Audit Logging")
     perform_sensitive_action(user_id="admin-001", action="grant_admin")
 
     print("\n6. Async Logging")
-    asyncio.run(async_operation())
+    run_async(async_operation())
 
     print("\n7. Sensitive Data Redaction")
     demonstrate_redaction()
@@ -6,7 +6,7 @@ Demonstrates the core packages in a minimal FastAPI application.
 
 Requirements:
     pip install netrun-logging netrun-errors netrun-auth netrun-cors
-    pip install fastapi uvicorn
+    pip install fastapi uvicorn orjson
 
 Run:
     uvicorn quick_start_example:app --reload
@@ -17,6 +17,7 @@ Test:
 """
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 # ============================================================================
@@ -52,9 +53,11 @@ jwt_manager = JWTManager(
 # ============================================================================
 # 4. CORS
 # ============================================================================
-from netrun_cors import create_cors_middleware
+from netrun_cors import CORSMiddleware
 
-cors_middleware = create_cors_middleware(
+# Keyword arguments only; Starlette builds the middleware once when the
+# app stack is assembled.
+cors_options = dict(
     allow_origins=["http://localhost:3000"],
     allow_credentials=True,
 )
@@ -62,10 +65,14 @@ cors_middleware = create_cors_middleware(
 # ============================================================================
 # APPLICATION SETUP
 # ============================================================================
-app = FastAPI(title="Netrun Quick Start", version="1.0.0")
+app = FastAPI(
+    title="Netrun Quick Start",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Add middleware
-app.add_middleware(cors_middleware.__class__, **cors_middleware.__dict__)
+app.add_middleware(CORSMiddleware, **cors_options)
 
 # Register exception handlers
 register_exception_handlers(app)
@@ -6,14 +6,24 @@ Demonstrates using netrun-pytest-fixtures for comprehensive testing.
 
 Requirements:
     pip install netrun-pytest-fixtures[all]
-    pip install pytest pytest-asyncio httpx
+    pip install pytest pytest-asyncio httpx orjson sqlalchemy
 
 Run:
     pytest test_example.py -v
 """
 
+import asyncio
+import hashlib
+import inspect
+import logging
+import os
+import uuid
+
+import orjson
 import pytest
-from unittest.mock import AsyncMock, patch
+from sqlalchemy import text
+from unittest.mock import AsyncMock, MagicMock, patch
+
 
 # ============================================================================
 # CONFTEST SETUP (normally in conftest.py)
@@ -24,49 +34,328 @@ pytest_plugins = ["netrun_pytest_fixtures"]
 # ============================================================================
 # SAMPLE CODE TO TEST
 # ============================================================================
+# Cached users are stored as orjson-encoded bytes. Use a redis client with
+# decode_responses=False so payloads go bytes -> orjson -> dict with no
+# intermediate str.
+def _pack_user(user: dict) -> bytes:
+    return orjson.dumps(user, option=orjson.OPT_NON_STR_KEYS)
+
+
+_unpack_user = orjson.loads
+
+
+# Statements are built once at import. SQLAlchemy caches the compiled form per
+# statement, and the asyncpg dialect keeps a per-connection prepared-statement
+# cache keyed by the SQL string, so each query is parsed and planned once per
+# pooled connection instead of on every call.
+_SELECT_USER = text("SELECT id, username, email FROM users WHERE id = :id")
+_SELECT_USERS = text("SELECT id, username, email FROM users WHERE id = ANY(:ids)")
+_INSERT_USER = text("INSERT INTO users (id, username, email) VALUES (:id, :username, :email)")
+
+# Bound str.__add__ builds "user:<id>" without f-string formatting
+_user_key = "user:".__add__
+
+
+def _noop(*args, **kwargs) -> None:
+    pass
+
+
+def _info_method(logger):
+    """Return ``logger.info``, or a no-op if there is no logger or INFO is filtered."""
+    if logger is None:
+        return _noop
+    is_enabled = getattr(logger, "isEnabledFor", None) or getattr(logger, "is_enabled_for", None)
+    if is_enabled is not None and not is_enabled(logging.INFO):
+        return _noop
+    return logger.info
+
+
+def _ainfo_method(logger):
+    """Return the logger's awaitable ``ainfo`` (structlog), or None if unavailable."""
+    if _info_method(logger) is _noop:
+        return None
+    ainfo = getattr(logger, "ainfo", None)
+    return ainfo if inspect.iscoroutinefunction(ainfo) else None
+
+
+def _bind_component(logger):
+    """Bind ``component="UserService"`` once on structlog-style loggers.
+
+    With structlog configured using ``cache_logger_on_first_use=True`` the
+    bound logger keeps its processor chain, so per-call context stays limited
+    to the event keyword arguments.
+    """
+    bind = getattr(logger, "bind", None)
+    return logger if bind is None else bind(component="UserService")
+
+
 class UserService:
-    """Example service for testing."""
+    """Example service for testing.
 
-    def __init__(self, db_session, redis_client, logger=None):
+    The service takes ownership of the database session and Redis client:
+    their ``execute``/``get``/``set`` methods are bound once at construction,
+    so replacing those attributes afterwards has no effect. Build a new
+    service instead of hot-swapping clients.
+    """
+
+    def __init__(self, db_session, redis_client, logger=None, cache_writer=None):
         self.db = db_session
         self.redis = redis_client
-        self.logger = logger
+        # Optional write-behind queue for cache fills (see CacheWriter)
+        self._cache_writer = cache_writer
+        self.logger = _bind_component(logger)
+        # Bound once; the hot paths skip the per-call attribute lookups
+        self._redis_get = redis_client.get
+        self._redis_set = redis_client.set
+        self._db_execute = db_session.execute
+        self.reconfigure_logging()
+
+    def reconfigure_logging(self) -> None:
+        """Re-resolve the log methods; call after changing the logger's level.
+
+        The INFO check is done here rather than per request, so hot paths
+        call ``self._info`` unconditionally and a disabled level costs a
+        no-op call.
+        """
+        self._info = _info_method(self.logger)
+        self._ainfo = _ainfo_method(self.logger)
 
     async def get_user(self, user_id: str):
         """Get user by ID with caching."""
         # Check cache first
-        cached = await self.redis.get(f"user:{user_id}")
+        key = _user_key(user_id)
+        cached = await self._redis_get(key)
+        if cached:
+            self._info("cache_hit", user_id=user_id)
+            return _unpack_user(cached)
+
+        user, _ = await self._load_user(key, user_id)
+        return user
+
+    async def get_user_raw(self, user_id: str) -> bytes:
+        """Get user by ID as cached JSON bytes.
+
+        For API handlers that return the payload as-is: cache hits are passed
+        through without a decode/re-encode round trip. Requires a bytes-mode
+        redis client (``decode_responses=False``).
+        """
+        key = _user_key(user_id)
+        cached = await self._redis_get(key)
         if cached:
-            if self.logger:
-                self.logger.info("cache_hit", user_id=user_id)
+            self._info("cache_hit", user_id=user_id)
             return cached
 
-        # Fetch from database
-        user = await self.db.execute(f"SELECT * FROM users WHERE id = '{user_id}'")
+        _, payload = await self._load_user(key, user_id)
+        return payload
+
+    async def _load_user(self, key: str, user_id: str) -> tuple[dict, bytes]:
+        """Fetch a user from the database and cache it; returns (user, payload)."""
+        user = await self._db_execute(_SELECT_USER, {"id": user_id})
         if not user:
             raise ValueError(f"User {user_id} not found")
 
-        # Cache result
-        await self.redis.set(f"user:{user_id}", user, ex=300)
-        if self.logger:
-            self.logger.info("user_fetched", user_id=user_id)
-        return user
+        # Cache result; with an async logger, overlap the log write with the SET
+        payload = _pack_user(user)
+        if self._cache_writer is not None:
+            self._cache_writer.put(key, payload)
+            self._info("user_fetched", user_id=user_id)
+        elif self._ainfo is None:
+            await self._redis_set(key, payload, ex=300)
+            self._info("user_fetched", user_id=user_id)
+        else:
+            await asyncio.gather(
+                self._redis_set(key, payload, ex=300),
+                self._ainfo("user_fetched", user_id=user_id),
+            )
+        return user, payload
+
+    async def get_users(self, user_ids: list[str]) -> dict:
+        """Get several users by ID in one cache round trip and one query.
+
+        Unknown IDs are omitted from the result.
+        """
+        cached = await self.redis.mget(list(map(_user_key, user_ids)))
+        users = {
+            user_id: _unpack_user(payload)
+            for user_id, payload in zip(user_ids, cached)
+            if payload
+        }
+
+        missing = [user_id for user_id in user_ids if user_id not in users]
+        if missing:
+            rows = await self._db_execute(_SELECT_USERS, {"ids": missing})
+            fetched = {row["id"]: row for row in rows or ()}
+            if fetched:
+                # Write back all misses in a single pipelined round trip
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for user_id, user in fetched.items():
+                        pipe.set(_user_key(user_id), _pack_user(user), ex=300)
+                    await pipe.execute()
+                users.update(fetched)
+
+        self._info(
+            "users_fetched",
+            requested=len(user_ids),
+            cache_hits=len(user_ids) - len(missing),
+        )
+        return users
 
     async def create_user(self, username: str, email: str):
         """Create a new user."""
-        user_id = f"user-{hash(username) % 10000}"
+        # Stable across processes (unlike hash(), which is salted per run)
+        # and 64 bits wide, so collisions are negligible
+        user_id = "user-" + hashlib.blake2b(username.encode("utf-8"), digest_size=8).hexdigest()
 
         # Save to database
-        await self.db.execute(
-            f"INSERT INTO users (id, username, email) VALUES ('{user_id}', '{username}', '{email}')"
+        await self._db_execute(
+            _INSERT_USER,
+            {"id": user_id, "username": username, "email": email},
         )
 
-        if self.logger:
-            self.logger.info("user_created", user_id=user_id, username=username)
+        self._info("user_created", user_id=user_id, username=username)
 
         return {"id": user_id, "username": username, "email": email}
 
 
+class AsyncBatchLogger:
+    """Logger facade that takes log calls off the request path.
+
+    ``info()`` only enqueues the record; a background task drains the queue
+    and forwards records to the wrapped logger in batches. Records are
+    counted in ``dropped`` (never raised) when the queue is full, and in
+    ``failed`` when the wrapped logger raises.
+    Pass an instance as ``UserService(logger=...)``.
+    """
+
+    def __init__(self, logger, maxsize: int = 10_000, batch_size: int = 512):
+        self._logger = logger
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._batch_size = batch_size
+        self._task = None
+        self.dropped = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        """Start the drain task on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+
+    def info(self, event: str, **kwargs) -> None:
+        try:
+            self._queue.put_nowait((event, kwargs))
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def _drain(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            written = 0
+            try:
+                for event, kwargs in batch:
+                    self._logger.info(event, **kwargs)
+                    written += 1
+            except Exception:
+                self.failed += len(batch) - written
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued record has been written."""
+        await self._queue.join()
+
+    async def aclose(self) -> None:
+        """Flush pending records and stop the drain task."""
+        if self._task is not None:
+            await self.flush()
+            self._task.cancel()
+            self._task = None
+
+
+class CacheWriter:
+    """Write-behind queue that coalesces cache fills into pipelined SETs.
+
+    ``put()`` only enqueues the entry; a background task drains up to
+    ``batch_size`` entries, or whatever arrives within ``linger`` seconds of
+    the first one, and writes them in a single pipeline round trip. Cache
+    fills are best-effort: entries are counted in ``dropped`` when the queue
+    is full and in ``failed`` when a flush errors.
+    Pass an instance as ``UserService(cache_writer=...)``.
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        maxsize: int = 4096,
+        batch_size: int = 256,
+        linger: float = 0.005,
+        ttl: int = 300,
+    ):
+        self._redis = redis_client
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._batch_size = batch_size
+        self._linger = linger
+        self._ttl = ttl
+        self._task = None
+        self.dropped = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        """Start the drain task on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+
+    def put(self, key: str, payload: bytes) -> None:
+        try:
+            self._queue.put_nowait((key, payload))
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def _next_batch(self) -> list:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self._linger
+        while len(batch) < self._batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _drain(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for key, payload in batch:
+                        pipe.set(key, payload, ex=self._ttl)
+                    await pipe.execute()
+            except Exception:
+                self.failed += len(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued entry has been written."""
+        await self._queue.join()
+
+    async def aclose(self) -> None:
+        """Flush pending entries and stop the drain task."""
+        if self._task is not None:
+            await self.flush()
+            self._task.cancel()
+            self._task = None
+
+
 # ============================================================================
 # BASIC FIXTURE TESTS
 # ============================================================================
@@ -87,8 +376,6 @@ class TestBasicFixtures:
 
     def test_sample_uuid(self, sample_uuid):
         """Test UUID fixture."""
-        import uuid
-
         assert isinstance(sample_uuid, uuid.UUID)
 
 
@@ -191,8 +478,6 @@ class TestLoggingFixtures:
 
     def test_captured_logs(self, captured_logs):
         """Test log capture fixture."""
-        import logging
-
         logger = logging.getLogger("test")
         logger.info("Test message")
 
@@ -208,12 +493,28 @@ class TestLoggingFixtures:
 # ============================================================================
 # SERVICE INTEGRATION TESTS
 # ============================================================================
+def _mock_pipeline(mock_redis):
+    """Attach an async-context-manager pipeline mock to ``mock_redis``."""
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    pipe.execute = AsyncMock()
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+    return pipe
+
+
 class TestUserService:
     """Integration tests for UserService."""
 
     @pytest.fixture
     def user_service(self, async_db_session, mock_redis, mock_logger):
         """Create UserService with fixtures."""
+        # UserService binds these at construction, so mock them up front
+        async_db_session.execute = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=None)
+        mock_redis.set = AsyncMock()
+        # UserService logs through logger.bind(component=...); keep it the same mock
+        mock_logger.bind.return_value = mock_logger
         return UserService(
             db_session=async_db_session,
             redis_client=mock_redis,
@@ -224,8 +525,8 @@ class TestUserService:
     async def test_get_user_cache_miss(self, user_service, async_db_session, mock_redis):
         """Test getting user with cache miss."""
         # Setup
-        mock_redis.get = AsyncMock(return_value=None)
-        async_db_session.execute = AsyncMock(return_value={"id": "user-123", "name": "Test"})
+        mock_redis.get.return_value = None
+        async_db_session.execute.return_value = {"id": "user-123", "name": "Test"}
 
         # Execute
         user = await user_service.get_user("user-123")
@@ -239,7 +540,7 @@ class TestUserService:
         """Test getting user with cache hit."""
         # Setup
         cached_user = {"id": "user-123", "name": "Cached User"}
-        mock_redis.get = AsyncMock(return_value=cached_user)
+        mock_redis.get.return_value = orjson.dumps(cached_user)
 
         # Execute
         user = await user_service.get_user("user-123")
@@ -249,20 +550,174 @@ class TestUserService:
         mock_logger.info.assert_called_with("cache_hit", user_id="user-123")
 
     @pytest.mark.asyncio
-    async def test_create_user(self, user_service, async_db_session, mock_logger):
-        """Test creating a new user."""
+    async def test_get_user_raw_passthrough(self, user_service, async_db_session, mock_redis):
+        """Test raw lookups return cached bytes untouched and encode misses once."""
         # Setup
-        async_db_session.execute = AsyncMock()
+        payload = orjson.dumps({"id": "user-123", "name": "Cached User"})
+        mock_redis.get.return_value = payload
+
+        # Execute / verify cache hit
+        assert await user_service.get_user_raw("user-123") is payload
+
+        # Execute / verify cache miss
+        mock_redis.get.return_value = None
+        async_db_session.execute.return_value = {"id": "user-456", "name": "DB User"}
+        raw = await user_service.get_user_raw("user-456")
+        assert orjson.loads(raw) == {"id": "user-456", "name": "DB User"}
+        mock_redis.set.assert_called_once_with("user:user-456", raw, ex=300)
+
+    @pytest.mark.asyncio
+    async def test_get_user_concurrent_lookups(self, user_service, async_db_session, mock_redis):
+        """Test independent lookups awaited concurrently on one loop."""
+        # Setup
+        cached = {"user:user-1": orjson.dumps({"id": "user-1", "name": "Cached User"})}
+        mock_redis.get.side_effect = cached.get
+        async_db_session.execute.return_value = {"id": "user-2", "name": "DB User"}
+
+        # Execute
+        hit, miss = await asyncio.gather(
+            user_service.get_user("user-1"),
+            user_service.get_user("user-2"),
+        )
+
+        # Verify
+        assert hit == {"id": "user-1", "name": "Cached User"}
+        assert miss == {"id": "user-2", "name": "DB User"}
+        async_db_session.execute.assert_awaited_once()
+        mock_redis.set.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reconfigure_logging(self, user_service, mock_redis, mock_logger):
+        """Test that level changes take effect after reconfigure_logging()."""
+        # Setup
+        mock_redis.get.return_value = orjson.dumps({"id": "user-123"})
+        mock_logger.isEnabledFor = MagicMock(return_value=False)
+        user_service.reconfigure_logging()
+
+        # Execute with INFO disabled
+        await user_service.get_user("user-123")
+        mock_logger.info.assert_not_called()
+
+        # Execute with INFO re-enabled
+        mock_logger.isEnabledFor.return_value = True
+        user_service.reconfigure_logging()
+        await user_service.get_user("user-123")
+
+        # Verify
+        mock_logger.info.assert_called_once_with("cache_hit", user_id="user-123")
+
+    @pytest.mark.asyncio
+    async def test_get_users_batches_misses(self, user_service, async_db_session, mock_redis):
+        """Test batch lookup with one cache hit and one miss."""
+        # Setup
+        cached_user = {"id": "user-1", "name": "Cached User"}
+        db_user = {"id": "user-2", "name": "DB User"}
+        mock_redis.mget = AsyncMock(return_value=[orjson.dumps(cached_user), None])
+        async_db_session.execute.return_value = [db_user]
+        pipe = _mock_pipeline(mock_redis)
 
+        # Execute
+        users = await user_service.get_users(["user-1", "user-2"])
+
+        # Verify
+        assert users == {"user-1": cached_user, "user-2": db_user}
+        mock_redis.mget.assert_called_once_with(["user:user-1", "user:user-2"])
+        async_db_session.execute.assert_called_once()
+        pipe.set.assert_called_once_with("user:user-2", orjson.dumps(db_user), ex=300)
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_create_user(self, user_service, async_db_session, mock_logger):
+        """Test creating a new user."""
         # Execute
         user = await user_service.create_user("testuser", "test@example.com")
 
         # Verify
+        assert user["id"] == "user-" + hashlib.blake2b(b"testuser", digest_size=8).hexdigest()
         assert user["username"] == "testuser"
         assert user["email"] == "test@example.com"
         async_db_session.execute.assert_called_once()
 
 
+class TestCacheWriter:
+    """Tests for the write-behind cache queue used by UserService."""
+
+    @pytest.mark.asyncio
+    async def test_entries_coalesced_into_one_pipeline(self, mock_redis):
+        """Test that queued entries are written in a single pipeline."""
+        pipe = _mock_pipeline(mock_redis)
+        writer = CacheWriter(mock_redis)
+        writer.start()
+
+        writer.put("user:user-1", b"1")
+        writer.put("user:user-2", b"2")
+        await writer.aclose()
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.set.call_count == 2
+        pipe.set.assert_called_with("user:user-2", b"2", ex=300)
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_user_miss_is_written_behind(self, async_db_session, mock_redis):
+        """Test that UserService hands cache fills to the writer."""
+        pipe = _mock_pipeline(mock_redis)
+        async_db_session.execute = AsyncMock(return_value={"id": "user-123"})
+        mock_redis.get = AsyncMock(return_value=None)
+        mock_redis.set = AsyncMock()
+        writer = CacheWriter(mock_redis)
+        writer.start()
+        service = UserService(async_db_session, mock_redis, cache_writer=writer)
+
+        user = await service.get_user("user-123")
+        await writer.flush()
+
+        assert user == {"id": "user-123"}
+        mock_redis.set.assert_not_called()
+        pipe.set.assert_called_once_with("user:user-123", orjson.dumps(user), ex=300)
+        await writer.aclose()
+
+
+class TestAsyncBatchLogger:
+    """Tests for the queued logger used by UserService."""
+
+    @pytest.mark.asyncio
+    async def test_records_written_after_flush(self, mock_logger):
+        """Test that queued records reach the wrapped logger in order."""
+        batch_logger = AsyncBatchLogger(mock_logger)
+        batch_logger.start()
+
+        batch_logger.info("cache_hit", user_id="user-1")
+        batch_logger.info("cache_hit", user_id="user-2")
+        await batch_logger.aclose()
+
+        assert mock_logger.info.call_count == 2
+        mock_logger.info.assert_called_with("cache_hit", user_id="user-2")
+
+    @pytest.mark.asyncio
+    async def test_overflow_is_counted_not_raised(self, mock_logger):
+        """Test that a full queue drops records instead of blocking."""
+        batch_logger = AsyncBatchLogger(mock_logger, maxsize=1)
+
+        batch_logger.info("first")
+        batch_logger.info("second")
+
+        assert batch_logger.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_logger_error_does_not_hang_flush(self, mock_logger):
+        """Test that a raising logger is counted and flush() still returns."""
+        mock_logger.info.side_effect = RuntimeError("handler down")
+        batch_logger = AsyncBatchLogger(mock_logger)
+        batch_logger.start()
+
+        batch_logger.info("first")
+        batch_logger.info("second")
+        await asyncio.wait_for(batch_logger.aclose(), timeout=1)
+
+        assert batch_logger.failed == 2
+
+
 # ============================================================================
 # FASTAPI CLIENT TESTS
 # ============================================================================
@@ -296,15 +751,11 @@ class TestEnvironmentFixtures:
 
     def test_clean_environment(self, clean_env):
         """Test clean environment fixture."""
-        import os
-
         # Fixture should provide isolated environment
         assert "TEST_VAR" not in os.environ
 
     def test_temp_env_vars(self, temp_env):
         """Test temporary environment variables."""
-        import os
-
         temp_env["MY_VAR"] = "my_value"
         assert os.environ.get("MY_VAR") == "my_value"
 
@@ -15,7 +15,7 @@ Version: 1.2.0
 Date: 2025-12-05
 """
 
-from typing import List, Set, Dict, Optional, Any
+from typing import List, Set, Dict, FrozenSet, Optional, Any
 from functools import wraps
 
 from .types import Role, Permission, User
@@ -46,6 +46,10 @@ class RBACManager:
         """Initialize RBAC manager with default roles."""
         self.roles: Dict[str, Role] = {}
         self.role_hierarchy: Dict[str, List[str]] = {}
+        # Resolved (inherited) permissions per role, rebuilt lazily after
+        # add_role or any Role change (tracked by Role.mutations)
+        self._role_permissions_cache: Dict[str, FrozenSet[str]] = {}
+        self._cache_mutations = Role.mutations
         self._initialize_default_roles()
 
     def _initialize_default_roles(self) -> None:
@@ -128,6 +132,7 @@ class RBACManager:
         self.roles[role.name] = role
         if role.inherits_from:
             self.role_hierarchy[role.name] = role.inherits_from
+        self._role_permissions_cache.clear()
         logger.debug(f"Added role: {role.name}")
 
     def get_role(self, role_name: str) -> Optional[Role]:
@@ -155,6 +160,19 @@ class RBACManager:
         Raises:
             RoleNotFoundError: If role does not exist
         """
+        return set(self._resolve_role_permissions(role_name))
+
+    def _resolve_role_permissions(self, role_name: str) -> FrozenSet[str]:
+        """Resolve a role's inherited permissions, memoized until roles change."""
+        if self._cache_mutations != Role.mutations:
+            # A role was edited (e.g. get_role(name).remove_permission(...))
+            self._role_permissions_cache.clear()
+            self._cache_mutations = Role.mutations
+
+        cached = self._role_permissions_cache.get(role_name)
+        if cached is not None:
+            return cached
+
         role = self.get_role(role_name)
         if not role:
             raise RoleNotFoundError(
@@ -167,10 +185,11 @@ class RBACManager:
         # Add inherited permissions
         if role.inherits_from:
             for parent_role_name in role.inherits_from:
-                parent_permissions = self.get_role_permissions(parent_role_name)
-                permissions.update(parent_permissions)
+                permissions.update(self._resolve_role_permissions(parent_role_name))
 
-        return permissions
+        resolved = frozenset(permissions)
+        self._role_permissions_cache[role_name] = resolved
+        return resolved
 
     def get_user_permissions(self, user: User) -> Set[str]:
         """
@@ -187,8 +206,7 @@ class RBACManager:
         # Add role-based permissions
         for role_name in user.roles:
             try:
-                role_permissions = self.get_role_permissions(role_name)
-                all_permissions.update(role_permissions)
+                all_permissions.update(self._resolve_role_permissions(role_name))
             except RoleNotFoundError:
                 logger.warning(f"User {user.user_id} has unknown role: {role_name}")
                 continue
@@ -10,7 +10,7 @@ Date: 2025-11-25
 """
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Any, ClassVar, Literal
 from enum import Enum
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -216,9 +216,19 @@ class Permission(BaseModel):
 
 
 class Role(BaseModel):
-    """Role model with permission aggregation."""
+    """
+    Role model with permission aggregation.
+
+    Change permissions through add_permission/remove_permission or by
+    assigning a new list; in-place edits of ``permissions`` bypass the
+    change tracking that RBACManager's permission cache relies on.
+    """
     model_config = ConfigDict(extra="forbid")
 
+    # Bumped on every role change, so caches of resolved permissions
+    # (RBACManager) can tell that a role they read from changed
+    mutations: ClassVar[int] = 0
+
     name: str = Field(..., description="Role name (e.g., 'admin', 'user', 'viewer')")
     permissions: List[str] = Field(default_factory=list, description="Permission strings")
     inherits_from: Optional[List[str]] = Field(None, description="Parent roles to inherit permissions")
@@ -228,12 +238,18 @@ class Role(BaseModel):
         """Check if role grants specified permission."""
         return permission in self.permissions
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        Role.mutations += 1
+
     def add_permission(self, permission: str) -> None:
         """Add permission to role."""
         if permission not in self.permissions:
             self.permissions.append(permission)
+            Role.mutations += 1
 
     def remove_permission(self, permission: str) -> None:
         """Remove permission from role."""
         if permission in self.permissions:
             self.permissions.remove(permission)
+            Role.mutations += 1
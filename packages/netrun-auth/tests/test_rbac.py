@@ -302,3 +302,48 @@ class TestRBACEdgeCases:
         permissions=None should be treated as empty list.
         """
         pytest.skip("Waiting for netrun_auth.rbac module")
+
+
+class TestRolePermissionCache:
+    """Test resolved role permissions track role changes after a cached lookup."""
+
+    @pytest.fixture
+    def manager(self):
+        from netrun.auth.rbac import RBACManager
+
+        return RBACManager()
+
+    @pytest.fixture
+    def viewer(self):
+        from netrun.auth.types import User
+
+        return User(user_id="user-123", roles=["viewer"])
+
+    def test_permission_granted_after_cached_lookup(self, manager, viewer):
+        """Adding a permission to a role is visible once permissions are cached."""
+        assert not manager.check_permission(viewer, "reports:read", raise_exception=False)
+
+        manager.get_role("viewer").add_permission("reports:read")
+
+        assert manager.check_permission(viewer, "reports:read", raise_exception=False)
+        # Inherited by roles built on top of viewer as well
+        assert "reports:read" in manager.get_role_permissions("admin")
+
+    def test_permission_revoked_after_cached_lookup(self, manager, viewer):
+        """Removing a permission from a role stops granting it immediately."""
+        assert manager.check_permission(viewer, "projects:read", raise_exception=False)
+        assert "projects:read" in manager.get_role_permissions("viewer")
+
+        manager.get_role("viewer").remove_permission("projects:read")
+
+        assert not manager.check_permission(viewer, "projects:read", raise_exception=False)
+        assert "projects:read" not in manager.get_role_permissions("viewer")
+
+    def test_permissions_reassigned_after_cached_lookup(self, manager, viewer):
+        """Assigning a new permission list to a role replaces the cached set."""
+        assert manager.check_permission(viewer, "users:read", raise_exception=False)
+
+        manager.get_role("viewer").permissions = ["services:read"]
+
+        assert not manager.check_permission(viewer, "users:read", raise_exception=False)
+        assert manager.check_permission(viewer, "services:read", raise_exception=False)
@@ -3,6 +3,8 @@
 Verification script for netrun-core namespace package.
 
 This script tests all critical functionality of the netrun-core foundation package.
+Checks are data-driven: each entry in CHECKS is evaluated against the imported
+module and the report is written to stdout in a single call.
 """
 
 import sys
@@ -11,123 +13,86 @@ import os
 # Add current directory to path for testing
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def test_import():
-    """Test basic import functionality."""
-    print("Test 1: Basic import...")
-    try:
-        import netrun
-        print("  ✓ Successfully imported netrun module")
-        return True
-    except ImportError as e:
-        print(f"  ✗ Failed to import netrun: {e}")
-        return False
 
-def test_version_info():
-    """Test version and metadata attributes."""
-    print("\nTest 2: Version and metadata...")
+def _public_attrs(module):
+    """Return the module's public (non-underscore) attribute names."""
+    return [attr for attr in dir(module) if not attr.startswith('_')]
+
+
+# (label, predicate, detail) - predicate and detail both take the module
+CHECKS = [
+    ("Version",
+     lambda m: m.__version__ == "1.0.0",
+     lambda m: m.__version__),
+    ("Author",
+     lambda m: m.__author__ == "Netrun Systems",
+     lambda m: m.__author__),
+    ("Email",
+     lambda m: m.__email__ == "dev@netrunsystems.com",
+     lambda m: m.__email__),
+    ("Namespace path",
+     # Namespace packages need an iterable __path__
+     lambda m: len(list(m.__path__)) > 0,
+     lambda m: f"{list(m.__path__)} ({len(list(m.__path__))} entry/entries)"),
+    ("Module docstring",
+     lambda m: "Netrun Systems" in (m.__doc__ or ""),
+     lambda m: f"{len(m.__doc__ or '')} chars"),
+    ("Clean namespace",
+     # Informational only: public attributes are allowed if intentional
+     lambda m: True,
+     lambda m: f"public attributes {_public_attrs(m)}" if _public_attrs(m) else "no public attributes"),
+]
+
+
+def run_check(module, check):
+    """Evaluate one CHECKS entry, returning (label, passed, detail)."""
+    label, predicate, detail = check
     try:
-        import netrun
+        return label, bool(predicate(module)), detail(module)
+    except Exception as e:
+        return label, False, f"{type(e).__name__}: {e}"
 
-        assert hasattr(netrun, '__version__'), "Missing __version__ attribute"
-        assert netrun.__version__ == "1.0.0", f"Version mismatch: {netrun.__version__}"
-        print(f"  ✓ Version: {netrun.__version__}")
 
-        assert hasattr(netrun, '__author__'), "Missing __author__ attribute"
-        assert netrun.__author__ == "Netrun Systems", f"Author mismatch: {netrun.__author__}"
-        print(f"  ✓ Author: {netrun.__author__}")
+def format_rows(results):
+    """Render check results as report lines."""
+    for label, passed, detail in results:
+        yield f"  {'✓' if passed else '✗'} {label}: {detail}"
 
-        assert hasattr(netrun, '__email__'), "Missing __email__ attribute"
-        assert netrun.__email__ == "dev@netrunsystems.com", f"Email mismatch: {netrun.__email__}"
-        print(f"  ✓ Email: {netrun.__email__}")
-
-        return True
-    except (ImportError, AssertionError) as e:
-        print(f"  ✗ Failed: {e}")
-        return False
-
-def test_namespace_path():
-    """Test namespace path extension capability."""
-    print("\nTest 3: Namespace path extension...")
-    try:
-        import netrun
-
-        assert hasattr(netrun, '__path__'), "Missing __path__ attribute"
-        print(f"  ✓ Namespace path: {netrun.__path__}")
-
-        # Verify it's iterable (required for namespace packages)
-        paths = list(netrun.__path__)
-        print(f"  ✓ Path is iterable with {len(paths)} entry/entries")
-
-        return True
-    except (ImportError, AssertionError) as e:
-        print(f"  ✗ Failed: {e}")
-        return False
-
-def test_docstring():
-    """Test module docstring exists."""
-    print("\nTest 4: Module documentation...")
-    try:
-        import netrun
 
-        assert netrun.__doc__ is not None, "Missing module docstring"
-        assert "Netrun Systems" in netrun.__doc__, "Docstring missing company name"
-        print(f"  ✓ Module has comprehensive docstring ({len(netrun.__doc__)} chars)")
+def main():
+    """Run all verification checks."""
+    reconfigure = getattr(sys.stdout, 'reconfigure', None)
+    if reconfigure is not None:
+        reconfigure(line_buffering=False)
 
-        return True
-    except (ImportError, AssertionError) as e:
-        print(f"  ✗ Failed: {e}")
-        return False
+    lines = ["=" * 70, "netrun-core Package Verification", "=" * 70]
 
-def test_no_submodules():
-    """Test that core package doesn't expose unexpected submodules."""
-    print("\nTest 5: Clean namespace (no unexpected submodules)...")
     try:
         import netrun
-
-        # Expected attributes (not submodules)
-        expected_attrs = ['__version__', '__author__', '__email__', '__path__',
-                         '__doc__', '__name__', '__package__', '__loader__',
-                         '__spec__', '__file__']
-
-        actual_attrs = [attr for attr in dir(netrun) if not attr.startswith('_')]
-
-        if actual_attrs:
-            print(f"  ⚠ Found public attributes: {actual_attrs}")
-            print("    (This is OK if intentional)")
-        else:
-            print("  ✓ Namespace is clean (no public attributes)")
-
-        return True
-    except (ImportError, Exception) as e:
-        print(f"  ✗ Failed: {e}")
-        return False
-
-def main():
-    """Run all verification tests."""
-    print("=" * 70)
-    print("netrun-core Package Verification")
-    print("=" * 70)
-
-    tests = [
-        test_import,
-        test_version_info,
-        test_namespace_path,
-        test_docstring,
-        test_no_submodules,
+    except ImportError as e:
+        results = [("Import", False, f"Failed to import netrun: {e}")]
+    else:
+        results = [("Import", True, "Successfully imported netrun module")]
+        results += [run_check(netrun, check) for check in CHECKS]
+
+    passed = sum(result[1] for result in results)
+    lines.extend(format_rows(results))
+    lines += [
+        "",
+        "=" * 70,
+        f"Results: {passed}/{len(results)} checks passed",
+        "=" * 70,
+        "",
     ]
+    if passed == len(results):
+        lines.append("✓ All tests passed! Package is ready for use.")
+    else:
+        lines.append("✗ Some tests failed. Please review the output above.")
 
-    results = [test() for test in tests]
-
-    print("\n" + "=" * 70)
-    print(f"Results: {sum(results)}/{len(results)} tests passed")
-    print("=" * 70)
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    return 0 if passed == len(results) else 1
 
-    if all(results):
-        print("\n✓ All tests passed! Package is ready for use.")
-        return 0
-    else:
-        print("\n✗ Some tests failed. Please review the output above.")
-        return 1
 
 if __name__ == "__main__":
     sys.exit(main())
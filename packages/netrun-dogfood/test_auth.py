@@ -17,6 +17,7 @@ Prerequisites:
 """
 
 import asyncio
+import io
 import sys
 from datetime import datetime
 from netrun_dogfood.auth import get_auth
@@ -24,17 +25,43 @@ from netrun_dogfood.config import get_config
 from netrun_dogfood.tools import netrunsite
 
 
+# Output is buffered per test phase and written with one stdout write, instead
+# of one write (and flush, on a terminal) per line
+_OUT = io.StringIO()
+
+
+def emit(text: str = "") -> None:
+    """Buffer one output line."""
+    _OUT.write(f"{text}\n")
+
+
+def flush_output() -> None:
+    """Write buffered output to stdout and reset the buffer."""
+    sys.stdout.write(_OUT.getvalue())
+    sys.stdout.flush()
+    _OUT.seek(0)
+    _OUT.truncate(0)
+
+
+async def run_phase(test, *args):
+    """Run one test phase, writing its buffered output when it finishes."""
+    try:
+        return await test(*args)
+    finally:
+        flush_output()
+
+
 def print_header(text: str) -> None:
     """Print formatted section header."""
-    print(f"\n{'='*80}")
-    print(f"  {text}")
-    print('='*80)
+    emit(f"\n{'='*80}")
+    emit(f"  {text}")
+    emit('='*80)
 
 
 def print_status(label: str, status: bool, details: str = "") -> None:
     """Print status line with checkmark or cross."""
     icon = "[PASS]" if status else "[FAIL]"
-    print(f"{icon} {label}: {details}")
+    emit(f"{icon} {label}: {details}")
 
 
 async def test_configuration():
@@ -43,9 +70,9 @@ async def test_configuration():
 
     config = get_config()
 
-    print(f"USE_KEYVAULT_AUTH: {config.use_keyvault_auth}")
-    print(f"AZURE_KEYVAULT_URL: {config.azure_keyvault_url or 'Not set'}")
-    print()
+    emit(f"USE_KEYVAULT_AUTH: {config.use_keyvault_auth}")
+    emit(f"AZURE_KEYVAULT_URL: {config.azure_keyvault_url or 'Not set'}")
+    emit()
 
     print_status(
         "Azure Tenant ID",
@@ -69,53 +96,49 @@ async def test_configuration():
         config.azure_client_secret
     ])
 
-    print()
+    emit()
     print_status("Authentication Configured", all_configured)
 
     return all_configured
 
 
-async def test_authentication():
+async def test_authentication(auth):
     """Test Azure AD token acquisition."""
     print_header("Authentication Test")
 
-    auth = get_auth()
-
     if not auth.is_configured:
         print_status("Authentication", False, "Not configured")
-        print("\n[WARNING] Please configure Azure AD credentials:")
-        print("   Option 1: Set environment variables")
-        print("     export AZURE_TENANT_ID='<tenant-id>'")
-        print("     export AZURE_CLIENT_ID='<client-id>'")
-        print("     export AZURE_CLIENT_SECRET='<client-secret>'")
-        print()
-        print("   Option 2: Use Azure Key Vault")
-        print("     export AZURE_KEYVAULT_URL='https://netrun-keyvault.vault.azure.net'")
-        print("     export USE_KEYVAULT_AUTH='true'")
+        emit("\n[WARNING] Please configure Azure AD credentials:")
+        emit("   Option 1: Set environment variables")
+        emit("     export AZURE_TENANT_ID='<tenant-id>'")
+        emit("     export AZURE_CLIENT_ID='<client-id>'")
+        emit("     export AZURE_CLIENT_SECRET='<client-secret>'")
+        emit()
+        emit("   Option 2: Use Azure Key Vault")
+        emit("     export AZURE_KEYVAULT_URL='https://netrun-keyvault.vault.azure.net'")
+        emit("     export USE_KEYVAULT_AUTH='true'")
         return False
 
     try:
         token = await auth.get_token("netrunsite")
         print_status("Token Acquisition", True, f"Token acquired ({len(token)} chars)")
-        print(f"   Token preview: {token[:30]}...")
+        emit(f"   Token preview: {token[:30]}...")
         return True
     except Exception as e:
         print_status("Token Acquisition", False, str(e))
         return False
 
 
-async def test_netrunsite_health():
+async def test_netrunsite_health(auth):
     """Test NetrunSite API health check."""
     print_header("NetrunSite Health Check")
 
-    auth = get_auth()
-
     try:
         result = await netrunsite.handle_tool("netrunsite_health", {}, auth)
 
         # Parse result
         for r in result:
-            print(r.text)
+            emit(r.text)
 
         print_status("NetrunSite API", True, "Healthy")
         return True
@@ -124,18 +147,16 @@ async def test_netrunsite_health():
         return False
 
 
-async def test_list_posts():
+async def test_list_posts(auth):
     """Test listing blog posts."""
     print_header("List Blog Posts Test")
 
-    auth = get_auth()
-
     try:
         result = await netrunsite.handle_tool("netrunsite_list_posts", {}, auth)
 
         posts = []
         for r in result:
-            print(r.text)
+            emit(r.text)
             # Try to count posts (simple text parsing)
             if "posts found" in r.text.lower() or "post" in r.text.lower():
                 posts.append(r.text)
@@ -153,34 +174,37 @@ async def test_list_posts():
 
 async def main():
     """Run all tests."""
-    print(f"\n{'='*80}")
-    print("  NetrunSite MCP Tool Authentication Test")
-    print(f"  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print('='*80)
+    emit(f"\n{'='*80}")
+    emit("  NetrunSite MCP Tool Authentication Test")
+    emit(f"  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    emit('='*80)
 
     results = []
 
     # Test 1: Configuration
-    results.append(("Configuration", await test_configuration()))
+    results.append(("Configuration", await run_phase(test_configuration)))
 
     if not results[0][1]:
-        print("\n[WARNING] Authentication not configured. Skipping remaining tests.")
+        emit("\n[WARNING] Authentication not configured. Skipping remaining tests.")
         print_summary(results)
         return 1
 
+    # Resolved once and shared by the remaining phases
+    auth = get_auth()
+
     # Test 2: Authentication
-    results.append(("Authentication", await test_authentication()))
+    results.append(("Authentication", await run_phase(test_authentication, auth)))
 
     if not results[1][1]:
-        print("\n[WARNING] Authentication failed. Skipping API tests.")
+        emit("\n[WARNING] Authentication failed. Skipping API tests.")
         print_summary(results)
         return 1
 
     # Test 3: Health check
-    results.append(("Health Check", await test_netrunsite_health()))
+    results.append(("Health Check", await run_phase(test_netrunsite_health, auth)))
 
     # Test 4: List posts
-    results.append(("List Posts", await test_list_posts()))
+    results.append(("List Posts", await run_phase(test_list_posts, auth)))
 
     # Print summary
     print_summary(results)
@@ -200,15 +224,16 @@ def print_summary(results):
     passed_count = sum(1 for _, passed in results if passed)
     total_count = len(results)
 
-    print()
-    print(f"Tests passed: {passed_count}/{total_count}")
+    emit()
+    emit(f"Tests passed: {passed_count}/{total_count}")
 
     if passed_count == total_count:
-        print("\n[SUCCESS] All tests passed!")
+        emit("\n[SUCCESS] All tests passed!")
     else:
-        print(f"\n[FAILED] {total_count - passed_count} test(s) failed")
+        emit(f"\n[FAILED] {total_count - passed_count} test(s) failed")
 
-    print('='*80)
+    emit('='*80)
+    flush_output()
 
 
 if __name__ == "__main__":
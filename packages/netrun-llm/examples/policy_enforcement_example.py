@@ -11,10 +11,20 @@ Examples:
     - Rate limiting
     - Usage tracking and reporting
 
+The async example runs on uvloop when it is installed (pip install uvloop),
+a drop-in event loop with a faster C-level selector; otherwise asyncio's
+default loop is used.
+
 Author: Netrun Systems
 """
 
 import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from netrun.llm import (
     TenantPolicy,
     ProviderPolicy,
@@ -28,6 +38,8 @@ from netrun.llm import (
     OpenAIAdapter,
     OllamaAdapter,
     LLMConfig,
+    estimate_tokens,
+    pack_usage_batch,
 )
 
 
@@ -246,6 +258,13 @@ def example_usage_tracking():
         print(f"  {model}: {stats['requests']} requests, ${stats['cost_usd']:.4f}")
 
 
+async def persist_usage(records):
+    """Usage sink: store each flushed batch as a single packed row."""
+    blob = pack_usage_batch(records)
+    # In a real app: INSERT INTO usage_batches (tenant_id, flush_ts, event_count, blob)
+    print(f"Persisted {len(records)} usage record(s) as one {len(blob)}-byte row")
+
+
 async def example_integration_with_fallback_chain():
     """Example 6: Integration with LLMFallbackChain."""
     print("\n=== Example 6: Integration with Fallback Chain ===\n")
@@ -273,7 +292,8 @@ async def example_integration_with_fallback_chain():
         fallback_to_local=True,
     )
 
-    enforcer = PolicyEnforcer(policy)
+    # Usage is persisted in batches off the request path
+    enforcer = PolicyEnforcer(policy, usage_sink=persist_usage)
 
     # Create LLM config
     config = LLMConfig.from_env()
@@ -299,41 +319,53 @@ async def example_integration_with_fallback_chain():
         ]
     )
 
-    # Validate request before execution
-    try:
-        # Estimate tokens (rough approximation)
-        prompt = "Explain the benefits of policy enforcement in LLM applications."
-        estimated_tokens = len(prompt.split()) * 1.3 * 2  # Input + output estimate
-
-        enforcer.validate_request(
-            provider="anthropic",
-            model="claude-3-5-sonnet",
-            estimated_tokens=int(estimated_tokens),
-            reason="User documentation query",
-        )
-
-        # Execute request (in real app)
-        # response = await chain.execute_async(prompt)
+    async def handle(prompt: str, reason: str) -> None:
+        # Estimate tokens (input + output, ~4 bytes per token)
+        estimated_tokens = estimate_tokens(prompt)
+        try:
+            # Validate and hold the estimated cost against the budget until
+            # the actual usage is committed (released automatically on error)
+            with enforcer.request(
+                provider="anthropic",
+                model="claude-3-5-sonnet",
+                estimated_tokens=estimated_tokens,
+                reason=reason,
+            ) as usage:
+                # Execute request (in real app)
+                # response = await chain.execute_async(prompt)
+                await asyncio.sleep(0)
+
+                # Record actual usage (queued for batched persistence)
+                usage.commit(
+                    cost_usd=0.0027,
+                    tokens_input=20,
+                    tokens_output=150,
+                    latency_ms=1100,
+                )
+            print(f"✓ Request validated, executed, and tracked: {reason}")
+        except FallbackToLocalError as e:
+            print(f"⚠ Falling back to local model: {e}")
+            # In real app, retry with Ollama
+        except PolicyViolationError as e:
+            print(f"✗ Policy violation: {e}")
 
-        # Record usage after execution
-        enforcer.record_usage(
-            provider="anthropic",
-            model="claude-3-5-sonnet",
-            tokens_input=20,
-            tokens_output=150,
-            cost_usd=0.0027,
-            latency_ms=1100,
-            success=True,
-            reason="User documentation query",
+    # Requests run concurrently on one event loop; usage persistence happens
+    # on the enforcer's background flush task, not between requests.
+    # (On Python 3.11+ an asyncio.TaskGroup works the same way.)
+    try:
+        await asyncio.gather(
+            handle(
+                "Explain the benefits of policy enforcement in LLM applications.",
+                "User documentation query",
+            ),
+            handle(
+                "Summarize the tenant budget options.",
+                "Admin console help",
+            ),
         )
-
-        print("✓ Request validated, executed, and tracked successfully")
-
-    except FallbackToLocalError as e:
-        print(f"⚠ Falling back to local model: {e}")
-        # In real app, retry with Ollama
-    except PolicyViolationError as e:
-        print(f"✗ Policy violation: {e}")
+    finally:
+        # Flush queued usage before shutdown
+        await enforcer.drain()
 
 
 def example_multi_tenant_isolation():
@@ -420,8 +452,9 @@ def main():
     example_usage_tracking()
     example_multi_tenant_isolation()
 
-    # Run async example
-    asyncio.run(example_integration_with_fallback_chain())
+    # Run async example (on uvloop when installed; uvloop.run needs uvloop >= 0.18)
+    run = getattr(uvloop, "run", None) or asyncio.run
+    run(example_integration_with_fallback_chain())
 
     print("\n" + "="*70)
     print("Examples completed successfully!")
@@ -29,17 +29,6 @@ from netrun.llm.adapters.base import (
 from netrun.llm.adapters.claude import ClaudeAdapter
 from netrun.llm.adapters.openai import OpenAIAdapter
 from netrun.llm.adapters.ollama import OllamaAdapter
-
-# Optional adapters (require extra dependencies)
-try:
-    from netrun.llm.adapters.azure_openai import AzureOpenAIAdapter
-except ImportError:
-    AzureOpenAIAdapter = None
-
-try:
-    from netrun.llm.adapters.gemini import GeminiAdapter
-except ImportError:
-    GeminiAdapter = None
 from netrun.llm.chain import LLMFallbackChain
 from netrun.llm.cognition import ThreeTierCognition, CognitionTier
 from netrun.llm.config import LLMConfig
@@ -54,11 +43,15 @@ from netrun.llm.policies import (
     ProviderPolicy,
     TenantPolicy,
     PolicyEnforcer,
+    UsageReservation,
     UsageRecord,
     CostTier,
     MODEL_COSTS,
     MODEL_COST_TIERS,
     get_model_pricing,
+    estimate_tokens,
+    pack_usage_batch,
+    unpack_usage_batch,
     PolicyViolationError,
     ProviderDisabledError,
     BudgetExceededError,
@@ -74,6 +67,25 @@ from netrun.llm.telemetry import (
     configure_telemetry,
 )
 
+# Optional adapters (AzureOpenAIAdapter, GeminiAdapter) are resolved lazily
+# by netrun.llm.adapters on first access; see __getattr__ below.
+_LAZY_ADAPTERS = ("AzureOpenAIAdapter", "GeminiAdapter")
+
+
+def __getattr__(name):
+    if name in _LAZY_ADAPTERS:
+        from netrun.llm import adapters
+
+        value = getattr(adapters, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ADAPTERS))
+
+
 __version__ = "2.0.0"
 __author__ = "Netrun Systems"
 
@@ -104,11 +116,15 @@ __all__ = [
     "ProviderPolicy",
     "TenantPolicy",
     "PolicyEnforcer",
+    "UsageReservation",
     "UsageRecord",
     "CostTier",
     "MODEL_COSTS",
     "MODEL_COST_TIERS",
     "get_model_pricing",
+    "estimate_tokens",
+    "pack_usage_batch",
+    "unpack_usage_batch",
     "PolicyViolationError",
     "ProviderDisabledError",
     "BudgetExceededError",
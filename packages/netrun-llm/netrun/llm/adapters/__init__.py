@@ -14,21 +14,53 @@ Adapters:
 v2.0.0: Added Azure OpenAI and Gemini adapters from Charlotte production architecture
 """
 
+import importlib
+
 from netrun.llm.adapters.base import BaseLLMAdapter, AdapterTier, LLMResponse
 from netrun.llm.adapters.claude import ClaudeAdapter
 from netrun.llm.adapters.openai import OpenAIAdapter
 from netrun.llm.adapters.ollama import OllamaAdapter
 
-# Optional adapters (require extra dependencies)
-try:
-    from netrun.llm.adapters.azure_openai import AzureOpenAIAdapter
-except ImportError:
-    AzureOpenAIAdapter = None
+# Optional adapters (require extra dependencies). Imported on first attribute
+# access (PEP 562) so the azure/google import chains are only paid by
+# processes that use them; None if the module cannot be imported.
+_LAZY_ADAPTERS = {
+    "AzureOpenAIAdapter": "netrun.llm.adapters.azure_openai",
+    "GeminiAdapter": "netrun.llm.adapters.gemini",
+}
+
+
+def __getattr__(name):
+    if name == "AVAILABLE_ADAPTERS":
+        # Adapter classes importable in this environment, in default chain
+        # order; resolving it imports the optional adapters
+        value = tuple(
+            adapter
+            for adapter in (
+                ClaudeAdapter,
+                OpenAIAdapter,
+                OllamaAdapter,
+                __getattr__("AzureOpenAIAdapter"),
+                __getattr__("GeminiAdapter"),
+            )
+            if adapter is not None
+        )
+        globals()[name] = value
+        return value
+    module_name = _LAZY_ADAPTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name), name)
+    except ImportError:
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ADAPTERS) | {"AVAILABLE_ADAPTERS"})
 
-try:
-    from netrun.llm.adapters.gemini import GeminiAdapter
-except ImportError:
-    GeminiAdapter = None
 
 __all__ = [
     "BaseLLMAdapter",
@@ -39,4 +71,5 @@ __all__ = [
     "OllamaAdapter",
     "AzureOpenAIAdapter",
     "GeminiAdapter",
+    "AVAILABLE_ADAPTERS",
 ]
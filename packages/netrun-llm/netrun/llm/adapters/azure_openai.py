@@ -6,9 +6,11 @@ and cloud credit utilization. Extracted from Charlotte production architecture.
 
 Features:
     - Multi-resource failover (primary → secondary → tertiary)
-    - Azure CLI authentication via DefaultAzureCredential
+    - Native async execution (AsyncAzureOpenAI) with optional hedged failover
+    - Azure AD authentication via DefaultAzureCredential (CLI, managed identity,
+      environment; token cached in-process)
     - Cloud credit utilization (effectively free until credits exhausted)
-    - Circuit breaker protection
+    - Circuit breaker protection (adapter-wide and per resource)
     - Per-resource health tracking
 
 Author: Netrun Systems
@@ -16,33 +18,214 @@ Version: 2.0.0
 License: MIT
 """
 
+import asyncio
+import functools
+import importlib.util
 import os
+import random
 import time
-import subprocess
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Dict, Any, Optional, List, Set, Tuple
 from dataclasses import dataclass
 
 try:
-    from azure.identity import DefaultAzureCredential, get_bearer_token_provider
-    from openai import AzureOpenAI, OpenAIError, RateLimitError, APIError
+    from azure.identity import DefaultAzureCredential
+    from openai import AzureOpenAI, AsyncAzureOpenAI, OpenAIError, RateLimitError, APIError
     AZURE_AVAILABLE = True
 except ImportError:
     AZURE_AVAILABLE = False
     AzureOpenAI = None
+    AsyncAzureOpenAI = None
     DefaultAzureCredential = None
 
+    # Stand-ins so the except clauses below stay valid without the SDK
+    class OpenAIError(Exception):
+        pass
+
+    class APIError(OpenAIError):
+        pass
+
+    class RateLimitError(APIError):
+        pass
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 from .base import BaseLLMAdapter, AdapterTier, LLMResponse
 
+# Azure AD scope for Azure OpenAI (Cognitive Services)
+COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+
+# Seconds a failed credential check is reused by _verify_azure_auth
+AUTH_CHECK_TTL = 30.0
+
+# Connection pool shared by every resource client (HTTP/2 needs the h2 package)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 50
+
+# Pricing per 1M tokens as (input, output) - ChatGPT baseline for comparison
+_MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    "o3-mini": (1.10, 4.40),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1": (2.50, 10.00),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-4o-mini-transcribe": (0.15, 0.60),
+}
+_DEFAULT_PRICING: Tuple[float, float] = (2.50, 10.00)
+
+# Per-resource circuit breaker: failures before a resource is skipped, and
+# seconds before a single half-open probe is let through
+RESOURCE_BREAKER_THRESHOLD = 3
+RESOURCE_BREAKER_TIMEOUT = 60.0
 
-@dataclass
+# Full-jitter exponential backoff before failing over after a rate limit:
+# sleep uniform(0, min(cap, base * 2**attempt)) seconds
+RATE_LIMIT_BACKOFF_BASE = 0.25
+RATE_LIMIT_BACKOFF_CAP = 4.0
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
 class AzureResource:
-    """Configuration for an Azure OpenAI resource"""
+    """Configuration for an Azure OpenAI resource (immutable and hashable)"""
+    __slots__ = ("name", "endpoint", "resource_group", "models", "priority")
+
     name: str
     endpoint: str
     resource_group: str
-    models: List[str]
+    models: Tuple[str, ...]
     priority: int  # 1 = highest priority
 
+    def __post_init__(self):
+        # Accept lists (e.g. from AZURE_OPENAI_RESOURCES JSON) but store a tuple
+        if not isinstance(self.models, tuple):
+            object.__setattr__(self, "models", tuple(self.models))
+
+    # Frozen fields reject the setattr pickle/copy use to restore slots
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+def _rate_limit_backoff(attempt: int) -> float:
+    """Seconds to wait before failover attempt ``attempt`` after a rate limit"""
+    return random.uniform(
+        0, min(RATE_LIMIT_BACKOFF_CAP, RATE_LIMIT_BACKOFF_BASE * 2 ** attempt)
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _format_timestamp(timestamp: int) -> str:
+    """Local time string for a whole-second epoch timestamp"""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+class _ResourceHealth:
+    """Success/failure counts and last use for one Azure resource"""
+
+    __slots__ = ("success", "failure", "last_used")
+
+    def __init__(self):
+        self.success = 0
+        self.failure = 0
+        self.last_used = 0.0  # Wall-clock time, 0.0 = never used
+
+
+class _ResourceBreaker:
+    """
+    CLOSED/OPEN/HALF_OPEN circuit breaker for a single Azure resource.
+
+    ``threshold`` consecutive failures open the breaker; after ``timeout``
+    seconds one probe request is allowed (HALF_OPEN), and its outcome either
+    closes the breaker or re-opens it for another ``timeout``.
+    """
+
+    __slots__ = ("threshold", "timeout", "state", "failure_count", "success_count", "next_attempt_time")
+
+    def __init__(self, threshold: int = RESOURCE_BREAKER_THRESHOLD, timeout: float = RESOURCE_BREAKER_TIMEOUT):
+        self.threshold = threshold
+        self.timeout = timeout
+        self.state = BREAKER_CLOSED
+        self.failure_count = 0
+        self.success_count = 0
+        self.next_attempt_time = 0.0
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now (claims the probe when half-opening)"""
+        if self.state == BREAKER_CLOSED:
+            return True
+        now = time.monotonic()
+        if now >= self.next_attempt_time:
+            # One probe per window; a probe that never reports (cancelled
+            # hedge) doesn't wedge the breaker, the next window probes again
+            self.state = BREAKER_HALF_OPEN
+            self.next_attempt_time = now + self.timeout
+            return True
+        return False
+
+    def on_success(self) -> None:
+        self.state = BREAKER_CLOSED
+        self.failure_count = 0
+        self.success_count += 1
+
+    def on_failure(self) -> None:
+        self.failure_count += 1
+        self.success_count = 0
+        if self.state == BREAKER_HALF_OPEN or self.failure_count >= self.threshold:
+            self.state = BREAKER_OPEN
+            self.next_attempt_time = time.monotonic() + self.timeout
+
+
+class _CachedTokenProvider:
+    """
+    Azure AD token callable for ``azure_ad_token_provider`` with caching.
+
+    The clients call the provider before every request; this returns the
+    cached token until ``refresh_buffer`` seconds before it expires, so the
+    credential (and MSAL/IMDS behind it) is only consulted about once per
+    token lifetime. One caller refreshes while concurrent callers wait.
+    """
+
+    def __init__(self, credential, scope: str = COGNITIVE_SERVICES_SCOPE, refresh_buffer: float = 60.0):
+        self._credential = credential
+        self._scope = scope
+        self._refresh_buffer = refresh_buffer
+        self._lock = threading.Lock()
+        # (token, expires_on) replaced as one tuple so readers never see a mix
+        self._cached: Optional[tuple] = None
+
+    def _valid_token(self) -> Optional[str]:
+        cached = self._cached
+        if cached is not None and time.time() < cached[1] - self._refresh_buffer:
+            return cached[0]
+        return None
+
+    def has_valid_token(self) -> bool:
+        """Whether a cached, unexpired token is available (never fetches)"""
+        return self._valid_token() is not None
+
+    def __call__(self) -> str:
+        token = self._valid_token()
+        if token is not None:
+            return token
+
+        with self._lock:
+            token = self._valid_token()
+            if token is None:
+                access_token = self._credential.get_token(self._scope)
+                self._cached = (access_token.token, access_token.expires_on)
+                token = access_token.token
+            return token
+
 
 class AzureOpenAIAdapter(BaseLLMAdapter):
     """
@@ -51,6 +234,7 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
     Features:
         - Cloud credit utilization (FREE until credits exhausted)
         - Multi-resource failover
+        - Native async execution, optionally hedged across resources
         - Azure CLI authentication (DefaultAzureCredential)
         - Circuit breaker pattern for reliability
         - Per-resource health metrics
@@ -73,7 +257,8 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
         resources: Optional[List[AzureResource]] = None,
         preferred_model: str = None,
         api_version: str = None,
-        timeout: int = None
+        timeout: int = None,
+        hedge_delay: Optional[float] = None
     ):
         """
         Initialize Azure OpenAI adapter.
@@ -83,6 +268,9 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
             preferred_model: Default model to use (default: gpt-4o)
             api_version: Azure OpenAI API version (default: 2024-02-15-preview)
             timeout: Request timeout in seconds (default: 30)
+            hedge_delay: Seconds execute_async waits on a resource before also
+                starting the next one and keeping the first success
+                (default: None = strictly sequential failover)
 
         Raises:
             ImportError: If azure-identity or openai SDK not installed
@@ -100,6 +288,7 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
             "AZURE_OPENAI_API_VERSION", "2024-02-15-preview"
         )
         self.timeout = timeout or int(os.getenv("AZURE_OPENAI_TIMEOUT", "30"))
+        self.hedge_delay = hedge_delay
 
         super().__init__(
             adapter_name=f"AzureOpenAI-{self.preferred_model}",
@@ -110,15 +299,41 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
         # Configure resources (use provided or default)
         self.resources = resources or self._get_default_resources()
 
+        # Failover order and model -> resources in priority order, built once
+        # (resources are treated as fixed after construction)
+        self._resources_by_priority: List[AzureResource] = sorted(
+            self.resources, key=lambda r: r.priority
+        )
+        self._model_index: Dict[str, List[AzureResource]] = {}
+        for resource in self._resources_by_priority:
+            for resource_model in resource.models:
+                self._model_index.setdefault(resource_model, []).append(resource)
+
+        # Per-resource circuit breakers (one failing region doesn't block the rest)
+        self._resource_breaker: Dict[str, _ResourceBreaker] = {
+            resource.name: _ResourceBreaker() for resource in self.resources
+        }
+
         # Initialize Azure authentication
         self.credential = None
         self.token_provider = None
         self.clients: Dict[str, AzureOpenAI] = {}
+        self.async_clients: Dict[str, AsyncAzureOpenAI] = {}
+
+        # Shared httpx pools passed to every client (None = SDK default pools)
+        self._http_client = None
+        self._async_http_client = None
+        self._client_lock = threading.Lock()
 
         # Per-resource health tracking
-        self._resource_success_count: Dict[str, int] = {}
-        self._resource_failure_count: Dict[str, int] = {}
-        self._resource_last_used: Dict[str, float] = {}
+        self._health: Dict[str, _ResourceHealth] = {
+            resource.name: _ResourceHealth() for resource in self.resources
+        }
+        # `+= 1` is a read-modify-write; the sync client is used from worker threads
+        self._health_lock = threading.Lock()
+
+        # Last credential auth check: (monotonic time, authenticated)
+        self._auth_check_cache: Optional[tuple] = None
 
         # Initialize clients for all resources
         self._initialize_clients()
@@ -138,104 +353,173 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
                 name="nrcharlotte",
                 endpoint="https://nrcharlotte.openai.azure.com",
                 resource_group="rg-Daniel-7272",
-                models=["o3-mini", "gpt-4o"],
+                models=("o3-mini", "gpt-4o"),
                 priority=1  # HIGHEST CAPACITY
             ),
             AzureResource(
                 name="wilbur-resource",
                 endpoint="https://wilbur-resource.openai.azure.com",
                 resource_group="Chatbot",
-                models=["gpt-4.1", "gpt-4o", "gpt-4o-mini-transcribe"],
+                models=("gpt-4.1", "gpt-4o", "gpt-4o-mini-transcribe"),
                 priority=2
             ),
             AzureResource(
                 name="oai-netrunmax-prod-eastus",
                 endpoint="https://oai-netrunmax-prod-eastus.openai.azure.com",
                 resource_group="rg-netrunmax-prod",
-                models=["gpt-4-turbo", "text-embedding-ada-002"],
+                models=("gpt-4-turbo", "text-embedding-ada-002"),
                 priority=3
             )
         ]
 
     def _initialize_clients(self) -> None:
-        """Initialize Azure OpenAI clients for all resources"""
+        """Set up Azure authentication; resource clients are built on first use"""
         try:
-            # Set up Azure authentication
+            # One cached token for all resources
             self.credential = DefaultAzureCredential()
-            self.token_provider = get_bearer_token_provider(
-                self.credential,
-                "https://cognitiveservices.azure.com/.default"
-            )
-
-            # Create client for each resource
-            for resource in self.resources:
-                try:
-                    client = AzureOpenAI(
-                        azure_endpoint=resource.endpoint,
-                        azure_ad_token_provider=self.token_provider,
-                        api_version=self.api_version,
-                        timeout=self.timeout
-                    )
-                    self.clients[resource.name] = client
-
-                    # Initialize health tracking
-                    self._resource_success_count[resource.name] = 0
-                    self._resource_failure_count[resource.name] = 0
-                    self._resource_last_used[resource.name] = 0.0
-
-                except Exception as e:
-                    # Log warning but continue (adapter can work with subset of resources)
-                    pass
+            self.token_provider = _CachedTokenProvider(self.credential)
 
         except Exception as e:
             # Azure auth failed - disable adapter
             self.enabled = False
 
+    def _get_or_create_client(self, resource: AzureResource) -> Optional[AzureOpenAI]:
+        """
+        Return the client for a resource, building it (and its async twin) on first use.
+
+        Only resources that actually receive traffic get clients, so failover
+        targets that never fire cost nothing at startup.
+        """
+        client = self.clients.get(resource.name)
+        if client is not None or self.token_provider is None:
+            return client
+
+        with self._client_lock:
+            client = self.clients.get(resource.name)
+            if client is not None:
+                return client
+
+            # One connection pool for all resources, so TLS sessions and
+            # HTTP/2 connections are reused instead of one pool per client
+            # (each is rebuilt independently after close()/aclose())
+            if httpx is not None:
+                limits = httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+                )
+                if self._http_client is None:
+                    self._http_client = httpx.Client(
+                        http2=HTTP2_AVAILABLE, timeout=self.timeout, limits=limits
+                    )
+                if self._async_http_client is None:
+                    self._async_http_client = httpx.AsyncClient(
+                        http2=HTTP2_AVAILABLE, timeout=self.timeout, limits=limits
+                    )
+
+            client = AzureOpenAI(
+                azure_endpoint=resource.endpoint,
+                azure_ad_token_provider=self.token_provider,
+                api_version=self.api_version,
+                timeout=self.timeout,
+                http_client=self._http_client
+            )
+            if AsyncAzureOpenAI is not None and resource.name not in self.async_clients:
+                self.async_clients[resource.name] = AsyncAzureOpenAI(
+                    azure_endpoint=resource.endpoint,
+                    azure_ad_token_provider=self.token_provider,
+                    api_version=self.api_version,
+                    timeout=self.timeout,
+                    http_client=self._async_http_client
+                )
+            # Published last: a client in self.clients implies its async twin exists
+            self.clients[resource.name] = client
+            return client
+
+    def close(self) -> None:
+        """Close the shared sync connection pool; sync clients are rebuilt on next use"""
+        with self._client_lock:
+            # Drop clients bound to the pool so they aren't reused after close
+            self.clients.clear()
+            http_client, self._http_client = self._http_client, None
+        if http_client is not None:
+            http_client.close()
+
+    async def aclose(self) -> None:
+        """Close both shared connection pools; clients are rebuilt on next use"""
+        self.close()
+        with self._client_lock:
+            self.async_clients.clear()
+            async_http_client, self._async_http_client = self._async_http_client, None
+        if async_http_client is not None:
+            await async_http_client.aclose()
+
     def _verify_azure_auth(self) -> bool:
-        """Verify Azure CLI is authenticated"""
+        """Verify the Azure credential can mint a Cognitive Services token"""
+        if self.token_provider is None:
+            return False
+
+        # A live cached token proves authentication
+        if self.token_provider.has_valid_token():
+            return True
+
+        # Reuse a recent result; dashboards poll metadata every second and a
+        # failing DefaultAzureCredential walks its whole chain each time
+        now = time.monotonic()
+        cached = self._auth_check_cache
+        if cached is not None and now - cached[0] < AUTH_CHECK_TTL:
+            return cached[1]
+
+        # Works for any credential in the chain (CLI, managed identity, env)
         try:
-            result = subprocess.run(
-                ["az", "account", "show"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
+            self.token_provider()
+            authenticated = True
         except Exception:
-            return False
+            authenticated = False
 
-    def _get_resource_for_model(self, model: str) -> Optional[AzureResource]:
-        """Find the highest-priority resource that supports the requested model"""
-        sorted_resources = sorted(self.resources, key=lambda r: r.priority)
+        self._auth_check_cache = (now, authenticated)
+        return authenticated
 
-        for resource in sorted_resources:
-            if model in resource.models:
+    def _get_resource_for_model(self, model: str) -> Optional[AzureResource]:
+        """Find the highest-priority resource that supports the model and isn't broken"""
+        for resource in self._model_index.get(model, ()):
+            if self._allow_resource(resource):
                 return resource
 
         return None
 
-    def _select_fallback_resource(self, failed_resources: List[str]) -> Optional[AzureResource]:
-        """Select next available resource for failover"""
-        sorted_resources = sorted(self.resources, key=lambda r: r.priority)
-
-        for resource in sorted_resources:
-            if resource.name not in failed_resources:
+    def _rejects_model(self, model: str, context: Dict[str, Any]) -> bool:
+        """Whether no resource serves the model and substitution wasn't allowed"""
+        return model not in self._model_index and not context.get("allow_model_substitution", False)
+
+    def _select_fallback_resource(self, failed_resources: Set[str]) -> Optional[AzureResource]:
+        """Select next available resource for failover, skipping open breakers"""
+        for resource in self._resources_by_priority:
+            if (
+                resource.name not in failed_resources
+                and self._allow_resource(resource)
+            ):
                 return resource
 
         return None
 
+    def _allow_resource(self, resource: AzureResource) -> bool:
+        """Whether the resource's breaker lets a request through (may claim its probe)"""
+        # Same lock as the outcome updates, so the half-open probe is claimed once
+        with self._health_lock:
+            return self._resource_breaker[resource.name].allow_request()
+
     def _execute_with_resource(
         self,
         resource: AzureResource,
         model: str,
-        messages: List[Dict[str, str]],
+        messages: Tuple[Dict[str, str], ...],
         **kwargs
     ) -> LLMResponse:
         """Execute chat completion with specific resource"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            client = self.clients.get(resource.name)
+            client = self._get_or_create_client(resource)
             if not client:
                 return self._create_error_response(
                     f"No client initialized for {resource.name}",
@@ -243,78 +527,122 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
                     model=model
                 )
 
-            # Extract OpenAI parameters
-            temperature = kwargs.get("temperature", 0.7)
-            max_tokens = kwargs.get("max_tokens", 1000)
-
             # Execute completion
             response = client.chat.completions.create(
                 model=model,
                 messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens
+                temperature=kwargs.get("temperature", 0.7),
+                max_tokens=kwargs.get("max_tokens", 1000)
             )
+            return self._resource_success(resource, model, response, start_time)
 
-            latency_ms = int((time.time() - start_time) * 1000)
-
-            # Extract response data
-            result_text = response.choices[0].message.content
-            tokens_input = response.usage.prompt_tokens
-            tokens_output = response.usage.completion_tokens
+        except Exception as e:
+            return self._resource_error(resource, model, e, start_time)
 
-            # Update health metrics
-            self._resource_success_count[resource.name] += 1
-            self._resource_last_used[resource.name] = time.time()
+    async def _execute_with_resource_async(
+        self,
+        resource: AzureResource,
+        model: str,
+        messages: Tuple[Dict[str, str], ...],
+        **kwargs
+    ) -> LLMResponse:
+        """Execute chat completion with specific resource without blocking the loop"""
+        if resource.name not in self.async_clients:
+            try:
+                self._get_or_create_client(resource)
+            except Exception as e:
+                return self._resource_error(resource, model, e, time.perf_counter())
+
+        client = self.async_clients.get(resource.name)
+        if client is None:
+            # No async client (e.g. a custom sync client): run it off-loop
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                lambda: self._execute_with_resource(resource, model, messages, **kwargs)
+            )
 
-            return LLMResponse(
-                status="success",
-                content=result_text,
-                cost_usd=0.0,  # Cloud credits (FREE)
-                latency_ms=latency_ms,
-                adapter_name=self.adapter_name,
-                model_used=model,
-                tokens_input=tokens_input,
-                tokens_output=tokens_output,
-                metadata={
-                    "resource_name": resource.name,
-                    "resource_group": resource.resource_group,
-                    "endpoint": resource.endpoint,
-                    "effective_cost_saved": self._calculate_effective_cost(
-                        model, tokens_input, tokens_output
-                    )
-                }
+        start_time = time.perf_counter()
+        try:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=kwargs.get("temperature", 0.7),
+                max_tokens=kwargs.get("max_tokens", 1000)
             )
+            return self._resource_success(resource, model, response, start_time)
 
-        except RateLimitError as e:
-            latency_ms = int((time.time() - start_time) * 1000)
-            self._resource_failure_count[resource.name] += 1
+        except Exception as e:
+            return self._resource_error(resource, model, e, start_time)
 
-            return self._create_error_response(
-                f"Rate limit on {resource.name}: {str(e)}",
-                status="rate_limited",
-                latency_ms=latency_ms,
-                model=model
-            )
+    def _resource_success(
+        self,
+        resource: AzureResource,
+        model: str,
+        response: Any,
+        start_time: float
+    ) -> LLMResponse:
+        """Build the LLMResponse for a completed chat completion"""
+        latency_ms = int((time.perf_counter() - start_time) * 1000)
+
+        # Extract response data
+        result_text = response.choices[0].message.content
+        tokens_input = response.usage.prompt_tokens
+        tokens_output = response.usage.completion_tokens
+
+        # Update health metrics
+        health = self._health[resource.name]
+        with self._health_lock:
+            health.success += 1
+            self._resource_breaker[resource.name].on_success()
+        health.last_used = time.time()
+
+        return LLMResponse(
+            status="success",
+            content=result_text,
+            cost_usd=0.0,  # Cloud credits (FREE)
+            latency_ms=latency_ms,
+            adapter_name=self.adapter_name,
+            model_used=model,
+            tokens_input=tokens_input,
+            tokens_output=tokens_output,
+            metadata={
+                "resource_name": resource.name,
+                "resource_group": resource.resource_group,
+                "endpoint": resource.endpoint,
+                "effective_cost_saved": self._calculate_effective_cost(
+                    model, tokens_input, tokens_output
+                )
+            }
+        )
 
-        except APIError as e:
-            latency_ms = int((time.time() - start_time) * 1000)
-            self._resource_failure_count[resource.name] += 1
+    def _resource_error(
+        self,
+        resource: AzureResource,
+        model: str,
+        error: Exception,
+        start_time: float
+    ) -> LLMResponse:
+        """Record a failed chat completion and build its error response"""
+        latency_ms = int((time.perf_counter() - start_time) * 1000)
+        with self._health_lock:
+            self._health[resource.name].failure += 1
+            self._resource_breaker[resource.name].on_failure()
 
+        if isinstance(error, RateLimitError):
             return self._create_error_response(
-                f"API error on {resource.name}: {str(e)}",
+                f"Rate limit on {resource.name}: {str(error)}",
+                status="rate_limited",
                 latency_ms=latency_ms,
                 model=model
             )
 
-        except Exception as e:
-            latency_ms = int((time.time() - start_time) * 1000)
-            self._resource_failure_count[resource.name] += 1
+        if isinstance(error, APIError):
+            message = f"API error on {resource.name}: {str(error)}"
+        else:
+            message = f"Unexpected error on {resource.name}: {str(error)}"
 
-            return self._create_error_response(
-                f"Unexpected error on {resource.name}: {str(e)}",
-                latency_ms=latency_ms,
-                model=model
-            )
+        return self._create_error_response(message, latency_ms=latency_ms, model=model)
 
     def execute(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> LLMResponse:
         """
@@ -327,6 +655,8 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
                 - temperature: Temperature 0.0-1.0 (default: 0.7)
                 - max_tokens: Max output tokens (default: 1000)
                 - system: System message (optional)
+                - allow_model_substitution: Fail over to another resource's
+                  model when no resource serves ``model`` (default: False)
 
         Returns:
             LLMResponse with status, content, cost, latency, etc.
@@ -351,15 +681,14 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
         # Extract parameters from context
         context = context or {}
         model = context.get("model", self.preferred_model)
-        system_prompt = context.get("system", "You are a helpful assistant.")
-
-        # Build messages
-        messages = [{"role": "system", "content": system_prompt}]
-        messages.append({"role": "user", "content": prompt})
+        if self._rejects_model(model, context):
+            return self._create_error_response(f"No resource supports model {model}", model=model)
+        messages = self._build_messages(prompt, context)
 
         # Try primary resource first
         primary_resource = self._get_resource_for_model(model)
-        failed_resources = []
+        failed_resources: Set[str] = set()
+        last_error_status = None
 
         if primary_resource:
             result = self._execute_with_resource(
@@ -370,7 +699,8 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
                 self._record_success(result.latency_ms, result.cost_usd)
                 return result
             else:
-                failed_resources.append(primary_resource.name)
+                failed_resources.add(primary_resource.name)
+                last_error_status = result.status
 
         # Try failover resources
         max_attempts = 3
@@ -382,6 +712,11 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
             if not fallback_resource:
                 break  # No more resources to try
 
+            # Throttling is often region-wide: pace the retry instead of
+            # burning through every resource in milliseconds
+            if last_error_status == "rate_limited":
+                time.sleep(_rate_limit_backoff(attempt))
+
             # Use first available model on fallback resource
             fallback_model = fallback_resource.models[0]
 
@@ -393,7 +728,8 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
                 self._record_success(result.latency_ms, result.cost_usd)
                 return result
             else:
-                failed_resources.append(fallback_resource.name)
+                failed_resources.add(fallback_resource.name)
+                last_error_status = result.status
 
             attempt += 1
 
@@ -407,10 +743,117 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
     async def execute_async(
         self, prompt: str, context: Optional[Dict[str, Any]] = None
     ) -> LLMResponse:
-        """Async execution - currently wraps sync implementation"""
-        # For true async, would use AsyncAzureOpenAI client
-        # For now, provide sync wrapper for compatibility
-        return self.execute(prompt, context)
+        """
+        Execute prompt asynchronously with the same failover as execute().
+
+        Requests go through AsyncAzureOpenAI clients, so awaiting many prompts
+        overlaps their network round-trips instead of blocking the event loop.
+
+        With hedging enabled (``hedge_delay`` on the adapter, or
+        ``context["hedge_delay"]``), a resource that has not answered after
+        ``hedge_delay`` seconds gets the next resource started alongside it;
+        the first success wins and the other request is cancelled.
+
+        Args:
+            prompt: The prompt/instruction to send
+            context: Same parameters as execute(), plus optional hedge_delay
+
+        Returns:
+            LLMResponse with status, content, cost, latency, etc.
+        """
+        # Check circuit breaker
+        if self._check_circuit_breaker():
+            return self._create_error_response(
+                "Circuit breaker open (too many failures)"
+            )
+
+        if not self.enabled:
+            return self._create_error_response("Adapter is disabled")
+
+        context = context or {}
+        model = context.get("model", self.preferred_model)
+        if self._rejects_model(model, context):
+            return self._create_error_response(f"No resource supports model {model}", model=model)
+        messages = self._build_messages(prompt, context)
+        hedge_delay = context.get("hedge_delay", self.hedge_delay)
+
+        # Resources started so far (failed or in flight)
+        tried_resources: Set[str] = set()
+        in_flight: Dict[asyncio.Future, AzureResource] = {}
+        fallbacks_left = 2  # Same attempt budget as execute()
+
+        def start(resource: AzureResource, resource_model: str) -> None:
+            task = asyncio.ensure_future(self._execute_with_resource_async(
+                resource, resource_model, messages, **context
+            ))
+            in_flight[task] = resource
+            tried_resources.add(resource.name)
+
+        def start_fallback() -> bool:
+            nonlocal fallbacks_left
+            if fallbacks_left <= 0:
+                return False
+            fallback_resource = self._select_fallback_resource(tried_resources)
+            if not fallback_resource:
+                return False  # No more resources to try
+            fallbacks_left -= 1
+            # Use first available model on fallback resource
+            start(fallback_resource, fallback_resource.models[0])
+            return True
+
+        primary_resource = self._get_resource_for_model(model)
+        if primary_resource:
+            start(primary_resource, model)
+        else:
+            start_fallback()
+
+        can_hedge = hedge_delay is not None
+        try:
+            while in_flight:
+                timeout = hedge_delay if can_hedge and len(in_flight) == 1 else None
+                done, _ = await asyncio.wait(
+                    in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Hedge: the resource is slow, race the next one against it
+                    can_hedge = start_fallback()
+                    continue
+
+                for task in done:
+                    del in_flight[task]
+                    result = task.result()
+                    if result.status == "success":
+                        self._record_success(result.latency_ms, result.cost_usd)
+                        return result
+
+                if not in_flight:
+                    if result.status == "rate_limited" and fallbacks_left > 0:
+                        await asyncio.sleep(_rate_limit_backoff(3 - fallbacks_left))
+                    start_fallback()
+        finally:
+            # Cancel the losing hedged request, if any
+            for task in in_flight:
+                task.cancel()
+
+        # All resources failed
+        self._record_failure()
+
+        return self._create_error_response(
+            f"All Azure OpenAI resources failed after {len(tried_resources)} attempts"
+        )
+
+    def _build_messages(self, prompt: str, context: Dict[str, Any]) -> Tuple[Dict[str, str], ...]:
+        """
+        Build the chat messages for a prompt.
+
+        Built once per request and shared by every failover attempt; a tuple
+        so no attempt can mutate what the next one sends.
+        """
+        system_prompt = context.get("system", "You are a helpful assistant.")
+        return (
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        )
 
     def estimate_cost(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> float:
         """
@@ -433,25 +876,12 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
         self, model: str, tokens_input: int, tokens_output: int
     ) -> float:
         """Calculate effective cost saved by using cloud credits (uses ChatGPT baseline)"""
-        # Pricing per 1M tokens (ChatGPT baseline for comparison)
-        pricing = {
-            "o3-mini": {"input": 1.10, "output": 4.40},
-            "gpt-4o": {"input": 2.50, "output": 10.00},
-            "gpt-4.1": {"input": 2.50, "output": 10.00},
-            "gpt-4-turbo": {"input": 10.00, "output": 30.00},
-            "gpt-4o-mini-transcribe": {"input": 0.15, "output": 0.60},
-        }
-
-        model_pricing = pricing.get(model, {"input": 2.50, "output": 10.00})
-
-        cost_input = (tokens_input / 1_000_000) * model_pricing["input"]
-        cost_output = (tokens_output / 1_000_000) * model_pricing["output"]
-
-        return cost_input + cost_output
+        input_price, output_price = _MODEL_PRICING.get(model, _DEFAULT_PRICING)
+        return (tokens_input * input_price + tokens_output * output_price) / 1_000_000
 
     def check_availability(self) -> bool:
         """Check if adapter's service is available and healthy"""
-        # Verify Azure CLI authentication
+        # Verify Azure authentication
         if not self._verify_azure_auth():
             return False
 
@@ -459,8 +889,8 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
         if self._check_circuit_breaker():
             return False
 
-        # Verify at least one client is initialized
-        if not self.clients:
+        # Clients are built on first use; that needs a token provider and a resource
+        if self.token_provider is None or not self.resources:
             return False
 
         return True
@@ -468,24 +898,28 @@ class AzureOpenAIAdapter(BaseLLMAdapter):
     def get_metadata(self) -> Dict[str, Any]:
         """Return adapter configuration and current status"""
         # Calculate per-resource success rates
+        healths = self._health
+        breakers = self._resource_breaker
+
         resource_health = {}
         for resource in self.resources:
-            success = self._resource_success_count.get(resource.name, 0)
-            failure = self._resource_failure_count.get(resource.name, 0)
+            name = resource.name
+            health = healths[name]
+            success = health.success
+            failure = health.failure
             total = success + failure
 
             success_rate = (success / total * 100) if total > 0 else 100.0
-            last_used = self._resource_last_used.get(resource.name, 0.0)
+            last_used = health.last_used
 
-            resource_health[resource.name] = {
+            resource_health[name] = {
                 "success_count": success,
                 "failure_count": failure,
                 "success_rate": round(success_rate, 1),
-                "last_used": time.strftime(
-                    "%Y-%m-%d %H:%M:%S", time.localtime(last_used)
-                ) if last_used > 0 else "Never",
-                "models": resource.models,
-                "priority": resource.priority
+                "last_used": _format_timestamp(int(last_used)) if last_used > 0 else "Never",
+                "models": list(resource.models),
+                "priority": resource.priority,
+                "breaker_state": breakers[name].state
             }
 
         return {
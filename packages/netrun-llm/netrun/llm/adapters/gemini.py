@@ -9,18 +9,23 @@ Features:
     - Multiple model support (Pro, Flash, Experimental)
     - Circuit breaker protection
     - Cost estimation and tracking
-    - Automatic quota management
+    - Automatic quota management (in-memory, flushed to disk periodically)
 
 Author: Netrun Systems
 Version: 2.0.0
 License: MIT
 """
 
+import atexit
+import functools
 import os
+import stat
 import time
 import json
-from typing import Dict, Any, Optional
-from datetime import datetime
+import tempfile
+import threading
+import weakref
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
 try:
@@ -33,6 +38,35 @@ except ImportError:
     genai = None
     GenerationConfig = None
 
+    # Stand-ins so the error table below stays valid without the SDK
+    class google_exceptions:
+        class GoogleAPICallError(Exception):
+            pass
+
+        class ResourceExhausted(GoogleAPICallError):
+            pass
+
+        class InvalidArgument(GoogleAPICallError):
+            pass
+
+        class Unauthenticated(GoogleAPICallError):
+            pass
+
+# Optional orjson for the quota file; falls back to the json module.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except fits both.
+try:
+    import orjson
+
+    _loads_json = orjson.loads
+
+    def _dumps_json(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads_json = json.loads
+
+    def _dumps_json(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 from .base import BaseLLMAdapter, AdapterTier, LLMResponse
 
 
@@ -46,6 +80,12 @@ PRICING = {
 # Default model if not specified
 DEFAULT_MODEL = "gemini-1.5-flash"
 
+# PRICING as (input, output) USD per token, so cost is one multiply-add
+PRICING_PER_TOKEN: Dict[str, Tuple[float, float]] = {
+    model: (prices["input"] / 1_000_000, prices["output"] / 1_000_000)
+    for model, prices in PRICING.items()
+}
+
 # Default max tokens for responses
 DEFAULT_MAX_TOKENS = 2048
 
@@ -53,6 +93,77 @@ DEFAULT_MAX_TOKENS = 2048
 FREE_TIER_DAILY_LIMIT = 1500  # requests per day
 FREE_TIER_QUOTA_FILE = ".gemini_quota.json"
 
+# Seconds between quota file writes; counts are kept in memory in between
+QUOTA_FLUSH_INTERVAL = 5.0
+
+# Process umask, for a new quota file's mode (mkstemp always creates 0600)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Adapters with quota state to flush at interpreter exit. An adapter with
+# unsaved counts stays alive (its flush timer holds it) until they are written.
+_LIVE_ADAPTERS = weakref.WeakSet()
+
+
+# (local date string, epoch time of the next local midnight)
+_date_cache = ("", 0.0)
+
+
+def _today() -> str:
+    """Local date as YYYY-MM-DD, formatted once per day"""
+    global _date_cache
+    date_str, expires = _date_cache
+    now = time.time()
+    if now >= expires:
+        local = time.localtime(now)
+        date_str = time.strftime("%Y-%m-%d", local)
+        # mktime normalizes day overflow and DST (isdst=-1)
+        expires = time.mktime(
+            (local.tm_year, local.tm_mon, local.tm_mday + 1, 0, 0, 0, 0, 0, -1)
+        )
+        _date_cache = (date_str, expires)
+    return date_str
+
+
+@functools.lru_cache(maxsize=32)
+def _make_generation_config(
+    temperature: float, top_p: float, top_k: int, max_output_tokens: int
+) -> Any:
+    """GenerationConfig for a parameter set; callers reuse a handful of them"""
+    return GenerationConfig(
+        temperature=temperature,
+        top_p=top_p,
+        top_k=top_k,
+        max_output_tokens=max_output_tokens
+    )
+
+
+# (exception type, response status, message prefix); first match wins,
+# anything else is an "Unexpected error"
+_ERROR_TABLE = (
+    (google_exceptions.ResourceExhausted, "rate_limited", "Rate limit or quota exceeded: "),
+    (google_exceptions.InvalidArgument, "error", "Invalid request: "),
+    (google_exceptions.Unauthenticated, "error", "Authentication error: "),
+)
+
+
+def _fast_exc_str(error: Exception) -> str:
+    """Exception message without the SDK's full __str__ (status, details, etc.)"""
+    message = getattr(error, "message", None)
+    if message and isinstance(message, str):
+        return message
+    if not error.args:
+        return repr(error)
+    message = error.args[0]
+    # errno-style args (e.g. OSError(104, "reset")) need the full __str__
+    return message if isinstance(message, str) else str(error)
+
+
+@atexit.register
+def _flush_all_quotas() -> None:
+    for adapter in list(_LIVE_ADAPTERS):
+        adapter._flush_quota()
+
 
 class GeminiAdapter(BaseLLMAdapter):
     """
@@ -72,6 +183,7 @@ class GeminiAdapter(BaseLLMAdapter):
         GEMINI_TIMEOUT: Request timeout in seconds (default: 30)
         GEMINI_QUOTA_FILE: Quota tracking file path (default: .gemini_quota.json)
         GEMINI_USE_FREE_TIER: Enable quota tracking (default: true)
+        GEMINI_MULTI_PROCESS: Share the quota file across processes (default: false)
 
     Example:
         >>> adapter = GeminiAdapter(use_free_tier=True)
@@ -86,7 +198,8 @@ class GeminiAdapter(BaseLLMAdapter):
         use_free_tier: bool = True,
         model: str = None,
         timeout: int = None,
-        quota_file_path: str = None
+        quota_file_path: str = None,
+        multi_process: Optional[bool] = None
     ):
         """
         Initialize Gemini adapter.
@@ -97,6 +210,9 @@ class GeminiAdapter(BaseLLMAdapter):
             model: Default model to use (default: gemini-1.5-flash)
             timeout: Request timeout in seconds (default: 30)
             quota_file_path: Custom path for quota tracking file
+            multi_process: Re-read the quota file on every check and write it on
+                every increment, so processes sharing it see each other's counts
+                (default: GEMINI_MULTI_PROCESS env, else False = in-memory quota)
 
         Raises:
             ImportError: If google-generativeai SDK not installed
@@ -127,8 +243,31 @@ class GeminiAdapter(BaseLLMAdapter):
         else:
             self.quota_file = Path(os.getenv("GEMINI_QUOTA_FILE", FREE_TIER_QUOTA_FILE))
 
-        # Load or initialize quota data
+        if multi_process is None:
+            multi_process = os.getenv("GEMINI_MULTI_PROCESS", "false").lower() in ("1", "true", "yes")
+        self._multi_process = multi_process
+
+        # Load quota data once; it lives in memory and is flushed periodically
+        # (or read/written through on every request in multi-process mode)
         self.quota_data = self._load_quota_data()
+        self._quota_dirty = False
+        self._last_flush = time.monotonic()
+        self._flush_interval = QUOTA_FLUSH_INTERVAL
+        self._flush_lock = threading.Lock()
+        # Pending flush of unsaved counts, so quiet adapters still write them
+        self._flush_timer: Optional[threading.Timer] = None
+        _LIVE_ADAPTERS.add(self)
+
+        # GenerativeModel per model name, built on first use (bounded by model count)
+        self._model_cache: Dict[str, Any] = {}
+
+        # Fixed part of get_metadata(), built once (immutable values only,
+        # since every call shares them)
+        self._static_metadata: Dict[str, Any] = {
+            "name": self.adapter_name,
+            "tier": self.tier.name,
+            "reliability_score": self.reliability_score,
+        }
 
         # Configure Gemini API
         if self.api_key:
@@ -138,55 +277,120 @@ class GeminiAdapter(BaseLLMAdapter):
 
     def _load_quota_data(self) -> Dict[str, Any]:
         """Load quota tracking data from file"""
-        if not self.quota_file.exists():
-            return {
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "requests_today": 0,
-            }
-
         try:
-            with open(self.quota_file, "r") as f:
-                data = json.load(f)
-
-            # Reset counter if new day
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            if data.get("date") != current_date:
-                data["date"] = current_date
-                data["requests_today"] = 0
-
-            return data
+            with open(self.quota_file, "rb") as f:
+                data = _loads_json(f.read())
         except (json.JSONDecodeError, IOError):
-            # Corrupted file - reset
+            # Missing (FileNotFoundError) or corrupted file - start fresh
             return {
-                "date": datetime.now().strftime("%Y-%m-%d"),
+                "date": _today(),
                 "requests_today": 0,
             }
 
+        # Reset counter if new day
+        current_date = _today()
+        if data.get("date") != current_date:
+            data["date"] = current_date
+            data["requests_today"] = 0
+
+        return data
+
     def _save_quota_data(self) -> None:
-        """Save quota tracking data to file"""
+        """Save quota tracking data to file (atomically, via a temp file)"""
+        tmp_file = None
         try:
-            with open(self.quota_file, "w") as f:
-                json.dump(self.quota_data, f, indent=2)
+            # Unique per writer, so concurrent processes never share a temp file
+            fd, tmp_file = tempfile.mkstemp(
+                dir=self.quota_file.parent, prefix=self.quota_file.name + ".", suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps_json(self.quota_data))
+            # Keep the existing file's mode, or the one open() would give it
+            try:
+                mode = stat.S_IMODE(os.stat(self.quota_file).st_mode)
+            except OSError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(tmp_file, mode)
+            # Readers see either the old file or the new one, never a partial write
+            os.replace(tmp_file, self.quota_file)
         except IOError:
-            pass  # Quota tracking is optional, don't fail on save errors
+            # Quota tracking is optional, don't fail on save errors
+            if tmp_file is not None:
+                try:
+                    os.unlink(tmp_file)
+                except OSError:
+                    pass
+
+    def _flush_quota(self) -> None:
+        """Write quota data to file if it changed since the last write"""
+        with self._flush_lock:
+            timer, self._flush_timer = self._flush_timer, None
+            if timer is not None:
+                timer.cancel()
+            if self._quota_dirty:
+                self._quota_dirty = False
+                self._last_flush = time.monotonic()
+                self._save_quota_data()
+
+    def _mark_quota_dirty(self) -> None:
+        """Flag unsaved quota changes and schedule their flush"""
+        self._quota_dirty = True
+        if self._flush_timer is None:
+            with self._flush_lock:
+                if self._flush_timer is None:
+                    delay = max(0.0, self._last_flush + self._flush_interval - time.monotonic())
+                    # The timer holds the adapter, so its counts outlive a del
+                    timer = threading.Timer(delay, self._flush_quota)
+                    timer.daemon = True
+                    self._flush_timer = timer
+                    timer.start()
+
+    def _roll_quota_date(self) -> None:
+        """Reset the in-memory counter when the day changes"""
+        current_date = _today()
+        if self.quota_data["date"] != current_date:
+            self.quota_data["date"] = current_date
+            self.quota_data["requests_today"] = 0
+            self._mark_quota_dirty()
+
+    def _refresh_quota(self) -> None:
+        """Bring quota data up to date (from disk only when shared across processes)"""
+        if self._multi_process:
+            self.quota_data = self._load_quota_data()
+        else:
+            self._roll_quota_date()
 
-    def _check_quota(self) -> bool:
-        """Check if quota allows request"""
+    def _check_quota(self, reload: bool = True) -> bool:
+        """Check if quota allows request (reload=False skips any disk read)"""
         if not self.use_free_tier:
             return True  # No quota limits on paid tier
 
-        # Reload quota data (in case multiple processes)
-        self.quota_data = self._load_quota_data()
+        if reload:
+            self._refresh_quota()
+        else:
+            self._roll_quota_date()
 
         return self.quota_data["requests_today"] < FREE_TIER_DAILY_LIMIT
 
     def _increment_quota(self) -> None:
-        """Increment quota counter and save"""
+        """Increment quota counter; the file is written at most every flush interval"""
         if not self.use_free_tier:
             return
 
         self.quota_data["requests_today"] += 1
-        self._save_quota_data()
+        if self._multi_process or time.monotonic() - self._last_flush > self._flush_interval:
+            self._quota_dirty = True
+            self._flush_quota()
+        else:
+            # Written by the flush timer, or sooner by a later increment
+            self._mark_quota_dirty()
+
+    def _get_model(self, model: str) -> Any:
+        """Return the cached GenerativeModel for a model name"""
+        gemini_model = self._model_cache.get(model)
+        if gemini_model is None:
+            gemini_model = self._model_cache[model] = genai.GenerativeModel(model_name=model)
+        return gemini_model
 
     def execute(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> LLMResponse:
         """
@@ -212,6 +416,32 @@ class GeminiAdapter(BaseLLMAdapter):
             ... )
             >>> print(response.content)
         """
+        rejected = self._reject_request()
+        if rejected is not None:
+            return rejected
+
+        context = context or {}
+        model = context.get("model", self.default_model)
+
+        # Start timing
+        start_ns = time.perf_counter_ns()
+
+        try:
+            gemini_model, generation_config = self._prepare_request(model, context)
+
+            # Make API request
+            response = gemini_model.generate_content(
+                prompt,
+                generation_config=generation_config,
+                request_options={"timeout": self.timeout}
+            )
+            return self._success_response(response, model, start_ns)
+
+        except Exception as e:
+            return self._error_response(e, start_ns, model)
+
+    def _reject_request(self) -> Optional[LLMResponse]:
+        """Error response if the circuit breaker or quota forbids a request, else None"""
         # Check circuit breaker before attempting request
         if self._check_circuit_breaker():
             return self._create_error_response(
@@ -232,124 +462,116 @@ class GeminiAdapter(BaseLLMAdapter):
                 }
             )
 
-        # Extract context parameters
-        context = context or {}
-        model = context.get("model", self.default_model)
+        return None
+
+    def _prepare_request(self, model: str, context: Dict[str, Any]) -> tuple:
+        """Return (GenerativeModel, GenerationConfig) for a request's context"""
         max_tokens = context.get("max_tokens", self.max_tokens)
         temperature = context.get("temperature", 1.0)
         top_p = context.get("top_p", 0.95)
         top_k = context.get("top_k", 40)
 
-        # Start timing
-        start_time = time.time()
-
-        try:
-            # Create model instance
-            gemini_model = genai.GenerativeModel(model_name=model)
-
-            # Configure generation parameters
-            generation_config = GenerationConfig(
-                temperature=temperature,
-                top_p=top_p,
-                top_k=top_k,
-                max_output_tokens=max_tokens
-            )
-
-            # Make API request
-            response = gemini_model.generate_content(
-                prompt,
-                generation_config=generation_config,
-                request_options={"timeout": self.timeout}
-            )
-
-            # Calculate latency
-            latency_ms = int((time.time() - start_time) * 1000)
-
-            # Extract response text
-            result_text = response.text
-
-            # Get token usage (if available)
-            tokens_input = 0
-            tokens_output = 0
-
-            if hasattr(response, "usage_metadata"):
-                tokens_input = response.usage_metadata.prompt_token_count or 0
-                tokens_output = response.usage_metadata.candidates_token_count or 0
-
-            # Calculate actual cost
-            cost_usd = self._calculate_actual_cost(model, tokens_input, tokens_output)
-
-            # Increment quota counter
-            self._increment_quota()
-
-            # Record success
-            self._record_success(latency_ms, cost_usd)
+        # Configure generation parameters (shared across identical requests)
+        generation_config = _make_generation_config(
+            temperature, top_p, top_k, max_tokens
+        )
+        return self._get_model(model), generation_config
+
+    def _success_response(self, response: Any, model: str, start_ns: int) -> LLMResponse:
+        """Record a completed request and build its LLMResponse"""
+        # Calculate latency
+        latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+        # Extract response text
+        result_text = response.text
+
+        # Get token usage (if available)
+        tokens_input = 0
+        tokens_output = 0
+
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            tokens_input = usage.prompt_token_count or 0
+            tokens_output = usage.candidates_token_count or 0
+
+        # Calculate actual cost
+        cost_usd = self._calculate_actual_cost(model, tokens_input, tokens_output)
+
+        # Increment quota counter
+        self._increment_quota()
+
+        # Record success
+        self._record_success(latency_ms, cost_usd)
+
+        candidates = response.candidates
+        return LLMResponse(
+            status="success",
+            content=result_text,
+            cost_usd=cost_usd,
+            latency_ms=latency_ms,
+            adapter_name=self.adapter_name,
+            model_used=model,
+            tokens_input=tokens_input,
+            tokens_output=tokens_output,
+            metadata={
+                "use_free_tier": self.use_free_tier,
+                "requests_today": self.quota_data["requests_today"],
+                "quota_remaining": FREE_TIER_DAILY_LIMIT - self.quota_data["requests_today"]
+                    if self.use_free_tier else "unlimited",
+                "finish_reason": candidates[0].finish_reason.name
+                    if candidates else "unknown"
+            }
+        )
 
-            return LLMResponse(
-                status="success",
-                content=result_text,
-                cost_usd=cost_usd,
-                latency_ms=latency_ms,
-                adapter_name=self.adapter_name,
-                model_used=model,
-                tokens_input=tokens_input,
-                tokens_output=tokens_output,
-                metadata={
-                    "use_free_tier": self.use_free_tier,
-                    "requests_today": self.quota_data["requests_today"],
-                    "quota_remaining": FREE_TIER_DAILY_LIMIT - self.quota_data["requests_today"]
-                        if self.use_free_tier else "unlimited",
-                    "finish_reason": response.candidates[0].finish_reason.name
-                        if response.candidates else "unknown"
-                }
-            )
+    def _error_response(self, error: Exception, start_ns: int, model: str) -> LLMResponse:
+        """Record a failed request and build its error response from _ERROR_TABLE"""
+        self._record_failure()
+        latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+        status, prefix = "error", "Unexpected error: "
+        for error_type, error_status, error_prefix in _ERROR_TABLE:
+            if isinstance(error, error_type):
+                status, prefix = error_status, error_prefix
+                break
+
+        return self._create_error_response(
+            f"{prefix}{_fast_exc_str(error)}",
+            status=status,
+            latency_ms=latency_ms,
+            model=model
+        )
 
-        except google_exceptions.ResourceExhausted as e:
-            self._record_failure()
-            latency_ms = int((time.time() - start_time) * 1000)
+    async def execute_async(
+        self, prompt: str, context: Optional[Dict[str, Any]] = None
+    ) -> LLMResponse:
+        """
+        Execute prompt using Gemini API (asynchronous).
 
-            return self._create_error_response(
-                f"Rate limit or quota exceeded: {str(e)}",
-                status="rate_limited",
-                latency_ms=latency_ms,
-                model=model
-            )
+        Uses the SDK's native generate_content_async, so concurrent requests
+        overlap instead of blocking the event loop. Same context and
+        response as execute().
+        """
+        rejected = self._reject_request()
+        if rejected is not None:
+            return rejected
 
-        except google_exceptions.InvalidArgument as e:
-            self._record_failure()
-            latency_ms = int((time.time() - start_time) * 1000)
+        context = context or {}
+        model = context.get("model", self.default_model)
 
-            return self._create_error_response(
-                f"Invalid request: {str(e)}",
-                latency_ms=latency_ms,
-                model=model
-            )
+        start_ns = time.perf_counter_ns()
 
-        except google_exceptions.Unauthenticated as e:
-            self._record_failure()
-            latency_ms = int((time.time() - start_time) * 1000)
+        try:
+            gemini_model, generation_config = self._prepare_request(model, context)
 
-            return self._create_error_response(
-                f"Authentication error: {str(e)}",
-                latency_ms=latency_ms,
-                model=model
+            response = await gemini_model.generate_content_async(
+                prompt,
+                generation_config=generation_config,
+                request_options={"timeout": self.timeout}
             )
+            return self._success_response(response, model, start_ns)
 
         except Exception as e:
-            self._record_failure()
-            latency_ms = int((time.time() - start_time) * 1000)
-
-            return self._create_error_response(
-                f"Unexpected error: {str(e)}",
-                latency_ms=latency_ms,
-                model=model
-            )
-
-    async def execute_async(
-        self, prompt: str, context: Optional[Dict[str, Any]] = None
-    ) -> LLMResponse:
-        """Async execution - currently wraps sync implementation"""
-        return self.execute(prompt, context)
+            return self._error_response(e, start_ns, model)
 
     def estimate_cost(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> float:
         """
@@ -381,8 +603,8 @@ class GeminiAdapter(BaseLLMAdapter):
         if not self.is_healthy():
             return False
 
-        # Check quota availability
-        if self.use_free_tier and not self._check_quota():
+        # Check quota availability (in-memory; probes shouldn't touch disk)
+        if self.use_free_tier and not self._check_quota(reload=False):
             return False
 
         return True
@@ -390,9 +612,8 @@ class GeminiAdapter(BaseLLMAdapter):
     def get_metadata(self) -> Dict[str, Any]:
         """Return adapter configuration and current status"""
         metadata = {
-            "name": self.adapter_name,
-            "tier": self.tier.name,
-            "reliability_score": self.reliability_score,
+            **self._static_metadata,
+            "supported_models": list(PRICING),
             "enabled": self.enabled,
             "default_model": self.default_model,
             "max_tokens": self.max_tokens,
@@ -404,7 +625,6 @@ class GeminiAdapter(BaseLLMAdapter):
             "avg_latency_ms": self.get_average_latency(),
             "total_cost_usd": self._total_cost_usd,
             "circuit_breaker_open": self._circuit_breaker_open,
-            "supported_models": list(PRICING.keys())
         }
 
         # Add quota information if using free tier
@@ -428,23 +648,17 @@ class GeminiAdapter(BaseLLMAdapter):
         if self.use_free_tier:
             return 0.0  # Free tier = no cost
 
-        if model not in PRICING:
-            # Unknown model - use gemini-1.5-flash pricing as default
-            model = DEFAULT_MODEL
+        # Unknown model - use gemini-1.5-flash pricing as default
+        input_rate, output_rate = PRICING_PER_TOKEN.get(model) or PRICING_PER_TOKEN[DEFAULT_MODEL]
 
-        pricing = PRICING[model]
-
-        # Calculate cost: (tokens / 1,000,000) * price_per_million
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
-        output_cost = (output_tokens / 1_000_000) * pricing["output"]
-
-        return input_cost + output_cost
+        return input_tokens * input_rate + output_tokens * output_rate
 
     def reset_quota(self) -> None:
         """Reset daily quota counter (for testing or manual reset)"""
-        self.quota_data["date"] = datetime.now().strftime("%Y-%m-%d")
+        self.quota_data["date"] = _today()
         self.quota_data["requests_today"] = 0
-        self._save_quota_data()
+        self._quota_dirty = True
+        self._flush_quota()
 
     def get_quota_status(self) -> Dict[str, Any]:
         """Get current quota status"""
@@ -455,8 +669,7 @@ class GeminiAdapter(BaseLLMAdapter):
                 "requests_today": self._success_count
             }
 
-        # Reload quota data to get latest
-        self.quota_data = self._load_quota_data()
+        self._refresh_quota()
 
         return {
             "tier": "free",
@@ -20,7 +20,7 @@ Example:
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Type
+from typing import Iterable, List, Optional, Dict, Any, Tuple, Type
 from dataclasses import dataclass, field
 
 from netrun.llm.adapters.base import BaseLLMAdapter, LLMResponse
@@ -127,11 +127,18 @@ class LLMFallbackChain:
 
         Args:
             adapters: Ordered list of adapters (first = primary, last = fallback)
-                     If None, creates default chain: Claude -> OpenAI -> Ollama
+                     If None, creates default chain: Claude -> OpenAI -> Ollama.
+                     None entries (optional adapters that failed to import)
+                     are skipped.
             stop_on_success: Stop trying adapters after first success (default: True)
             log_fallbacks: Log when fallback is triggered (default: True)
         """
-        self.adapters: List[BaseLLMAdapter] = adapters or self._create_default_chain()
+        # Stored as a tuple: iterated on every request, replaced on add/remove
+        self.adapters: Tuple[BaseLLMAdapter, ...] = tuple(
+            adapter
+            for adapter in (adapters or self._create_default_chain())
+            if adapter is not None
+        )
         self.stop_on_success = stop_on_success
         self.log_fallbacks = log_fallbacks
 
@@ -147,6 +154,42 @@ class LLMFallbackChain:
             f"{[a.adapter_name for a in self.adapters]}"
         )
 
+    @classmethod
+    def from_available(
+        cls,
+        adapter_specs: Iterable[Tuple[Optional[Type[BaseLLMAdapter]], Dict[str, Any]]],
+        **kwargs,
+    ) -> "LLMFallbackChain":
+        """
+        Build a chain from (adapter class, constructor kwargs) pairs.
+
+        Pairs whose class is None (an optional adapter whose extra is not
+        installed) are skipped, so optional adapters can be listed
+        unconditionally. Order is kept: the first available adapter is
+        the primary.
+
+        Example:
+            >>> from netrun.llm.adapters import ClaudeAdapter, GeminiAdapter, OllamaAdapter
+            >>> chain = LLMFallbackChain.from_available([
+            ...     (GeminiAdapter, {}),
+            ...     (ClaudeAdapter, {}),
+            ...     (OllamaAdapter, {"model": "llama3"}),
+            ... ])
+
+        Args:
+            adapter_specs: Ordered (adapter class or None, kwargs) pairs
+            **kwargs: Passed to the LLMFallbackChain constructor
+
+        Returns:
+            LLMFallbackChain over the available adapters
+        """
+        adapters = [
+            adapter_cls(**adapter_kwargs)
+            for adapter_cls, adapter_kwargs in adapter_specs
+            if adapter_cls is not None
+        ]
+        return cls(adapters=adapters, **kwargs)
+
     def _create_default_chain(self) -> List[BaseLLMAdapter]:
         """Create default fallback chain: Claude -> OpenAI -> Ollama."""
         from netrun.llm.adapters.claude import ClaudeAdapter
@@ -350,10 +393,12 @@ class LLMFallbackChain:
             adapter: Adapter to add
             position: Position in chain (None = append to end)
         """
+        adapters = list(self.adapters)
         if position is None:
-            self.adapters.append(adapter)
+            adapters.append(adapter)
         else:
-            self.adapters.insert(position, adapter)
+            adapters.insert(position, adapter)
+        self.adapters = tuple(adapters)
 
         self.metrics.adapter_usage[adapter.adapter_name] = 0
         logger.info(f"Added adapter {adapter.adapter_name} to chain")
@@ -370,7 +415,7 @@ class LLMFallbackChain:
         """
         for i, adapter in enumerate(self.adapters):
             if adapter.adapter_name == adapter_name:
-                self.adapters.pop(i)
+                self.adapters = self.adapters[:i] + self.adapters[i + 1:]
                 logger.info(f"Removed adapter {adapter_name} from chain")
                 return True
 
@@ -46,19 +46,56 @@ Author: Netrun Systems
 License: MIT
 """
 
+import asyncio
+import functools
+import inspect
+import logging
+import struct
+import sys
 import time
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Literal, Tuple
-from enum import Enum
-from pydantic import BaseModel, Field, field_validator
+import zlib
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Awaitable, Callable, Deque, Dict, Iterator, List, Optional, Literal, Tuple, Union
+from enum import IntEnum
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
 from netrun.llm.exceptions import LLMError
 
 
-class CostTier(str, Enum):
+logger = logging.getLogger(__name__)
+
+# Optional numpy for UsageLog.rollup_since(); falls back to a Python loop
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Optional orjson for get_usage_report_json(); falls back to the json module
+try:
+    from orjson import dumps as _dumps_json
+except ImportError:
+    import json
+
+    def _dumps_json(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Receives flushed usage batches; may be sync or async (e.g. one bulk INSERT)
+UsageSink = Callable[[List["UsageRecord"]], Union[Awaitable[None], None]]
+
+
+class CostTier(IntEnum):
     """
     Cost tiers for model classification.
 
+    Tiers are ordered ints (FREE lowest, PREMIUM highest), so limits are
+    checked with plain comparisons. ``CostTier("low")`` and string values in
+    policy configs are still accepted by name, and ``ProviderPolicy``
+    serializes tiers by name. ``CostTier.X.value`` is the int rank.
+
     Attributes:
         FREE: Local models (Ollama) - no API costs
         LOW: Budget models (GPT-4o-mini, Claude Haiku) - $0.0001-0.001/1K tokens
@@ -66,11 +103,18 @@ class CostTier(str, Enum):
         HIGH: Premium models (GPT-4, Claude Opus) - $0.01-0.1/1K tokens
         PREMIUM: Specialized models (O1, reasoning models) - $0.1+/1K tokens
     """
-    FREE = "free"           # Local models (Ollama)
-    LOW = "low"             # GPT-4o-mini, Claude Haiku
-    MEDIUM = "medium"       # GPT-4o, Claude Sonnet
-    HIGH = "high"           # GPT-4, Claude Opus
-    PREMIUM = "premium"     # O1, specialized models
+    FREE = 0        # Local models (Ollama)
+    LOW = 1         # GPT-4o-mini, Claude Haiku
+    MEDIUM = 2      # GPT-4o, Claude Sonnet
+    HIGH = 3        # GPT-4, Claude Opus
+    PREMIUM = 4     # O1, specialized models
+
+    @classmethod
+    def _missing_(cls, value):
+        # Accept tier names ("low", "MEDIUM"), the values before tiers were ints
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
 
 
 # Model cost per 1K tokens (input/output)
@@ -173,7 +217,12 @@ class ProviderPolicy(BaseModel):
             rate_limit_rpm=60,
             cost_tier_limit=CostTier.MEDIUM,
         )
+
+    Policies are immutable once created; to change one at runtime, replace
+    it in ``TenantPolicy.provider_policies`` (e.g. with ``model_copy(update=...)``).
     """
+    model_config = ConfigDict(frozen=True)
+
     provider: Literal["openai", "anthropic", "azure_openai", "ollama", "bedrock"]
     allowed_models: list[str] = Field(
         default_factory=list,
@@ -223,7 +272,12 @@ class ProviderPolicy(BaseModel):
         """Ensure model lists contain only strings."""
         if not all(isinstance(model, str) for model in v):
             raise ValueError("All model names must be strings")
-        return v
+        return [sys.intern(model) for model in v]
+
+    @field_serializer('cost_tier_limit')
+    def serialize_cost_tier(self, tier: Optional[CostTier]) -> Optional[str]:
+        """Serialize tiers by name ("medium"), keeping exported policies unchanged."""
+        return None if tier is None else tier.name.lower()
 
 
 class TenantPolicy(BaseModel):
@@ -302,7 +356,13 @@ class TenantPolicy(BaseModel):
         """Ensure tenant_id is not empty."""
         if not v or not v.strip():
             raise ValueError("tenant_id cannot be empty")
-        return v.strip()
+        return sys.intern(v.strip())
+
+    @field_validator('provider_policies')
+    @classmethod
+    def intern_provider_names(cls, v):
+        """Intern provider keys so lookups with interned names compare by identity."""
+        return {sys.intern(provider): policy for provider, policy in v.items()}
 
 
 class UsageRecord(BaseModel):
@@ -321,7 +381,11 @@ class UsageRecord(BaseModel):
         latency_ms: Response latency in milliseconds
         success: Whether request succeeded
         reason: Optional reason/justification provided
+
+    Records are immutable (and hashable) once created.
     """
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     tenant_id: str
     provider: str
@@ -335,6 +399,401 @@ class UsageRecord(BaseModel):
     reason: Optional[str] = None
 
 
+# Number of daily usage rollups kept for get_usage_report
+USAGE_ROLLUP_DAYS = 30
+
+
+def _new_stats() -> Dict[str, any]:
+    return {"requests": 0, "cost_usd": 0.0, "tokens": 0, "latency_ms": 0.0, "successes": 0}
+
+
+def _add_stats(stats: Dict[str, any], cost_usd: float, tokens: int, latency_ms: float, success: bool) -> None:
+    stats["requests"] += 1
+    stats["cost_usd"] += cost_usd
+    stats["tokens"] += tokens
+    stats["latency_ms"] += latency_ms
+    stats["successes"] += success
+
+
+def _merge_stats(into: Dict[str, Dict[str, any]], source: Dict[str, Dict[str, any]]) -> None:
+    for name, stats in source.items():
+        target = into.get(name)
+        if target is None:
+            target = into[name] = _new_stats()
+        for key, value in stats.items():
+            target[key] += value
+
+
+def _finish_stats(stats: Dict[str, any], with_success_rate: bool) -> Dict[str, any]:
+    """Turn accumulated sums into the report's per-provider/per-model shape."""
+    requests = stats["requests"]
+    result = {
+        "requests": requests,
+        "cost_usd": stats["cost_usd"],
+        "tokens": stats["tokens"],
+        "avg_latency_ms": stats["latency_ms"] / requests,
+    }
+    if with_success_rate:
+        result["success_rate"] = stats["successes"] / requests * 100
+    return result
+
+
+class _UsageRollup:
+    """Running usage totals for one UTC day."""
+
+    __slots__ = ("day", "requests", "cost_usd", "tokens", "by_provider", "by_model")
+
+    def __init__(self, day: int):
+        self.day = day
+        self.requests = 0
+        self.cost_usd = 0.0
+        self.tokens = 0
+        self.by_provider: Dict[str, Dict[str, any]] = {}
+        self.by_model: Dict[str, Dict[str, any]] = {}
+
+    def add(
+        self,
+        provider: str,
+        model: str,
+        cost_usd: float,
+        tokens: int,
+        latency_ms: float,
+        success: bool,
+    ) -> None:
+        self.requests += 1
+        self.cost_usd += cost_usd
+        self.tokens += tokens
+        stats = self.by_provider.get(provider)
+        if stats is None:
+            stats = self.by_provider[provider] = _new_stats()
+        _add_stats(stats, cost_usd, tokens, latency_ms, success)
+        stats = self.by_model.get(model)
+        if stats is None:
+            stats = self.by_model[model] = _new_stats()
+        _add_stats(stats, cost_usd, tokens, latency_ms, success)
+
+
+# date(1970, 1, 1).toordinal(): converts epoch seconds to date ordinals
+_EPOCH_ORDINAL = 719163
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _day_ordinal(ts: float) -> int:
+    """UTC date ordinal of an epoch timestamp."""
+    return int(ts // 86400) + _EPOCH_ORDINAL
+
+
+class UsageLog(Sequence):
+    """
+    Append-only usage history stored column-wise.
+
+    Each field lives in its own typed ``array`` and provider/model names are
+    stored as indexes into a shared name table, so an entry costs ~50 bytes
+    instead of a full ``UsageRecord`` object. Indexing and iteration build
+    ``UsageRecord`` objects on demand; aggregation reads the columns directly.
+    """
+
+    def __init__(self, tenant_id: str):
+        self.tenant_id = tenant_id
+        self._ts = array("d")
+        self._provider = array("I")
+        self._model = array("I")
+        self._tokens_input = array("q")
+        self._tokens_output = array("q")
+        self._cost_usd = array("d")
+        self._latency_ms = array("d")
+        self._success = array("b")
+        # Reasons are optional and usually absent: index -> reason
+        self._reasons: Dict[int, str] = {}
+        self._names: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+
+    def _name_id(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self._names)
+            self._names.append(name)
+        return name_id
+
+    def add(
+        self,
+        ts: float,
+        provider: str,
+        model: str,
+        tokens_input: int,
+        tokens_output: int,
+        cost_usd: float,
+        latency_ms: float,
+        success: bool,
+        reason: Optional[str] = None,
+    ) -> None:
+        """Append one entry; ``ts`` is a UTC epoch timestamp."""
+        if reason is not None:
+            self._reasons[len(self._ts)] = reason
+        self._ts.append(ts)
+        self._provider.append(self._name_id(provider))
+        self._model.append(self._name_id(model))
+        self._tokens_input.append(tokens_input)
+        self._tokens_output.append(tokens_output)
+        self._cost_usd.append(cost_usd)
+        self._latency_ms.append(latency_ms)
+        self._success.append(success)
+
+    def append(self, record: UsageRecord) -> None:
+        """Append a ``UsageRecord`` (its tenant_id is not stored)."""
+        self.add(
+            ts=(record.timestamp - _EPOCH).total_seconds(),
+            provider=record.provider,
+            model=record.model,
+            tokens_input=record.tokens_input,
+            tokens_output=record.tokens_output,
+            cost_usd=record.cost_usd,
+            latency_ms=record.latency_ms,
+            success=record.success,
+            reason=record.reason,
+        )
+
+    def record(self, index: int) -> UsageRecord:
+        """Build the ``UsageRecord`` for one entry."""
+        tokens_input = self._tokens_input[index]
+        tokens_output = self._tokens_output[index]
+        return UsageRecord(
+            timestamp=datetime.utcfromtimestamp(self._ts[index]),
+            tenant_id=self.tenant_id,
+            provider=self._names[self._provider[index]],
+            model=self._names[self._model[index]],
+            tokens_input=tokens_input,
+            tokens_output=tokens_output,
+            tokens_total=tokens_input + tokens_output,
+            cost_usd=self._cost_usd[index],
+            latency_ms=self._latency_ms[index],
+            success=bool(self._success[index]),
+            reason=self._reasons.get(index),
+        )
+
+    def rollup_since(self, first_day: int) -> _UsageRollup:
+        """
+        Aggregate every entry from UTC date ordinal ``first_day`` onwards.
+
+        With numpy installed the columns are viewed in place (no copy) and
+        grouped with ``bincount``; otherwise entries are summed in Python.
+        """
+        if _np is not None and self._ts:
+            return self._rollup_since_numpy(first_day)
+        rollup = _UsageRollup(first_day)
+        cutoff = (first_day - _EPOCH_ORDINAL) * 86400
+        names = self._names
+        for ts, provider, model, tokens_input, tokens_output, cost_usd, latency_ms, success in zip(
+            self._ts, self._provider, self._model, self._tokens_input,
+            self._tokens_output, self._cost_usd, self._latency_ms, self._success,
+        ):
+            if ts >= cutoff:
+                rollup.add(
+                    names[provider], names[model], cost_usd,
+                    tokens_input + tokens_output, latency_ms, success,
+                )
+        return rollup
+
+    def _column(self, column: array):
+        return _np.frombuffer(column, dtype=column.typecode)
+
+    def _rollup_since_numpy(self, first_day: int) -> _UsageRollup:
+        rollup = _UsageRollup(first_day)
+        mask = self._column(self._ts) >= (first_day - _EPOCH_ORDINAL) * 86400
+        cost_usd = self._column(self._cost_usd)[mask]
+        tokens = self._column(self._tokens_input)[mask] + self._column(self._tokens_output)[mask]
+        latency_ms = self._column(self._latency_ms)[mask]
+        success = self._column(self._success)[mask]
+
+        rollup.requests = int(_np.count_nonzero(mask))
+        rollup.cost_usd = float(cost_usd.sum())
+        rollup.tokens = int(tokens.sum())
+
+        names = self._names
+        size = len(names)
+        for column, groups in (
+            (self._provider, rollup.by_provider),
+            (self._model, rollup.by_model),
+        ):
+            ids = self._column(column)[mask]
+            requests = _np.bincount(ids, minlength=size)
+            cost_sums = _np.bincount(ids, weights=cost_usd, minlength=size)
+            token_sums = _np.bincount(ids, weights=tokens, minlength=size)
+            latency_sums = _np.bincount(ids, weights=latency_ms, minlength=size)
+            successes = _np.bincount(ids, weights=success, minlength=size)
+            for name_id in _np.flatnonzero(requests):
+                groups[names[name_id]] = {
+                    "requests": int(requests[name_id]),
+                    "cost_usd": float(cost_sums[name_id]),
+                    "tokens": int(token_sums[name_id]),
+                    "latency_ms": float(latency_sums[name_id]),
+                    "successes": int(successes[name_id]),
+                }
+        return rollup
+
+    def __len__(self) -> int:
+        return len(self._ts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.record(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("usage log index out of range")
+        return self.record(index)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (UsageLog, list)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"UsageLog(tenant_id={self.tenant_id!r}, entries={len(self)})"
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a per-minute rate.
+
+    Starts full, holds at most ``per_minute`` tokens and regains
+    ``per_minute / 60`` tokens per second. Timestamps come from
+    ``time.monotonic()``.
+    """
+
+    __slots__ = ("capacity", "rate", "tokens", "updated")
+
+    def __init__(self, per_minute: int, now: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_consume(self, amount: float, now: float) -> bool:
+        """Refill, then take ``amount`` tokens if available."""
+        self.refill(now)
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return True
+        return False
+
+
+# Packed usage batch layout (before zlib): u32 record count, then one
+# u32 length-prefixed JSON frame per record. Little-endian throughout.
+_U32 = struct.Struct("<I")
+
+
+def pack_usage_batch(records: List[UsageRecord]) -> bytes:
+    """
+    Pack a batch of usage records into a single compressed blob.
+
+    Intended for usage sinks that store each flushed batch as one row
+    (e.g. keyed by tenant_id and flush time) instead of one row per record.
+
+    Args:
+        records: Usage records to pack
+
+    Returns:
+        zlib-compressed, length-prefixed batch
+    """
+    parts = [_U32.pack(len(records))]
+    for record in records:
+        frame = record.model_dump_json().encode("utf-8")
+        parts.append(_U32.pack(len(frame)))
+        parts.append(frame)
+    return zlib.compress(b"".join(parts))
+
+
+def unpack_usage_batch(blob: bytes) -> List[UsageRecord]:
+    """
+    Unpack a blob produced by ``pack_usage_batch``.
+
+    Args:
+        blob: Packed usage batch
+
+    Returns:
+        Usage records in their original order
+    """
+    data = zlib.decompress(blob)
+    (count,) = _U32.unpack_from(data, 0)
+    offset = _U32.size
+    records = []
+    for _ in range(count):
+        (size,) = _U32.unpack_from(data, offset)
+        offset += _U32.size
+        records.append(UsageRecord.model_validate_json(data[offset:offset + size]))
+        offset += size
+    return records
+
+
+class UsageReservation:
+    """
+    Budget reservation from ``PolicyEnforcer.request()`` or ``reserve()``.
+
+    Attributes:
+        provider: Provider the request was validated for
+        model: Model the request was validated for
+        reason: Justification passed to ``request()``
+        reserved_usd: Estimated cost held against the budgets
+        committed: Whether actual usage has been recorded
+    """
+
+    __slots__ = ("_enforcer", "provider", "model", "reason", "reserved_usd", "committed", "_released")
+
+    def __init__(
+        self,
+        enforcer: "PolicyEnforcer",
+        provider: str,
+        model: str,
+        reason: Optional[str],
+        reserved_usd: float,
+    ):
+        self._enforcer = enforcer
+        self.provider = provider
+        self.model = model
+        self.reason = reason
+        self.reserved_usd = reserved_usd
+        self.committed = False
+        self._released = False
+
+    def commit(
+        self,
+        cost_usd: float,
+        tokens_input: int,
+        tokens_output: int,
+        latency_ms: float,
+        success: bool = True,
+    ) -> None:
+        """Replace the reservation with the actual usage of the request."""
+        if self.committed:
+            raise RuntimeError("Usage reservation already committed")
+        self.committed = True
+        self.release()
+        self._enforcer.record_usage(
+            provider=self.provider,
+            model=self.model,
+            tokens_input=tokens_input,
+            tokens_output=tokens_output,
+            cost_usd=cost_usd,
+            latency_ms=latency_ms,
+            success=success,
+            reason=self.reason,
+        )
+
+    def release(self) -> None:
+        """Return the reserved cost to the budgets (idempotent)."""
+        if not self._released:
+            self._released = True
+            self._enforcer._reserved_spend -= self.reserved_usd
+
+
 class PolicyEnforcer:
     """
     Enforces LLM usage policies before requests are sent.
@@ -342,9 +801,16 @@ class PolicyEnforcer:
     Validates requests against provider and tenant policies, tracks usage,
     enforces budgets, and provides cost estimation.
 
+    When a ``usage_sink`` is configured, recorded usage is also queued and
+    persisted in batches by a background flush task instead of on the request
+    path. Spend counters are always updated synchronously, so validation never
+    depends on the queue; records dropped on overflow or lost on shutdown
+    only affect persisted reporting.
+
     Attributes:
         policy: Tenant policy configuration
-        usage_records: List of usage records for tracking
+        usage_records: Usage history (a ``UsageLog``; entries index as UsageRecord)
+        dropped_usage: Records dropped because the persistence queue was full
 
     Example:
         # Create enforcer with policy
@@ -378,21 +844,61 @@ class PolicyEnforcer:
         report = enforcer.get_usage_report(days=30)
     """
 
-    def __init__(self, policy: TenantPolicy):
+    def __init__(
+        self,
+        policy: TenantPolicy,
+        usage_sink: Optional[UsageSink] = None,
+        usage_batch_size: int = 1024,
+        usage_flush_interval: float = 1.0,
+        max_pending_usage: int = 10000,
+    ):
         """
         Initialize policy enforcer.
 
         Args:
             policy: Tenant policy configuration
+            usage_sink: Optional callable that persists a batch of usage records
+            usage_batch_size: Maximum records passed to the sink per flush
+            usage_flush_interval: Seconds between background flushes
+            max_pending_usage: Queued records kept before new ones are dropped
         """
         self.policy = policy
-        self.usage_records: list[UsageRecord] = []
+        self.usage_records = UsageLog(policy.tenant_id)
         self._monthly_spend: float = 0.0
         self._daily_spend: float = 0.0
-        self._last_daily_reset = datetime.utcnow().date()
-
-        # Rate limiting state
-        self._rate_limit_state: Dict[str, Dict[str, list[float]]] = {}
+        # Estimated cost of requests inside request() blocks, not yet recorded
+        self._reserved_spend: float = 0.0
+        # UTC day index (days since the epoch) that _daily_spend belongs to
+        self._day_idx = int(time.time() // 86400)
+
+        # Per-provider (configured policy or None, effective policy, checks) built
+        # by _compile_provider_checks; rebuilt when the configured policy is replaced
+        self._provider_checks: Dict[
+            str,
+            Tuple[Optional[ProviderPolicy], ProviderPolicy, Tuple[Callable[[str, int, float], None], ...]],
+        ] = {}
+
+        # Rate limiting state: (requests bucket, tokens bucket) per provider
+        self._rate_buckets: Dict[str, Tuple[Optional[TokenBucket], Optional[TokenBucket]]] = {}
+
+        # Per-day usage rollups, newest last (the last USAGE_ROLLUP_DAYS days)
+        self._rollups: Deque[_UsageRollup] = deque(maxlen=USAGE_ROLLUP_DAYS)
+
+        # Serialized reports by period: days -> (monotonic time built, JSON).
+        # Cleared whenever usage or spend changes.
+        self._report_cache: Dict[int, Tuple[float, bytes]] = {}
+
+        # Batched usage persistence state
+        self._usage_sink = usage_sink
+        self._usage_batch_size = usage_batch_size
+        self._usage_flush_interval = usage_flush_interval
+        self._max_pending_usage = max_pending_usage
+        self._pending_usage: Deque[UsageRecord] = deque()
+        # Created with the flush task, on its loop (3.8/3.9 bind Events at construction)
+        self._usage_ready: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.dropped_usage = 0
 
     def validate_request(
         self,
@@ -404,6 +910,9 @@ class PolicyEnforcer:
         """
         Validate a request against policies.
 
+        Prefer ``request()`` when the usage will be recorded afterwards: it
+        validates, reserves the estimated cost and records usage in one step.
+
         Args:
             provider: Provider name (openai, anthropic, etc.)
             model: Model identifier
@@ -417,80 +926,111 @@ class PolicyEnforcer:
             RateLimitExceededError: If rate limit exceeded
             FallbackToLocalError: If budget exceeded but fallback available
         """
-        # Get provider policy (or create default)
-        provider_policy = self.policy.provider_policies.get(
-            provider,
-            ProviderPolicy(provider=provider)  # type: ignore
-        )
+        self._validate(provider, model, estimated_tokens, reason)
 
-        # Check if provider is enabled
-        if not provider_policy.enabled:
-            raise ProviderDisabledError(
-                f"Provider '{provider}' is disabled in policy."
-            )
+    @contextmanager
+    def request(
+        self,
+        provider: str,
+        model: str,
+        estimated_tokens: int,
+        reason: Optional[str] = None,
+    ) -> Iterator["UsageReservation"]:
+        """
+        Validate a request and reserve its estimated cost for its duration.
+
+        While the block runs, the estimated cost counts against the daily and
+        monthly budgets, so concurrent requests cannot all pass validation
+        and then overshoot the budget together. Call ``commit()`` on the
+        yielded reservation with the actual usage; the reservation is
+        released on exit whether or not it was committed (e.g. on error).
+
+        Example:
+            with enforcer.request("openai", "gpt-4o-mini", 2000) as usage:
+                response = await chain.execute_async(prompt)
+                usage.commit(
+                    cost_usd=response.cost_usd,
+                    tokens_input=response.tokens_input,
+                    tokens_output=response.tokens_output,
+                    latency_ms=response.latency_ms,
+                )
 
-        # Check model allowed
-        if provider_policy.denied_models and model in provider_policy.denied_models:
-            raise PolicyViolationError(
-                f"Model '{model}' is explicitly denied for provider '{provider}'."
-            )
+        Raises:
+            Same as ``validate_request``.
+        """
+        reservation = self.reserve(provider, model, estimated_tokens, reason)
+        try:
+            yield reservation
+        finally:
+            reservation.release()
 
-        if provider_policy.allowed_models and model not in provider_policy.allowed_models:
-            raise PolicyViolationError(
-                f"Model '{model}' not in allowed list for provider '{provider}': "
-                f"{provider_policy.allowed_models}"
-            )
+    def reserve(
+        self,
+        provider: str,
+        model: str,
+        estimated_tokens: int,
+        reason: Optional[str] = None,
+    ) -> "UsageReservation":
+        """
+        Validate a request and reserve its estimated cost until released.
 
-        # Check cost tier limit
-        if provider_policy.cost_tier_limit:
-            model_tier = MODEL_COST_TIERS.get(model)
-            if model_tier and self._tier_exceeds_limit(model_tier, provider_policy.cost_tier_limit):
-                raise PolicyViolationError(
-                    f"Model '{model}' tier ({model_tier.value}) exceeds limit "
-                    f"({provider_policy.cost_tier_limit.value})."
-                )
+        The non-context-manager form of ``request()``, for reservations that
+        outlive one block (e.g. handed to another task). The caller must
+        ``commit()`` or ``release()`` the reservation; until then its cost
+        counts against the budgets.
 
-        # Check token limit
-        if estimated_tokens > provider_policy.max_tokens_per_request:
-            raise PolicyViolationError(
-                f"Estimated tokens ({estimated_tokens}) exceeds limit "
-                f"({provider_policy.max_tokens_per_request}) for provider '{provider}'."
-            )
+        Validation and reservation run without an ``await`` in between, so
+        coroutines on the event loop cannot interleave a check-then-act race
+        between them and no lock is needed.
+
+        Raises:
+            Same as ``validate_request``.
+        """
+        estimated_cost = self._validate(provider, model, estimated_tokens, reason)
+        self._reserved_spend += estimated_cost
+        return UsageReservation(self, provider, model, reason, estimated_cost)
+
+    def _validate(
+        self,
+        provider: str,
+        model: str,
+        estimated_tokens: int,
+        reason: Optional[str],
+    ) -> float:
+        """Run every policy check; returns the estimated cost."""
+        provider = sys.intern(provider)
+        model = sys.intern(model)
+        # Provider and model checks, specialized once per provider
+        configured = self.policy.provider_policies.get(provider)
+        compiled = self._provider_checks.get(provider)
+        if compiled is None or compiled[0] is not configured:
+            compiled = self._compile_provider_checks(provider, configured)
+        _, provider_policy, checks = compiled
 
-        # Check cost limit
         estimated_cost = self.estimate_cost(model, estimated_tokens)
-        if provider_policy.max_cost_per_request > 0 and estimated_cost > provider_policy.max_cost_per_request:
-            raise PolicyViolationError(
-                f"Estimated cost (${estimated_cost:.4f}) exceeds per-request limit "
-                f"(${provider_policy.max_cost_per_request:.4f})."
-            )
+        for check in checks:
+            check(model, estimated_tokens, estimated_cost)
 
-        # Check daily budget
+        # Check daily and monthly budgets together; a single branch on the
+        # common path (caps read live from the policy, no daily limit = inf)
         self._reset_daily_budget_if_needed()
-        if self.policy.daily_budget_usd and self._daily_spend + estimated_cost > self.policy.daily_budget_usd:
-            if self.policy.fallback_to_local:
-                raise FallbackToLocalError(
-                    f"Daily budget (${self.policy.daily_budget_usd:.2f}) would be exceeded. "
-                    f"Current spend: ${self._daily_spend:.2f}, estimated cost: ${estimated_cost:.4f}. "
-                    f"Fallback to local model recommended."
-                )
-            raise BudgetExceededError(
-                f"Daily budget (${self.policy.daily_budget_usd:.2f}) would be exceeded. "
-                f"Current spend: ${self._daily_spend:.2f}, estimated cost: ${estimated_cost:.4f}."
+        committed_cost = estimated_cost + self._reserved_spend
+        daily_cap = self.policy.daily_budget_usd or float("inf")
+        monthly_cap = self.policy.monthly_budget_usd
+        daily_over = self._daily_spend + committed_cost > daily_cap
+        monthly_over = self._monthly_spend + committed_cost > monthly_cap
+        if daily_over | monthly_over:
+            if daily_over:
+                period, budget, spend = "Daily", daily_cap, self._daily_spend
+            else:
+                period, budget, spend = "Monthly", monthly_cap, self._monthly_spend
+            message = (
+                f"{period} budget (${budget:.2f}) would be exceeded. "
+                f"Current spend: ${spend:.2f}, estimated cost: ${estimated_cost:.4f}."
             )
-
-        # Check monthly budget
-        if self._monthly_spend + estimated_cost > self.policy.monthly_budget_usd:
             if self.policy.fallback_to_local:
-                raise FallbackToLocalError(
-                    f"Monthly budget (${self.policy.monthly_budget_usd:.2f}) would be exceeded. "
-                    f"Current spend: ${self._monthly_spend:.2f}, estimated cost: ${estimated_cost:.4f}. "
-                    f"Fallback to local model recommended."
-                )
-            raise BudgetExceededError(
-                f"Monthly budget (${self.policy.monthly_budget_usd:.2f}) would be exceeded. "
-                f"Current spend: ${self._monthly_spend:.2f}, estimated cost: ${estimated_cost:.4f}."
-            )
+                raise FallbackToLocalError(f"{message} Fallback to local model recommended.")
+            raise BudgetExceededError(message)
 
         # Check rate limits
         self._check_rate_limits(provider, provider_policy, estimated_tokens)
@@ -501,6 +1041,112 @@ class PolicyEnforcer:
                 f"Reason required for requests to provider '{provider}'."
             )
 
+        return estimated_cost
+
+    def reload_policy(self) -> None:
+        """
+        Rebuild derived state after ``self.policy`` is modified.
+
+        Budget limits are read on every request and a replaced provider
+        policy is picked up on its next request; this also rebuilds every
+        provider's checks and resets all rate-limit state.
+        """
+        self._provider_checks.clear()
+        self._rate_buckets.clear()
+
+    def _compile_provider_checks(
+        self, provider: str, configured: Optional[ProviderPolicy]
+    ) -> Tuple[Optional[ProviderPolicy], ProviderPolicy, Tuple[Callable[[str, int, float], None], ...]]:
+        """
+        Build the provider/model checks for a provider.
+
+        Only the checks its policy actually enables are included, each bound
+        to the policy values it needs, in the order validate_request has
+        always applied them. Each check takes (model, tokens, estimated_cost)
+        and raises on violation. ``configured`` is the provider's entry in
+        ``provider_policies`` (None = defaults); the result is cached until
+        that entry is replaced.
+        """
+        if provider in self._provider_checks:
+            # Policy replaced: its rate limits may differ too
+            self._rate_buckets.pop(provider, None)
+
+        provider_policy = configured
+        if provider_policy is None:
+            provider_policy = ProviderPolicy(provider=provider)  # type: ignore
+
+        checks = []
+
+        # Check if provider is enabled
+        if not provider_policy.enabled:
+            def check_enabled(model, tokens, cost):
+                raise ProviderDisabledError(
+                    f"Provider '{provider}' is disabled in policy."
+                )
+            checks.append(check_enabled)
+
+        # Check model allowed (hash sets for O(1) membership, built per policy;
+        # model lists are treated as fixed once the policy is created)
+        denied = frozenset(provider_policy.denied_models)
+        if denied:
+            def check_denied(model, tokens, cost):
+                if model in denied:
+                    raise PolicyViolationError(
+                        f"Model '{model}' is explicitly denied for provider '{provider}'."
+                    )
+            checks.append(check_denied)
+
+        allowed = frozenset(provider_policy.allowed_models)
+        if allowed:
+            allowed_models = provider_policy.allowed_models
+
+            def check_allowed(model, tokens, cost):
+                if model not in allowed:
+                    raise PolicyViolationError(
+                        f"Model '{model}' not in allowed list for provider '{provider}': "
+                        f"{allowed_models}"
+                    )
+            checks.append(check_allowed)
+
+        # Check cost tier limit
+        tier_limit = provider_policy.cost_tier_limit
+        if tier_limit is not None:
+
+            def check_tier(model, tokens, cost):
+                model_tier = MODEL_COST_TIERS.get(model)
+                if model_tier is not None and model_tier > tier_limit:
+                    raise PolicyViolationError(
+                        f"Model '{model}' tier ({model_tier.name.lower()}) exceeds limit "
+                        f"({tier_limit.name.lower()})."
+                    )
+            checks.append(check_tier)
+
+        # Check token limit
+        max_tokens = provider_policy.max_tokens_per_request
+
+        def check_tokens(model, tokens, cost):
+            if tokens > max_tokens:
+                raise PolicyViolationError(
+                    f"Estimated tokens ({tokens}) exceeds limit "
+                    f"({max_tokens}) for provider '{provider}'."
+                )
+        checks.append(check_tokens)
+
+        # Check cost limit
+        max_cost = provider_policy.max_cost_per_request
+        if max_cost > 0:
+            def check_cost(model, tokens, cost):
+                if cost > max_cost:
+                    raise PolicyViolationError(
+                        f"Estimated cost (${cost:.4f}) exceeds per-request limit "
+                        f"(${max_cost:.4f})."
+                    )
+            checks.append(check_cost)
+
+        compiled = (configured, provider_policy, tuple(checks))
+        self._provider_checks[provider] = compiled
+        return compiled
+
     def estimate_cost(self, model: str, tokens: int, input_ratio: float = 0.7) -> float:
         """
         Estimate cost for a request.
@@ -549,22 +1195,42 @@ class PolicyEnforcer:
         if not self.policy.track_usage:
             return
 
-        record = UsageRecord(
-            tenant_id=self.policy.tenant_id,
-            provider=provider,
-            model=model,
-            tokens_input=tokens_input,
-            tokens_output=tokens_output,
-            tokens_total=tokens_input + tokens_output,
-            cost_usd=cost_usd,
-            latency_ms=latency_ms,
-            success=success,
-            reason=reason,
-        )
+        provider = sys.intern(provider)
+        model = sys.intern(model)
+        ts = time.time()
+        day_idx = int(ts // 86400)
+        if day_idx != self._day_idx:
+            self._day_idx = day_idx
+            self._daily_spend = 0.0
 
-        self.usage_records.append(record)
+        self.usage_records.add(
+            ts, provider, model, tokens_input, tokens_output,
+            cost_usd, latency_ms, success, reason,
+        )
         self._monthly_spend += cost_usd
         self._daily_spend += cost_usd
+        if self._report_cache:
+            self._report_cache.clear()
+
+        day = day_idx + _EPOCH_ORDINAL
+        if not self._rollups or self._rollups[-1].day < day:
+            self._rollups.append(_UsageRollup(day))
+        self._rollups[-1].add(
+            provider, model, cost_usd, tokens_input + tokens_output, latency_ms, success,
+        )
+
+        if self._usage_sink is not None:
+            if len(self._pending_usage) >= self._max_pending_usage:
+                self.dropped_usage += 1
+            else:
+                self._pending_usage.append(self.usage_records.record(len(self.usage_records) - 1))
+            if not self._flush_task_running():
+                self._start_flush_task()
+            if (
+                self._usage_ready is not None
+                and len(self._pending_usage) >= self._usage_batch_size
+            ):
+                self._usage_ready.set()
 
         # Check alert threshold
         if self.policy.monthly_budget_usd > 0:
@@ -573,20 +1239,126 @@ class PolicyEnforcer:
                 # In production, this would trigger an alert/notification
                 pass
 
+    async def enqueue_usage(self, **kwargs) -> None:
+        """
+        Record usage from async code.
+
+        Accepts the same arguments as ``record_usage``. Persistence happens
+        later, in batches, on the background flush task.
+        """
+        self.record_usage(**kwargs)
+
+    def _flush_task_running(self) -> bool:
+        """Whether the flush task is alive on the current event loop.
+
+        A task from an earlier loop (e.g. a previous ``asyncio.run``) is
+        cancelled when that loop ends, so it is replaced rather than reused.
+        """
+        task = self._flush_task
+        if task is None or task.done():
+            return False
+        try:
+            return task.get_loop() is asyncio.get_running_loop()
+        except RuntimeError:
+            return True  # No running loop to restart it on
+
+    def _start_flush_task(self) -> None:
+        """Start the background flush task if called inside an event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No running loop: records stay queued until drain()
+        self._usage_ready = asyncio.Event()
+        self._flush_task = loop.create_task(self._flush_loop())
+
+    async def record_usage_batch(self, records: List[UsageRecord]) -> None:
+        """
+        Persist a batch of usage records through the configured sink.
+
+        Args:
+            records: Usage records to persist in one sink call
+        """
+        if self._usage_sink is None or not records:
+            return
+        result = self._usage_sink(records)
+        if inspect.isawaitable(result):
+            await result
+
+    async def drain(self) -> None:
+        """Stop the flush task and persist every queued usage record."""
+        running = self._flush_task_running()
+        task, self._flush_task = self._flush_task, None
+        if task is not None and running:
+            # Wake the loop for a final flush rather than cancelling it mid-batch
+            self._stopping = True
+            self._usage_ready.set()
+            try:
+                await task
+            finally:
+                self._stopping = False
+        await self._flush_pending_usage()
+
+    async def _flush_loop(self) -> None:
+        """Flush queued usage every interval, or sooner once a batch is full."""
+        while True:
+            try:
+                await asyncio.wait_for(self._usage_ready.wait(), self._usage_flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._usage_ready.clear()
+            await self._flush_pending_usage()
+            if self._stopping:
+                return
+
+    async def _flush_pending_usage(self) -> None:
+        """Hand queued usage to the sink in batches of ``usage_batch_size``."""
+        while self._pending_usage:
+            count = min(len(self._pending_usage), self._usage_batch_size)
+            batch = [self._pending_usage.popleft() for _ in range(count)]
+            try:
+                await self.record_usage_batch(batch)
+            except Exception:
+                logger.exception(
+                    "Failed to persist %d usage records for tenant %s",
+                    len(batch), self.policy.tenant_id,
+                )
+
     def get_usage_report(self, days: int = 30) -> Dict[str, any]:
         """
         Get usage report for the specified number of days.
 
+        Served from per-day rollups maintained by ``record_usage``, so the
+        cost is proportional to days x (providers + models), not to the
+        number of records. The period is ``days`` whole UTC days, with
+        today as the last day. Periods longer than the retained rollups
+        are aggregated from ``usage_records``.
+
         Args:
             days: Number of days to include in report
 
         Returns:
             Dictionary with usage statistics
         """
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        recent_records = [r for r in self.usage_records if r.timestamp >= cutoff]
-
-        if not recent_records:
+        today = _day_ordinal(time.time())
+        first_day = today - days + 1
+        if days <= USAGE_ROLLUP_DAYS:
+            rollups = [r for r in self._rollups if r.day >= first_day]
+        else:
+            rollups = [self.usage_records.rollup_since(first_day)]
+
+        total_requests = 0
+        total_cost = 0.0
+        total_tokens = 0
+        by_provider: Dict[str, Dict[str, any]] = {}
+        by_model: Dict[str, Dict[str, any]] = {}
+        for rollup in rollups:
+            total_requests += rollup.requests
+            total_cost += rollup.cost_usd
+            total_tokens += rollup.tokens
+            _merge_stats(by_provider, rollup.by_provider)
+            _merge_stats(by_model, rollup.by_model)
+
+        if not total_requests:
             return {
                 "tenant_id": self.policy.tenant_id,
                 "period_days": days,
@@ -597,76 +1369,60 @@ class PolicyEnforcer:
                 "by_model": {},
             }
 
-        # Aggregate statistics
-        by_provider: Dict[str, Dict[str, any]] = {}
-        by_model: Dict[str, Dict[str, any]] = {}
-
-        for record in recent_records:
-            # By provider
-            if record.provider not in by_provider:
-                by_provider[record.provider] = {
-                    "requests": 0,
-                    "cost_usd": 0.0,
-                    "tokens": 0,
-                    "avg_latency_ms": 0.0,
-                    "success_rate": 0.0,
-                }
-            by_provider[record.provider]["requests"] += 1
-            by_provider[record.provider]["cost_usd"] += record.cost_usd
-            by_provider[record.provider]["tokens"] += record.tokens_total
-
-            # By model
-            if record.model not in by_model:
-                by_model[record.model] = {
-                    "requests": 0,
-                    "cost_usd": 0.0,
-                    "tokens": 0,
-                    "avg_latency_ms": 0.0,
-                }
-            by_model[record.model]["requests"] += 1
-            by_model[record.model]["cost_usd"] += record.cost_usd
-            by_model[record.model]["tokens"] += record.tokens_total
-
-        # Calculate averages
-        for stats in by_provider.values():
-            latencies = [r.latency_ms for r in recent_records]
-            stats["avg_latency_ms"] = sum(latencies) / len(latencies)
-            successes = sum(1 for r in recent_records if r.success)
-            stats["success_rate"] = (successes / len(recent_records)) * 100
-
-        for model, stats in by_model.items():
-            model_records = [r for r in recent_records if r.model == model]
-            latencies = [r.latency_ms for r in model_records]
-            stats["avg_latency_ms"] = sum(latencies) / len(latencies)
-
         return {
             "tenant_id": self.policy.tenant_id,
             "period_days": days,
-            "total_requests": len(recent_records),
-            "total_cost_usd": sum(r.cost_usd for r in recent_records),
-            "total_tokens": sum(r.tokens_total for r in recent_records),
-            "by_provider": by_provider,
-            "by_model": by_model,
+            "total_requests": total_requests,
+            "total_cost_usd": total_cost,
+            "total_tokens": total_tokens,
+            "by_provider": {
+                name: _finish_stats(stats, with_success_rate=True)
+                for name, stats in by_provider.items()
+            },
+            "by_model": {
+                name: _finish_stats(stats, with_success_rate=False)
+                for name, stats in by_model.items()
+            },
             "budget_remaining_usd": max(0, self.policy.monthly_budget_usd - self._monthly_spend),
             "budget_used_pct": (self._monthly_spend / self.policy.monthly_budget_usd * 100)
                 if self.policy.monthly_budget_usd > 0 else 0,
         }
 
+    def get_usage_report_json(self, days: int = 30, ttl: float = 1.0) -> bytes:
+        """
+        Get ``get_usage_report(days)`` serialized as JSON bytes.
+
+        For dashboards that poll the report: the serialized report is cached
+        per period and reused until usage is recorded or ``ttl`` seconds
+        pass (the ttl bounds staleness across day boundaries). Uses orjson
+        when installed.
+
+        Args:
+            days: Number of days to include in report
+            ttl: Maximum age in seconds of a cached report
+
+        Returns:
+            UTF-8 encoded JSON report
+        """
+        now = time.monotonic()
+        cached = self._report_cache.get(days)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        data = _dumps_json(self.get_usage_report(days))
+        self._report_cache[days] = (now, data)
+        return data
+
     def reset_monthly_budget(self) -> None:
         """Reset monthly budget counter (call at start of billing period)."""
         self._monthly_spend = 0.0
+        self._report_cache.clear()
 
     def _reset_daily_budget_if_needed(self) -> None:
-        """Reset daily budget if new day."""
-        current_date = datetime.utcnow().date()
-        if current_date > self._last_daily_reset:
+        """Reset daily budget if new (UTC) day."""
+        day_idx = int(time.time() // 86400)
+        if day_idx != self._day_idx:
+            self._day_idx = day_idx
             self._daily_spend = 0.0
-            self._last_daily_reset = current_date
-
-    def _tier_exceeds_limit(self, model_tier: CostTier, limit_tier: CostTier) -> bool:
-        """Check if model tier exceeds limit tier."""
-        tier_order = [CostTier.FREE, CostTier.LOW, CostTier.MEDIUM, CostTier.HIGH, CostTier.PREMIUM]
-        return tier_order.index(model_tier) > tier_order.index(limit_tier)
 
     def _check_rate_limits(
         self,
@@ -677,6 +1433,10 @@ class PolicyEnforcer:
         """
         Check rate limits for provider.
 
+        Uses one request bucket and one token bucket per provider, each
+        refilled continuously at its per-minute limit, so a check is
+        constant time regardless of traffic.
+
         Args:
             provider: Provider name
             policy: Provider policy
@@ -685,38 +1445,65 @@ class PolicyEnforcer:
         Raises:
             RateLimitExceededError: If rate limit exceeded
         """
-        if provider not in self._rate_limit_state:
-            self._rate_limit_state[provider] = {
-                "requests": [],  # List of timestamps
-                "tokens": [],    # List of (timestamp, token_count) tuples
-            }
-
-        now = time.time()
-        minute_ago = now - 60
+        buckets = self._rate_buckets.get(provider)
+        if buckets is None:
+            now = time.monotonic()
+            buckets = self._rate_buckets[provider] = (
+                TokenBucket(policy.rate_limit_rpm, now) if policy.rate_limit_rpm > 0 else None,
+                TokenBucket(policy.rate_limit_tpm, now) if policy.rate_limit_tpm > 0 else None,
+            )
+        request_bucket, token_bucket = buckets
+        if request_bucket is None and token_bucket is None:
+            return
 
-        # Clean old entries
-        state = self._rate_limit_state[provider]
-        state["requests"] = [t for t in state["requests"] if t > minute_ago]
-        state["tokens"] = [(ts, tc) for ts, tc in state["tokens"] if ts > minute_ago]
+        now = time.monotonic()
 
         # Check RPM limit
-        if policy.rate_limit_rpm > 0 and len(state["requests"]) >= policy.rate_limit_rpm:
-            raise RateLimitExceededError(
-                f"Rate limit exceeded for provider '{provider}': "
-                f"{len(state['requests'])} requests in last minute (limit: {policy.rate_limit_rpm} RPM)."
-            )
+        if request_bucket is not None:
+            request_bucket.refill(now)
+            if request_bucket.tokens < 1:
+                raise RateLimitExceededError(
+                    f"Rate limit exceeded for provider '{provider}': "
+                    f"request budget exhausted (limit: {policy.rate_limit_rpm} RPM)."
+                )
 
-        # Check TPM limit - sum only the token counts from tuples
-        tokens_in_window = sum(tc for _, tc in state["tokens"])
-        if policy.rate_limit_tpm > 0 and tokens_in_window + tokens > policy.rate_limit_tpm:
-            raise RateLimitExceededError(
-                f"Token rate limit exceeded for provider '{provider}': "
-                f"{tokens_in_window + tokens} tokens would exceed limit ({policy.rate_limit_tpm} TPM)."
-            )
+        # Check TPM limit
+        if token_bucket is not None:
+            token_bucket.refill(now)
+            if token_bucket.tokens < tokens:
+                raise RateLimitExceededError(
+                    f"Token rate limit exceeded for provider '{provider}': "
+                    f"{tokens} tokens requested, {int(token_bucket.tokens)} available "
+                    f"(limit: {policy.rate_limit_tpm} TPM)."
+                )
 
         # Record this request
-        state["requests"].append(now)
-        state["tokens"].append((now, tokens))
+        if request_bucket is not None:
+            request_bucket.tokens -= 1
+        if token_bucket is not None:
+            token_bucket.tokens -= tokens
+
+
+@functools.lru_cache(maxsize=4096)
+def estimate_tokens(prompt: str) -> int:
+    """
+    Estimate total tokens (input + output) for a prompt without a tokenizer.
+
+    Uses the ~4 bytes per token heuristic for the input and assumes a
+    response of similar size. Results are cached, so repeated prompts
+    cost a dict lookup.
+
+    Args:
+        prompt: Prompt text
+
+    Returns:
+        Estimated input + output tokens
+
+    Example:
+        >>> estimate_tokens("Explain the benefits of policy enforcement.")
+        22
+    """
+    return (len(prompt.encode("utf-8")) + 3) // 4 * 2
 
 
 def get_model_pricing(provider: str, model: str) -> Optional[Tuple[float, float]]:
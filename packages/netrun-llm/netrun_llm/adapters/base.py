@@ -16,8 +16,12 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, Any, Optional
+import sys
 import time
 
+# Slotted dataclasses (no per-instance __dict__) where supported (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class AdapterTier(Enum):
     """
@@ -35,7 +39,7 @@ class AdapterTier(Enum):
     GUI = 4  # Reliability: 0.4 (Browser automation)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LLMResponse:
     """
     Standard response format for all LLM adapters.
@@ -14,6 +14,7 @@ Example:
     )
 """
 
+import functools
 import os
 import re
 from dataclasses import dataclass, field
@@ -50,7 +51,7 @@ def resolve_placeholder(value: Optional[str]) -> Optional[str]:
     return value
 
 
-@dataclass
+@dataclass(frozen=True)
 class LLMConfig:
     """
     Configuration for LLM adapters and fallback chains.
@@ -58,6 +59,9 @@ class LLMConfig:
     All API keys should use {{PLACEHOLDER}} syntax for security.
     Placeholders are resolved from environment variables at runtime.
 
+    Configurations are immutable so one instance can be shared safely
+    between adapters; use ``dataclasses.replace()`` to derive a variant.
+
     Attributes:
         anthropic_api_key: Anthropic/Claude API key (use {{ANTHROPIC_API_KEY}})
         openai_api_key: OpenAI API key (use {{OPENAI_API_KEY}})
@@ -129,10 +133,14 @@ class LLMConfig:
         return resolve_placeholder(self.azure_openai_key)
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def from_env(cls) -> "LLMConfig":
         """
         Create configuration from environment variables.
 
+        The environment is read once; later calls return the same instance.
+        Call ``reload_from_env()`` after changing the environment.
+
         Environment Variables:
             ANTHROPIC_API_KEY: Anthropic/Claude API key
             OPENAI_API_KEY: OpenAI API key
@@ -164,6 +172,12 @@ class LLMConfig:
             max_retries=int(os.getenv("LLM_MAX_RETRIES", "3")),
         )
 
+    @classmethod
+    def reload_from_env(cls) -> "LLMConfig":
+        """Discard the cached ``from_env()`` configuration and read it again."""
+        LLMConfig.from_env.cache_clear()
+        return cls.from_env()
+
     def validate(self) -> List[str]:
         """
         Validate configuration and return list of issues.
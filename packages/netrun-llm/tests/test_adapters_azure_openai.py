@@ -10,14 +10,18 @@ Tests cover:
     - Availability checking
 """
 
+import asyncio
 import os
+import time
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from typing import Dict, Any
 
 from netrun.llm.adapters.azure_openai import (
     AzureOpenAIAdapter,
     AzureResource,
+    _CachedTokenProvider,
+    _ResourceBreaker,
 )
 from netrun.llm.adapters.base import LLMResponse, AdapterTier
 
@@ -31,9 +35,9 @@ def mock_azure_available():
                 "netrun.llm.adapters.azure_openai.DefaultAzureCredential"
             ) as mock_cred:
                 with patch(
-                    "netrun.llm.adapters.azure_openai.get_bearer_token_provider"
-                ) as mock_token:
-                    yield mock_azure, mock_cred, mock_token
+                    "netrun.llm.adapters.azure_openai.AsyncAzureOpenAI"
+                ) as mock_async_azure:
+                    yield mock_azure, mock_cred, mock_async_azure
 
 
 class TestAzureOpenAIInitialization:
@@ -41,7 +45,7 @@ class TestAzureOpenAIInitialization:
 
     def test_default_initialization(self, mock_azure_available):
         """Test adapter initializes with default resources."""
-        mock_azure, mock_cred, mock_token = mock_azure_available
+        mock_azure, mock_cred, mock_async_azure = mock_azure_available
 
         adapter = AzureOpenAIAdapter()
 
@@ -78,6 +82,96 @@ class TestAzureOpenAIInitialization:
         assert len(adapter.resources) == 1
         assert adapter.resources[0].name == "custom-resource"
 
+    def test_resource_is_frozen_and_hashable(self):
+        """Test AzureResource stores models as a tuple and can't be mutated."""
+        import dataclasses
+
+        resource = AzureResource(
+            name="custom-resource",
+            endpoint="https://custom.openai.azure.com",
+            resource_group="custom-rg",
+            models=["gpt-4"],
+            priority=1,
+        )
+
+        assert resource.models == ("gpt-4",)
+        assert resource in {resource}
+        assert not hasattr(resource, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            resource.priority = 2
+
+    def test_resource_pickle_and_deepcopy_round_trip(self):
+        """Test AzureResource survives pickle and deepcopy."""
+        import copy
+        import pickle
+
+        resource = AzureResource(
+            name="custom-resource",
+            endpoint="https://custom.openai.azure.com",
+            resource_group="custom-rg",
+            models=["gpt-4"],
+            priority=1,
+        )
+
+        assert pickle.loads(pickle.dumps(resource)) == resource
+        assert copy.deepcopy(resource) == resource
+        assert copy.copy(resource) == resource
+
+    async def test_clients_share_http_pool(self, mock_azure_available):
+        """Test every resource client is built on one shared httpx pool."""
+        mock_azure, mock_cred, mock_async_azure = mock_azure_available
+
+        adapter = AzureOpenAIAdapter()
+        for resource in adapter.resources:
+            adapter._get_or_create_client(resource)
+
+        sync_pools = {c.kwargs["http_client"] for c in mock_azure.call_args_list}
+        async_pools = {c.kwargs["http_client"] for c in mock_async_azure.call_args_list}
+        assert sync_pools == {adapter._http_client}
+        assert async_pools == {adapter._async_http_client}
+
+        await adapter.aclose()
+        assert adapter._http_client is None
+        assert adapter._async_http_client is None
+
+    async def test_clients_rebuilt_after_close(self, mock_azure_available):
+        """Test closing drops clients bound to the old pools so the next call rebuilds them."""
+        mock_azure, mock_cred, mock_async_azure = mock_azure_available
+
+        adapter = AzureOpenAIAdapter()
+        resource = adapter.resources[0]
+        adapter._get_or_create_client(resource)
+
+        await adapter.aclose()
+        assert adapter.clients == {}
+        assert adapter.async_clients == {}
+
+        adapter._get_or_create_client(resource)
+
+        assert mock_azure.call_count == 2
+        assert mock_async_azure.call_count == 2
+        assert mock_azure.call_args.kwargs["http_client"] is adapter._http_client
+        assert adapter._http_client is not None
+        assert adapter._async_http_client is not None
+        await adapter.aclose()
+
+    def test_clients_created_on_first_use(self, mock_azure_available):
+        """Test no resource client is built until that resource is used."""
+        mock_azure, mock_cred, mock_async_azure = mock_azure_available
+
+        adapter = AzureOpenAIAdapter()
+
+        assert adapter.clients == {}
+        mock_azure.assert_not_called()
+
+        resource = adapter.resources[0]
+        client = adapter._get_or_create_client(resource)
+
+        assert adapter._get_or_create_client(resource) is client
+        assert list(adapter.clients) == [resource.name]
+        assert list(adapter.async_clients) == [resource.name]
+        assert mock_azure.call_count == 1
+
 
 class TestAzureResourceSelection:
     """Test Azure resource selection logic."""
@@ -129,6 +223,30 @@ class TestAzureResourceSelection:
         resource = adapter._get_resource_for_model("unsupported-model")
         assert resource is None
 
+    def test_resource_priority_independent_of_list_order(self, mock_azure_available):
+        """Test priority, not list position, decides the resource for a model."""
+        custom_resources = [
+            AzureResource(
+                name="low-priority",
+                endpoint="https://r2.openai.azure.com",
+                resource_group="rg2",
+                models=["gpt-4o"],
+                priority=2,
+            ),
+            AzureResource(
+                name="high-priority",
+                endpoint="https://r1.openai.azure.com",
+                resource_group="rg1",
+                models=["gpt-4o"],
+                priority=1,
+            ),
+        ]
+
+        adapter = AzureOpenAIAdapter(resources=custom_resources)
+
+        assert adapter._get_resource_for_model("gpt-4o").name == "high-priority"
+        assert adapter._select_fallback_resource(set()).name == "high-priority"
+
     def test_select_fallback_resource(self, mock_azure_available):
         """Test selecting fallback resource."""
         custom_resources = [
@@ -151,7 +269,7 @@ class TestAzureResourceSelection:
         adapter = AzureOpenAIAdapter(resources=custom_resources)
 
         # Should select highest priority resource not in failed list
-        fallback = adapter._select_fallback_resource(["resource1"])
+        fallback = adapter._select_fallback_resource({"resource1"})
         assert fallback.name == "resource2"
 
 
@@ -170,7 +288,7 @@ class TestAzureExecution:
         self, mock_azure_available, mock_openai_response
     ):
         """Test successful execution."""
-        mock_azure, mock_cred, mock_token = mock_azure_available
+        mock_azure, mock_cred, mock_async_azure = mock_azure_available
 
         # Setup mock client
         mock_client = Mock()
@@ -201,7 +319,7 @@ class TestAzureExecution:
         self, mock_azure_available, mock_openai_response
     ):
         """Test execution with resource fallback."""
-        mock_azure, mock_cred, mock_token = mock_azure_available
+        mock_azure, mock_cred, mock_async_azure = mock_azure_available
 
         # First client fails
         mock_client1 = Mock()
@@ -240,6 +358,127 @@ class TestAzureExecution:
         assert response.is_success is True
         assert response.metadata["resource_name"] == "resource2"
 
+    def test_failover_reuses_messages(
+        self, mock_azure_available, mock_openai_response
+    ):
+        """Test every failover attempt sends the same prebuilt messages."""
+        mock_client1 = Mock()
+        mock_client1.chat.completions.create.side_effect = Exception("Resource error")
+        mock_client2 = Mock()
+        mock_client2.chat.completions.create.return_value = mock_openai_response
+
+        custom_resources = [
+            AzureResource(
+                name="resource1",
+                endpoint="https://r1.openai.azure.com",
+                resource_group="rg1",
+                models=["gpt-4o"],
+                priority=1,
+            ),
+            AzureResource(
+                name="resource2",
+                endpoint="https://r2.openai.azure.com",
+                resource_group="rg2",
+                models=["gpt-4o"],
+                priority=2,
+            ),
+        ]
+
+        adapter = AzureOpenAIAdapter(resources=custom_resources, preferred_model="gpt-4o")
+        adapter.clients["resource1"] = mock_client1
+        adapter.clients["resource2"] = mock_client2
+
+        adapter.execute("Test prompt", {"system": "Be brief."})
+
+        first = mock_client1.chat.completions.create.call_args.kwargs["messages"]
+        second = mock_client2.chat.completions.create.call_args.kwargs["messages"]
+        assert first is second
+        assert first == (
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": "Test prompt"},
+        )
+
+    @pytest.mark.parametrize("rate_limited", [True, False])
+    @patch("netrun.llm.adapters.azure_openai.time.sleep")
+    def test_backoff_only_after_rate_limit(
+        self, mock_sleep, rate_limited, mock_azure_available, mock_openai_response
+    ):
+        """Test failover waits with jittered backoff only after a rate limit."""
+        from netrun.llm.adapters import azure_openai
+
+        class Throttled(azure_openai.RateLimitError):
+            # The real SDK's __init__ requires response/body; skip it
+            def __init__(self, message):
+                Exception.__init__(self, message)
+
+        error_class = Throttled if rate_limited else Exception
+        mock_client1 = Mock()
+        mock_client1.chat.completions.create.side_effect = error_class("Throttled")
+        mock_client2 = Mock()
+        mock_client2.chat.completions.create.return_value = mock_openai_response
+
+        custom_resources = [
+            AzureResource(
+                name="resource1",
+                endpoint="https://r1.openai.azure.com",
+                resource_group="rg1",
+                models=["gpt-4o"],
+                priority=1,
+            ),
+            AzureResource(
+                name="resource2",
+                endpoint="https://r2.openai.azure.com",
+                resource_group="rg2",
+                models=["gpt-4o"],
+                priority=2,
+            ),
+        ]
+
+        adapter = AzureOpenAIAdapter(resources=custom_resources, preferred_model="gpt-4o")
+        adapter.clients["resource1"] = mock_client1
+        adapter.clients["resource2"] = mock_client2
+
+        response = adapter.execute("Test prompt")
+
+        assert response.is_success is True
+        if rate_limited:
+            mock_sleep.assert_called_once()
+            assert 0 <= mock_sleep.call_args[0][0] <= 0.5  # base * 2**1
+        else:
+            mock_sleep.assert_not_called()
+
+    def test_execute_unsupported_model_short_circuits(
+        self, mock_azure_available, mock_openai_response
+    ):
+        """Test an unserved model errors without calling any resource."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        custom_resources = [
+            AzureResource(
+                name="test-resource",
+                endpoint="https://test.openai.azure.com",
+                resource_group="test-rg",
+                models=["gpt-4-turbo"],
+                priority=1,
+            ),
+        ]
+
+        adapter = AzureOpenAIAdapter(resources=custom_resources, preferred_model="gpt-4o")
+        adapter.clients["test-resource"] = mock_client
+
+        response = adapter.execute("Test prompt")
+
+        assert response.is_success is False
+        assert response.error == "No resource supports model gpt-4o"
+        mock_client.chat.completions.create.assert_not_called()
+
+        # Opting in restores failover to another resource's model
+        response = adapter.execute("Test prompt", {"allow_model_substitution": True})
+
+        assert response.is_success is True
+        assert response.model_used == "gpt-4-turbo"
+
     def test_execute_with_circuit_breaker_open(self, mock_azure_available):
         """Test execution when circuit breaker is open."""
         # Note: AzureOpenAIAdapter doesn't accept circuit_breaker_threshold in __init__
@@ -268,6 +507,204 @@ class TestAzureExecution:
         assert "disabled" in response.error.lower()
 
 
+class TestAzureAsyncExecution:
+    """Test Azure OpenAI execute_async with async clients."""
+
+    @staticmethod
+    def _resources():
+        return [
+            AzureResource(
+                name="resource1",
+                endpoint="https://r1.openai.azure.com",
+                resource_group="rg1",
+                models=["gpt-4o"],
+                priority=1,
+            ),
+            AzureResource(
+                name="resource2",
+                endpoint="https://r2.openai.azure.com",
+                resource_group="rg2",
+                models=["gpt-4o"],
+                priority=2,
+            ),
+        ]
+
+    @staticmethod
+    def _async_client(content="Test response", delay=0.0, error=None):
+        async def create(**kwargs):
+            await asyncio.sleep(delay)
+            if error is not None:
+                raise error
+            response = Mock()
+            response.choices = [Mock(message=Mock(content=content))]
+            response.usage = Mock(prompt_tokens=100, completion_tokens=200)
+            return response
+
+        client = Mock()
+        client.chat.completions.create = AsyncMock(side_effect=create)
+        return client
+
+    async def test_execute_async_with_fallback(self, mock_azure_available):
+        """Test async failover moves to the next resource on error."""
+        adapter = AzureOpenAIAdapter(resources=self._resources())
+        adapter.async_clients = {
+            "resource1": self._async_client(error=Exception("Resource error")),
+            "resource2": self._async_client(content="Fallback response"),
+        }
+
+        response = await adapter.execute_async("Test prompt")
+
+        assert response.is_success is True
+        assert response.content == "Fallback response"
+        assert response.metadata["resource_name"] == "resource2"
+        assert adapter._health["resource1"].failure == 1
+
+    async def test_execute_async_hedged(self, mock_azure_available):
+        """Test a slow resource is raced by the next one after hedge_delay."""
+        adapter = AzureOpenAIAdapter(resources=self._resources(), hedge_delay=0.01)
+        slow = self._async_client(content="Slow response", delay=5.0)
+        adapter.async_clients = {
+            "resource1": slow,
+            "resource2": self._async_client(content="Hedged response"),
+        }
+
+        response = await asyncio.wait_for(adapter.execute_async("Test prompt"), 1.0)
+
+        assert response.content == "Hedged response"
+        # The losing request was cancelled, not counted as a failure
+        assert adapter._health["resource1"].failure == 0
+
+    async def test_execute_async_all_resources_fail(self, mock_azure_available):
+        """Test an error response once every resource has failed."""
+        adapter = AzureOpenAIAdapter(resources=self._resources())
+        adapter.async_clients = {
+            name: self._async_client(error=Exception("down"))
+            for name in ("resource1", "resource2")
+        }
+
+        response = await adapter.execute_async("Test prompt")
+
+        assert response.is_success is False
+        assert "failed after 2 attempts" in response.error
+
+    async def test_execute_async_uses_sync_client_off_loop(
+        self, mock_azure_available
+    ):
+        """Test resources without an async client run the sync client in an executor."""
+        adapter = AzureOpenAIAdapter(resources=self._resources()[:1])
+        adapter.async_clients = {}
+        sync_client = Mock()
+        sync_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="Sync response"))],
+            usage=Mock(prompt_tokens=10, completion_tokens=20),
+        )
+        adapter.clients["resource1"] = sync_client
+
+        response = await adapter.execute_async("Test prompt")
+
+        assert response.content == "Sync response"
+
+
+class TestAzureResourceBreaker:
+    """Test the per-resource circuit breaker."""
+
+    def test_breaker_opens_then_probes_once(self):
+        """Test the breaker opens at the threshold and allows one probe per window."""
+        breaker = _ResourceBreaker(threshold=3, timeout=60.0)
+
+        for _ in range(3):
+            assert breaker.allow_request() is True
+            breaker.on_failure()
+        assert breaker.state == "open"
+        assert breaker.allow_request() is False
+
+        breaker.next_attempt_time = time.monotonic() - 1  # Timeout elapsed
+        assert breaker.allow_request() is True
+        assert breaker.state == "half_open"
+        assert breaker.allow_request() is False  # Probe already out
+
+        breaker.on_success()
+        assert breaker.state == "closed"
+        assert breaker.allow_request() is True
+
+    def test_failed_probe_reopens(self):
+        """Test a failed half-open probe re-opens the breaker."""
+        breaker = _ResourceBreaker(threshold=3, timeout=60.0)
+        breaker.state = "half_open"
+
+        breaker.on_failure()
+
+        assert breaker.state == "open"
+        assert breaker.allow_request() is False
+
+    def test_open_resource_skipped(self, mock_azure_available):
+        """Test resources with an open breaker are not selected."""
+        custom_resources = [
+            AzureResource(
+                name="resource1",
+                endpoint="https://r1.openai.azure.com",
+                resource_group="rg1",
+                models=["gpt-4o"],
+                priority=1,
+            ),
+            AzureResource(
+                name="resource2",
+                endpoint="https://r2.openai.azure.com",
+                resource_group="rg2",
+                models=["gpt-4o"],
+                priority=2,
+            ),
+        ]
+        adapter = AzureOpenAIAdapter(resources=custom_resources, preferred_model="gpt-4o")
+        failing_client = Mock()
+        failing_client.chat.completions.create.side_effect = Exception("down")
+        adapter.clients["resource1"] = failing_client
+        adapter.clients["resource2"] = failing_client
+
+        for _ in range(3):
+            adapter.execute("Test prompt")
+
+        assert adapter._resource_breaker["resource1"].state == "open"
+        assert adapter._get_resource_for_model("gpt-4o") is None
+        assert adapter._select_fallback_resource(set()) is None
+        assert adapter.get_metadata()["resource_health"]["resource1"]["breaker_state"] == "open"
+
+    def test_half_open_probe_claimed_once_across_threads(self, mock_azure_available):
+        """Test concurrent callers let only one half-open probe through."""
+        import threading
+
+        adapter = AzureOpenAIAdapter(
+            resources=[
+                AzureResource(
+                    name="resource1",
+                    endpoint="https://r1.openai.azure.com",
+                    resource_group="rg1",
+                    models=["gpt-4o"],
+                    priority=1,
+                )
+            ],
+            preferred_model="gpt-4o",
+        )
+        breaker = adapter._resource_breaker["resource1"]
+        breaker.state = "open"
+        breaker.next_attempt_time = time.monotonic() - 1  # Timeout elapsed
+        barrier = threading.Barrier(8)
+        selected = []
+
+        def select():
+            barrier.wait()
+            selected.append(adapter._get_resource_for_model("gpt-4o"))
+
+        threads = [threading.Thread(target=select) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(resource is not None for resource in selected) == 1
+        assert breaker.state == "half_open"
+
+
 class TestAzureCostCalculation:
     """Test Azure cost calculation."""
 
@@ -292,12 +729,12 @@ class TestAzureCostCalculation:
 class TestAzureAvailability:
     """Test Azure availability checking."""
 
-    @patch("netrun.llm.adapters.azure_openai.subprocess.run")
-    def test_check_availability_authenticated(
-        self, mock_run, mock_azure_available
-    ):
-        """Test availability when Azure CLI authenticated."""
-        mock_run.return_value = Mock(returncode=0)
+    def test_check_availability_authenticated(self, mock_azure_available):
+        """Test availability when the Azure credential can mint a token."""
+        mock_azure, mock_cred, mock_async_azure = mock_azure_available
+        mock_cred.return_value.get_token.return_value = Mock(
+            token="token", expires_on=time.time() + 3600
+        )
 
         custom_resources = [
             AzureResource(
@@ -316,12 +753,10 @@ class TestAzureAvailability:
 
         assert available is True
 
-    @patch("netrun.llm.adapters.azure_openai.subprocess.run")
-    def test_check_availability_not_authenticated(
-        self, mock_run, mock_azure_available
-    ):
-        """Test availability when Azure CLI not authenticated."""
-        mock_run.return_value = Mock(returncode=1)
+    def test_check_availability_not_authenticated(self, mock_azure_available):
+        """Test availability when the Azure credential cannot mint a token."""
+        mock_azure, mock_cred, mock_async_azure = mock_azure_available
+        mock_cred.return_value.get_token.side_effect = Exception("No credential")
 
         adapter = AzureOpenAIAdapter()
 
@@ -330,15 +765,63 @@ class TestAzureAvailability:
         assert available is False
 
     def test_check_availability_no_clients(self, mock_azure_available):
-        """Test availability when no clients initialized."""
+        """Test availability when no client can be built."""
         adapter = AzureOpenAIAdapter()
-        adapter.clients = {}
+        adapter.resources = []
 
         available = adapter.check_availability()
 
         assert available is False
 
 
+class TestAzureTokenCache:
+    """Test the in-process Azure AD token cache."""
+
+    def test_token_fetched_once_until_near_expiry(self):
+        """Test the credential is only consulted when the token is near expiry."""
+        credential = Mock()
+        credential.get_token.return_value = Mock(
+            token="token-1", expires_on=time.time() + 3600
+        )
+        provider = _CachedTokenProvider(credential)
+
+        assert provider.has_valid_token() is False
+        assert provider() == "token-1"
+        assert provider() == "token-1"
+        assert credential.get_token.call_count == 1
+
+        credential.get_token.return_value = Mock(
+            token="token-2", expires_on=time.time() + 3600
+        )
+        provider._cached = ("token-1", time.time() + 30)  # Inside refresh buffer
+
+        assert provider() == "token-2"
+        assert credential.get_token.call_count == 2
+
+    def test_cached_token_skips_credential(self, mock_azure_available):
+        """Test a valid cached token proves authentication without a token fetch."""
+        adapter = AzureOpenAIAdapter()
+        adapter.token_provider = Mock(has_valid_token=Mock(return_value=True))
+
+        assert adapter._verify_azure_auth() is True
+        adapter.token_provider.assert_not_called()
+
+    def test_failed_check_result_reused(self, mock_azure_available):
+        """Test a failing credential is only consulted once per TTL window."""
+        mock_azure, mock_cred, mock_async_azure = mock_azure_available
+        get_token = mock_cred.return_value.get_token
+        get_token.side_effect = Exception("No credential")
+        adapter = AzureOpenAIAdapter()
+
+        assert adapter.check_availability() is False
+        adapter.get_metadata()
+        assert get_token.call_count == 1
+
+        adapter._auth_check_cache = (time.monotonic() - 31, False)
+        adapter._verify_azure_auth()
+        assert get_token.call_count == 2
+
+
 class TestAzureMetadata:
     """Test Azure metadata retrieval."""
 
@@ -358,8 +841,8 @@ class TestAzureMetadata:
         adapter.clients["test-resource"] = Mock()
 
         # Record some metrics
-        adapter._resource_success_count["test-resource"] = 10
-        adapter._resource_failure_count["test-resource"] = 2
+        adapter._health["test-resource"].success = 10
+        adapter._health["test-resource"].failure = 2
 
         metadata = adapter.get_metadata()
 
@@ -386,8 +869,8 @@ class TestAzureMetadata:
 
         adapter = AzureOpenAIAdapter(resources=custom_resources)
 
-        adapter._resource_success_count["test-resource"] = 8
-        adapter._resource_failure_count["test-resource"] = 2
+        adapter._health["test-resource"].success = 8
+        adapter._health["test-resource"].failure = 2
 
         metadata = adapter.get_metadata()
 
@@ -395,3 +878,53 @@ class TestAzureMetadata:
         assert resource_health["success_count"] == 8
         assert resource_health["failure_count"] == 2
         assert resource_health["success_rate"] == 80.0
+        assert resource_health["last_used"] == "Never"
+
+    def test_get_metadata_last_used_formatted(self, mock_azure_available):
+        """Test last_used is rendered as local time to the second."""
+        custom_resources = [
+            AzureResource(
+                name="test-resource",
+                endpoint="https://test.openai.azure.com",
+                resource_group="test-rg",
+                models=["gpt-4o"],
+                priority=1,
+            ),
+        ]
+
+        adapter = AzureOpenAIAdapter(resources=custom_resources)
+        last_used = time.time()
+        adapter._health["test-resource"].last_used = last_used
+
+        metadata = adapter.get_metadata()
+
+        assert metadata["resource_health"]["test-resource"]["last_used"] == time.strftime(
+            "%Y-%m-%d %H:%M:%S", time.localtime(int(last_used))
+        )
+
+    def test_resource_counters_thread_safe(self, mock_azure_available):
+        """Test concurrent executes from worker threads don't lose counter updates."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        custom_resources = [
+            AzureResource(
+                name="test-resource",
+                endpoint="https://test.openai.azure.com",
+                resource_group="test-rg",
+                models=["gpt-4o"],
+                priority=1,
+            ),
+        ]
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="ok"))],
+            usage=Mock(prompt_tokens=1, completion_tokens=1),
+        )
+
+        adapter = AzureOpenAIAdapter(resources=custom_resources, preferred_model="gpt-4o")
+        adapter.clients["test-resource"] = mock_client
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: adapter.execute("Test prompt"), range(200)))
+
+        assert adapter.get_metadata()["resource_health"]["test-resource"]["success_count"] == 200
@@ -11,13 +11,20 @@ Tests cover:
     - Quota management
 """
 
+import gc
 import pytest
 import os
 import json
-from unittest.mock import Mock, patch, MagicMock, mock_open
+import time
+from unittest.mock import AsyncMock, Mock, patch, MagicMock, mock_open
 from pathlib import Path
 
-from netrun.llm.adapters.gemini import GeminiAdapter, FREE_TIER_DAILY_LIMIT, DEFAULT_MODEL
+from netrun.llm.adapters.gemini import (
+    GeminiAdapter,
+    FREE_TIER_DAILY_LIMIT,
+    DEFAULT_MODEL,
+    _flush_all_quotas,
+)
 from netrun.llm.adapters.base import LLMResponse, AdapterTier
 
 
@@ -28,6 +35,8 @@ def mock_gemini_available():
         with patch("netrun.llm.adapters.gemini.genai") as mock_genai:
             with patch("netrun.llm.adapters.gemini.GenerationConfig") as mock_config:
                 yield mock_genai, mock_config
+                # Write pending counts now so no flush timer fires in a later test
+                _flush_all_quotas()
 
 
 class TestGeminiAdapterInitialization:
@@ -120,6 +129,68 @@ class TestGeminiQuotaTracking:
         # Should reset to 0 because date is old
         assert adapter.quota_data["requests_today"] == 0
 
+    def test_corrupted_quota_file_resets(self, mock_gemini_available, tmp_path):
+        """Test an unreadable quota file starts a fresh count."""
+        quota_file = tmp_path / "quota.json"
+        quota_file.write_text("{not json")
+
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+
+        assert adapter.quota_data["requests_today"] == 0
+
+    def test_save_quota_data_is_atomic(self, mock_gemini_available, tmp_path):
+        """Test quota is written through a temp file that is renamed into place."""
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+        adapter.quota_data["requests_today"] = 42
+
+        with patch("netrun.llm.adapters.gemini.os.replace", wraps=os.replace) as mock_replace:
+            adapter._save_quota_data()
+
+        tmp_file, target = mock_replace.call_args.args
+        assert Path(tmp_file).parent == tmp_path
+        assert Path(tmp_file).name.startswith("quota.json.")
+        assert target == quota_file
+        assert json.loads(quota_file.read_text())["requests_today"] == 42
+        assert list(tmp_path.iterdir()) == [quota_file]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+    def test_save_quota_data_keeps_file_mode(self, mock_gemini_available, tmp_path):
+        """Test saving keeps the quota file's mode, or the umask default for a new file."""
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+        with patch("netrun.llm.adapters.gemini._UMASK", 0o027):
+            adapter._save_quota_data()
+            assert quota_file.stat().st_mode & 0o777 == 0o640
+
+            quota_file.chmod(0o664)
+            adapter._save_quota_data()
+            assert quota_file.stat().st_mode & 0o777 == 0o664
+
+    def test_save_quota_data_failure_removes_temp_file(self, mock_gemini_available, tmp_path):
+        """Test a failed save leaves the old file and no temp file behind."""
+        quota_file = tmp_path / "quota.json"
+        quota_file.write_text(json.dumps({"date": "2024-01-01", "requests_today": 7}))
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+
+        with patch("netrun.llm.adapters.gemini.os.replace", side_effect=OSError("busy")):
+            adapter._save_quota_data()
+
+        assert json.loads(quota_file.read_text())["requests_today"] == 7
+        assert list(tmp_path.iterdir()) == [quota_file]
+
     def test_check_quota_allows_request(self, mock_gemini_available, tmp_path):
         """Test quota check allows request under limit."""
         quota_file = tmp_path / "quota.json"
@@ -138,10 +209,8 @@ class TestGeminiQuotaTracking:
     ):
         """Test quota check blocks when limit reached or exceeded.
 
-        Implementation: _check_quota() reloads quota_data from file (line 179),
-        then returns True if requests_today < limit (line 181).
-        So when requests_today == limit (1500), the check 1500 < 1500 = False (blocked).
-        Must save to file for changes to persist.
+        Implementation: _check_quota() returns True if requests_today < limit,
+        so when requests_today == limit (1500), the check 1500 < 1500 = False (blocked).
         """
         quota_file = tmp_path / "quota.json"
         adapter = GeminiAdapter(
@@ -193,6 +262,174 @@ class TestGeminiQuotaTracking:
 
         assert adapter.quota_data["requests_today"] == initial_count + 1
 
+    def test_increment_quota_flushes_on_interval(self, mock_gemini_available, tmp_path):
+        """Test increments stay in memory until the flush interval elapses."""
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+
+        adapter._increment_quota()
+        adapter._increment_quota()
+        assert not quota_file.exists()
+
+        adapter._last_flush -= adapter._flush_interval + 1
+        adapter._increment_quota()
+
+        assert json.loads(quota_file.read_text())["requests_today"] == 3
+        assert adapter._quota_dirty is False
+
+    def test_pending_quota_flushed_at_exit(self, mock_gemini_available, tmp_path):
+        """Test the exit hook writes quota counts not yet flushed."""
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+        adapter._increment_quota()
+
+        _flush_all_quotas()
+
+        assert json.loads(quota_file.read_text())["requests_today"] == 1
+
+    def test_pending_quota_survives_deleted_adapter(
+        self, mock_gemini_available, tmp_path
+    ):
+        """Test counts of a deleted adapter are still written."""
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+        adapter._increment_quota()
+        adapter._increment_quota()
+
+        del adapter
+        gc.collect()
+        _flush_all_quotas()
+
+        reloaded = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+        assert reloaded.quota_data["requests_today"] == 2
+
+    def test_pending_quota_flushed_by_timer(self, mock_gemini_available, tmp_path):
+        """Test quiet adapters write pending counts once the interval passes."""
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+        adapter._flush_interval = 0.05
+        adapter._last_flush = time.monotonic()
+        adapter._increment_quota()
+
+        deadline = time.monotonic() + 2.0
+        while not quota_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert json.loads(quota_file.read_text())["requests_today"] == 1
+        assert adapter._flush_timer is None
+
+    def test_multi_process_reads_and_writes_through(
+        self, mock_gemini_available, tmp_path
+    ):
+        """Test multi-process mode shares counts through the quota file."""
+        quota_file = tmp_path / "quota.json"
+        first = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+            multi_process=True,
+        )
+        second = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+            multi_process=True,
+        )
+
+        first._increment_quota()
+        second._check_quota()
+
+        assert second.quota_data["requests_today"] == 1
+
+    def test_multi_process_from_env(self, mock_gemini_available, tmp_path, monkeypatch):
+        """Test GEMINI_MULTI_PROCESS enables multi-process mode."""
+        monkeypatch.setenv("GEMINI_MULTI_PROCESS", "true")
+
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(tmp_path / "quota.json"),
+        )
+
+        assert adapter._multi_process is True
+
+    def test_check_quota_rolls_over_in_memory(self, mock_gemini_available, tmp_path):
+        """Test the counter resets on a new day without rereading the file."""
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+        adapter.quota_data = {"date": "2024-01-01", "requests_today": FREE_TIER_DAILY_LIMIT}
+
+        assert adapter._check_quota() is True
+        assert adapter.quota_data["requests_today"] == 0
+
+
+class TestGeminiDateCache:
+    """Test the cached local date used for quota rollover."""
+
+    def test_today_matches_local_date(self):
+        """Test the cached date is today's local date."""
+        from datetime import datetime
+        from netrun.llm.adapters import gemini
+
+        gemini._date_cache = ("", 0.0)
+
+        assert gemini._today() == datetime.now().strftime("%Y-%m-%d")
+        assert gemini._date_cache[1] > time.time()
+
+    def test_today_reused_until_midnight(self):
+        """Test the date is only reformatted once the cached day has ended."""
+        from netrun.llm.adapters import gemini
+
+        gemini._date_cache = ("1999-12-31", time.time() + 60)
+        assert gemini._today() == "1999-12-31"
+
+        gemini._date_cache = ("1999-12-31", time.time() - 1)
+        assert gemini._today() != "1999-12-31"
+
+
+class TestGeminiErrorMessages:
+    """Test exception message extraction for error responses."""
+
+    def test_fast_exc_str_prefers_message_attribute(self):
+        """Test SDK-style .message is used over the full __str__."""
+        from netrun.llm.adapters.gemini import _fast_exc_str
+
+        error = Exception("429 Quota exceeded [details...]")
+        error.message = "Quota exceeded"
+
+        assert _fast_exc_str(error) == "Quota exceeded"
+
+    def test_fast_exc_str_falls_back_to_args(self):
+        """Test plain exceptions use their first argument, or repr when empty."""
+        from netrun.llm.adapters.gemini import _fast_exc_str
+
+        assert _fast_exc_str(ValueError("bad input")) == "bad input"
+        assert _fast_exc_str(ValueError()) == "ValueError()"
+
+    def test_fast_exc_str_non_string_args_use_str(self):
+        """Test errno-style or non-string arguments fall back to str(error)."""
+        from netrun.llm.adapters.gemini import _fast_exc_str
+
+        error = ConnectionResetError(104, "Connection reset by peer")
+
+        assert _fast_exc_str(error) == "[Errno 104] Connection reset by peer"
+        assert _fast_exc_str(KeyError(3)) == "3"
+
 
 class TestGeminiExecution:
     """Test Gemini execute method."""
@@ -236,12 +473,103 @@ class TestGeminiExecution:
         # Verify quota incremented
         assert adapter.quota_data["requests_today"] == 1
 
+    async def test_execute_async_uses_native_async_call(
+        self, mock_gemini_available, tmp_path, mock_gemini_response
+    ):
+        """Test execute_async awaits generate_content_async instead of blocking."""
+        mock_genai, mock_config = mock_gemini_available
+
+        mock_model = Mock()
+        mock_model.generate_content_async = AsyncMock(return_value=mock_gemini_response)
+        mock_genai.GenerativeModel.return_value = mock_model
+
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+
+        response = await adapter.execute_async("Test prompt")
+
+        assert response.is_success is True
+        assert response.content == "This is a test response"
+        assert response.tokens_input == 100
+        mock_model.generate_content_async.assert_awaited_once()
+        mock_model.generate_content.assert_not_called()
+        assert adapter.quota_data["requests_today"] == 1
+
+    async def test_execute_async_error_mapping(self, mock_gemini_available, tmp_path):
+        """Test execute_async maps SDK errors like execute does."""
+        mock_genai, mock_config = mock_gemini_available
+
+        mock_model = Mock()
+        mock_model.generate_content_async = AsyncMock(side_effect=Exception("boom"))
+        mock_genai.GenerativeModel.return_value = mock_model
+
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+
+        response = await adapter.execute_async("Test prompt")
+
+        assert response.status == "error"
+        assert "boom" in response.error
+        assert adapter.quota_data["requests_today"] == 0
+
+    def test_execute_reuses_model_instance(
+        self, mock_gemini_available, tmp_path, mock_gemini_response
+    ):
+        """Test GenerativeModel is built once per model name."""
+        mock_genai, mock_config = mock_gemini_available
+        mock_genai.GenerativeModel.return_value.generate_content.return_value = (
+            mock_gemini_response
+        )
+
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+
+        adapter.execute("First prompt")
+        adapter.execute("Second prompt")
+        adapter.execute("Third prompt", {"model": "gemini-1.5-pro"})
+
+        assert mock_genai.GenerativeModel.call_count == 2
+
+    def test_execute_reuses_generation_config(
+        self, mock_gemini_available, tmp_path, mock_gemini_response
+    ):
+        """Test identical generation parameters share one GenerationConfig."""
+        from netrun.llm.adapters.gemini import _make_generation_config
+
+        mock_genai, mock_config = mock_gemini_available
+        model = mock_genai.GenerativeModel.return_value
+        model.generate_content.return_value = mock_gemini_response
+        _make_generation_config.cache_clear()
+
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+
+        adapter.execute("First prompt")
+        adapter.execute("Second prompt")
+        adapter.execute("Third prompt", {"temperature": 0.2})
+
+        assert mock_config.call_count == 2
+        configs = [c.kwargs["generation_config"] for c in model.generate_content.call_args_list]
+        assert configs[0] is configs[1]
+        _make_generation_config.cache_clear()
+
     def test_execute_quota_exceeded(self, mock_gemini_available, tmp_path):
         """Test execution when quota exceeded.
 
-        Implementation: execute() checks _check_quota() which reloads from file
-        and returns False when requests_today >= FREE_TIER_DAILY_LIMIT.
-        Must save to file for changes to persist.
+        Implementation: execute() checks _check_quota() which returns False
+        when requests_today >= FREE_TIER_DAILY_LIMIT.
         """
         quota_file = tmp_path / "quota.json"
         adapter = GeminiAdapter(
@@ -259,6 +587,59 @@ class TestGeminiExecution:
         assert response.status == "rate_limited"
         assert "quota exceeded" in response.error.lower()
 
+    @pytest.mark.parametrize(
+        "error_name, status, prefix",
+        [
+            ("ResourceExhausted", "rate_limited", "Rate limit or quota exceeded: "),
+            ("InvalidArgument", "error", "Invalid request: "),
+            ("Unauthenticated", "error", "Authentication error: "),
+            (None, "error", "Unexpected error: "),
+        ],
+    )
+    def test_execute_error_mapping(
+        self, mock_gemini_available, tmp_path, error_name, status, prefix
+    ):
+        """Test each SDK error maps to its status and message prefix."""
+        from netrun.llm.adapters.gemini import google_exceptions
+
+        mock_genai, mock_config = mock_gemini_available
+        error_type = getattr(google_exceptions, error_name) if error_name else RuntimeError
+        mock_genai.GenerativeModel.return_value.generate_content.side_effect = (
+            error_type("boom")
+        )
+
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+
+        response = adapter.execute("Test prompt")
+
+        assert response.status == status
+        assert response.error == prefix + "boom"
+        assert adapter._failure_count == 1
+
+    def test_execute_errno_style_error(self, mock_gemini_available, tmp_path):
+        """Test exceptions with a non-string first argument still yield an error response."""
+        mock_genai, mock_config = mock_gemini_available
+        mock_genai.GenerativeModel.return_value.generate_content.side_effect = (
+            ConnectionResetError(104, "Connection reset by peer")
+        )
+
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+
+        response = adapter.execute("Test prompt")
+
+        assert response.status == "error"
+        assert response.error.startswith("Unexpected error: ")
+        assert response.error == "Unexpected error: [Errno 104] Connection reset by peer"
+        assert adapter._failure_count == 1
+
     def test_execute_with_circuit_breaker_open(
         self, mock_gemini_available, tmp_path
     ):
@@ -314,7 +695,22 @@ class TestGeminiCostCalculation:
         cost = adapter._calculate_actual_cost("gemini-1.5-flash", 1000, 2000)
 
         # Expected: (1000/1M * $0.075) + (2000/1M * $0.30) = $0.000075 + $0.0006
-        assert cost > 0
+        assert cost == pytest.approx(0.000675)
+
+    def test_calculate_cost_unknown_model_uses_default(
+        self, mock_gemini_available, tmp_path
+    ):
+        """Test unknown models are priced like the default model."""
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            use_free_tier=False,
+            quota_file_path=str(quota_file),
+        )
+
+        assert adapter._calculate_actual_cost("gemini-unknown", 1000, 2000) == (
+            adapter._calculate_actual_cost(DEFAULT_MODEL, 1000, 2000)
+        )
 
     def test_estimate_cost_free_tier(self, mock_gemini_available, tmp_path):
         """Test cost estimation on free tier."""
@@ -348,9 +744,8 @@ class TestGeminiAvailability:
     ):
         """Test availability when quota exceeded.
 
-        Implementation: check_availability() calls _check_quota() which reloads
-        from file and returns True when requests_today < limit.
-        Must save to file for changes to persist.
+        Implementation: check_availability() calls _check_quota() which
+        returns True when requests_today < limit.
         """
         quota_file = tmp_path / "quota.json"
         adapter = GeminiAdapter(
@@ -364,6 +759,21 @@ class TestGeminiAvailability:
 
         assert adapter.check_availability() is False
 
+    def test_check_availability_skips_quota_reload(
+        self, mock_gemini_available, tmp_path
+    ):
+        """Test availability probes use the in-memory quota, even in multi-process mode."""
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+            multi_process=True,
+        )
+
+        with patch.object(adapter, "_load_quota_data") as mock_load:
+            assert adapter.check_availability() is True
+            mock_load.assert_not_called()
+
 
 class TestGeminiMetadata:
     """Test Gemini metadata retrieval."""
@@ -386,12 +796,28 @@ class TestGeminiMetadata:
         assert "quota" in metadata
         assert metadata["quota"]["daily_limit"] == FREE_TIER_DAILY_LIMIT
 
-    def test_get_quota_status_free_tier(self, mock_gemini_available, tmp_path):
-        """Test quota status on free tier.
+    def test_get_metadata_reflects_live_state(self, mock_gemini_available, tmp_path):
+        """Test counters track the adapter and callers can't alter later results."""
+        from netrun.llm.adapters.gemini import PRICING
 
-        Implementation: get_quota_status() reloads quota_data from file (line 459),
-        so setting adapter.quota_data directly won't persist unless we save it first.
-        """
+        quota_file = tmp_path / "quota.json"
+        adapter = GeminiAdapter(
+            api_key="test-key",
+            quota_file_path=str(quota_file),
+        )
+
+        first = adapter.get_metadata()
+        first["supported_models"].append("not-a-model")
+        adapter._record_success(100, 0.0)
+        second = adapter.get_metadata()
+
+        assert second["supported_models"] == list(PRICING.keys())
+        assert first["success_count"] == 0
+        assert second["success_count"] == 1
+        assert second["reliability_score"] == 1.0
+
+    def test_get_quota_status_free_tier(self, mock_gemini_available, tmp_path):
+        """Test quota status on free tier."""
         quota_file = tmp_path / "quota.json"
         adapter = GeminiAdapter(
             api_key="test-key",
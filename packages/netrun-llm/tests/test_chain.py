@@ -103,6 +103,26 @@ class TestLLMFallbackChain:
         assert chain.adapters[0].adapter_name == "Primary"
         assert chain.adapters[1].adapter_name == "Secondary"
 
+    def test_chain_skips_none_adapters(self):
+        """Test None entries (unavailable optional adapters) are dropped."""
+        chain = LLMFallbackChain(adapters=[None, MockAdapter("Primary"), None])
+
+        assert chain.adapters == (chain.get_adapter("Primary"),)
+
+    def test_chain_from_available(self):
+        """Test from_available instantiates only importable adapter classes."""
+        chain = LLMFallbackChain.from_available(
+            [
+                (None, {}),
+                (MockAdapter, {"name": "Primary"}),
+                (MockAdapter, {"name": "Secondary"}),
+            ],
+            log_fallbacks=False,
+        )
+
+        assert [a.adapter_name for a in chain.adapters] == ["Primary", "Secondary"]
+        assert chain.log_fallbacks is False
+
     def test_chain_executes_primary_on_success(self):
         """Test chain uses primary adapter when it succeeds."""
         primary = MockAdapter("Primary", response_content="Primary response")
@@ -9,6 +9,7 @@ Tests cover:
     - API key getters
 """
 
+import dataclasses
 import pytest
 import os
 from netrun.llm.config import (
@@ -173,6 +174,13 @@ class TestLLMConfigAPIKeyGetters:
 class TestLLMConfigFromEnv:
     """Test creating config from environment variables."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_env_config(self):
+        """Isolate tests from the cached from_env() configuration."""
+        LLMConfig.from_env.cache_clear()
+        yield
+        LLMConfig.from_env.cache_clear()
+
     def test_from_env_with_defaults(self):
         """Test from_env uses default values when env vars not set."""
         config = LLMConfig.from_env()
@@ -202,6 +210,26 @@ class TestLLMConfigFromEnv:
         assert config.request_timeout == 60
         assert config.max_retries == 5
 
+    def test_from_env_is_cached(self, monkeypatch):
+        """Test from_env returns one shared instance until reloaded."""
+        config = LLMConfig.from_env()
+        monkeypatch.setenv("LLM_DEFAULT_MODEL_OLLAMA", "mistral")
+
+        assert LLMConfig.from_env() is config
+        assert config.default_model_ollama == "llama3"
+
+        reloaded = LLMConfig.reload_from_env()
+
+        assert reloaded is LLMConfig.from_env()
+        assert reloaded.default_model_ollama == "mistral"
+
+    def test_config_is_frozen(self):
+        """Test a shared config cannot be mutated."""
+        config = LLMConfig.from_env()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.default_max_tokens = 1
+
 
 class TestLLMConfigValidation:
     """Test configuration validation."""
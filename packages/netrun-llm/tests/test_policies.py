@@ -12,10 +12,17 @@ Tests cover:
     - Fallback to local models
 """
 
+import asyncio
+import json
+import sys
+import time
+
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
+from pydantic import ValidationError
+
 from netrun.llm.policies import (
     ProviderPolicy,
     TenantPolicy,
@@ -24,11 +31,15 @@ from netrun.llm.policies import (
     CostTier,
     MODEL_COSTS,
     MODEL_COST_TIERS,
+    estimate_tokens,
+    pack_usage_batch,
+    unpack_usage_batch,
     PolicyViolationError,
     ProviderDisabledError,
     BudgetExceededError,
     RateLimitExceededError,
     FallbackToLocalError,
+    TokenBucket,
 )
 
 
@@ -90,6 +101,17 @@ class TestProviderPolicy:
 
         assert policy.enabled is False
 
+    def test_provider_policy_is_immutable(self):
+        """Test in-place changes fail loudly; policies are replaced instead."""
+        policy = ProviderPolicy(provider="openai")
+
+        with pytest.raises(ValidationError):
+            policy.enabled = False
+
+        disabled = policy.model_copy(update={"enabled": False})
+        assert disabled.enabled is False
+        assert policy.enabled is True
+
 
 class TestTenantPolicy:
     """Tests for TenantPolicy configuration."""
@@ -141,6 +163,18 @@ class TestTenantPolicy:
         with pytest.raises(ValueError, match="tenant_id cannot be empty"):
             TenantPolicy(tenant_id="   ")
 
+    def test_names_are_interned(self):
+        """Test tenant and provider names are interned at construction."""
+        tenant_id = "".join(["acme", "-corp"])
+        provider = "".join(["open", "ai"])
+        policy = TenantPolicy(
+            tenant_id=tenant_id,
+            provider_policies={provider: ProviderPolicy(provider="openai")},
+        )
+
+        assert policy.tenant_id is sys.intern("acme-corp")
+        assert next(iter(policy.provider_policies)) is sys.intern("openai")
+
 
 class TestPolicyEnforcer:
     """Tests for PolicyEnforcer validation and tracking."""
@@ -434,6 +468,100 @@ class TestPolicyEnforcer:
             reason="Customer support chatbot",
         )
 
+    def test_reload_policy(self):
+        """Test policy changes apply after reload_policy()."""
+        policy = TenantPolicy(tenant_id="test")
+        enforcer = PolicyEnforcer(policy)
+
+        enforcer.validate_request(
+            provider="openai",
+            model="gpt-4o",
+            estimated_tokens=1000,
+        )
+
+        policy.provider_policies["openai"] = ProviderPolicy(
+            provider="openai",
+            allowed_models=["gpt-4o-mini"],
+        )
+        enforcer.reload_policy()
+
+        with pytest.raises(PolicyViolationError, match="not in allowed list"):
+            enforcer.validate_request(
+                provider="openai",
+                model="gpt-4o",
+                estimated_tokens=1000,
+            )
+
+        policy.daily_budget_usd = 0.0001
+        policy.fallback_to_local = False
+        enforcer.reload_policy()
+
+        with pytest.raises(BudgetExceededError, match="Daily budget"):
+            enforcer.validate_request(
+                provider="openai",
+                model="gpt-4o-mini",
+                estimated_tokens=1000,
+            )
+
+    def test_replaced_provider_policy_applies_without_reload(self):
+        """Test replacing a provider policy takes effect on the next request."""
+        policy = TenantPolicy(tenant_id="test")
+        enforcer = PolicyEnforcer(policy)
+
+        enforcer.validate_request(
+            provider="openai",
+            model="gpt-4o-mini",
+            estimated_tokens=1000,
+        )
+
+        policy.provider_policies["openai"] = ProviderPolicy(provider="openai", enabled=False)
+
+        with pytest.raises(ProviderDisabledError):
+            enforcer.validate_request(
+                provider="openai",
+                model="gpt-4o-mini",
+                estimated_tokens=1000,
+            )
+
+        policy.provider_policies["openai"] = policy.provider_policies["openai"].model_copy(
+            update={"enabled": True, "allowed_models": ["gpt-4o"]}
+        )
+
+        with pytest.raises(PolicyViolationError, match="not in allowed list"):
+            enforcer.validate_request(
+                provider="openai",
+                model="gpt-4o-mini",
+                estimated_tokens=1000,
+            )
+
+        del policy.provider_policies["openai"]
+
+        enforcer.validate_request(
+            provider="openai",
+            model="gpt-4o-mini",
+            estimated_tokens=1000,
+        )
+
+    def test_budget_change_applies_without_reload(self):
+        """Test budget limits are read from the policy on every request."""
+        policy = TenantPolicy(tenant_id="test", fallback_to_local=False)
+        enforcer = PolicyEnforcer(policy)
+
+        enforcer.validate_request(
+            provider="openai",
+            model="gpt-4o-mini",
+            estimated_tokens=1000,
+        )
+
+        policy.monthly_budget_usd = 0.0
+
+        with pytest.raises(BudgetExceededError, match="Monthly budget"):
+            enforcer.validate_request(
+                provider="openai",
+                model="gpt-4o-mini",
+                estimated_tokens=1000,
+            )
+
     def test_rate_limit_rpm(self):
         """Test requests per minute rate limiting."""
         openai_policy = ProviderPolicy(
@@ -501,6 +629,16 @@ class TestPolicyEnforcer:
             )
 
 
+    def test_token_bucket_refill(self):
+        """Test token bucket refills at its per-minute rate."""
+        bucket = TokenBucket(per_minute=60, now=0.0)
+
+        assert bucket.try_consume(60, now=0.0)
+        assert not bucket.try_consume(1, now=0.5)
+        assert bucket.try_consume(1, now=1.5)  # 1.5 tokens accrued
+        bucket.refill(now=1000.0)
+        assert bucket.tokens == 60.0  # Capped at capacity
+
 class TestCostEstimation:
     """Tests for cost estimation."""
 
@@ -546,6 +684,14 @@ class TestCostEstimation:
         assert cost == 0.0
 
 
+    def test_estimate_tokens(self):
+        """Test byte-based token estimation (input + output)."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 2
+        assert estimate_tokens("abcde") == 4
+        # Multi-byte characters count by UTF-8 length
+        assert estimate_tokens("\u00e9\u00e9") == 2
+
 class TestUsageTracking:
     """Tests for usage tracking and reporting."""
 
@@ -579,6 +725,133 @@ class TestUsageTracking:
         assert record.success is True
         assert record.reason == "Test request"
 
+    def test_usage_record_is_immutable(self):
+        """Test usage records cannot be modified after creation."""
+        policy = TenantPolicy(tenant_id="test")
+        enforcer = PolicyEnforcer(policy)
+        enforcer.record_usage(
+            provider="openai",
+            model="gpt-4o-mini",
+            tokens_input=500,
+            tokens_output=300,
+            cost_usd=0.0005,
+            latency_ms=1200,
+            success=True,
+        )
+
+        record = enforcer.usage_records[0]
+        with pytest.raises(ValidationError):
+            record.cost_usd = 0.0
+        assert hash(record) == hash(record)
+
+    def test_usage_log_round_trip(self):
+        """Test records appended to the usage log read back unchanged."""
+        enforcer = PolicyEnforcer(TenantPolicy(tenant_id="test"))
+        old = UsageRecord(
+            timestamp=datetime.utcnow() - timedelta(days=45),
+            tenant_id="test",
+            provider="anthropic",
+            model="claude-3-haiku",
+            tokens_input=100,
+            tokens_output=50,
+            tokens_total=150,
+            cost_usd=0.0002,
+            latency_ms=500,
+            success=False,
+            reason="Backfill",
+        )
+
+        enforcer.usage_records.append(old)
+        enforcer.record_usage(
+            provider="openai",
+            model="gpt-4o-mini",
+            tokens_input=500,
+            tokens_output=300,
+            cost_usd=0.0005,
+            latency_ms=1200,
+            success=True,
+        )
+
+        assert enforcer.usage_records[0] == old
+        assert enforcer.usage_records[-1].reason is None
+        assert [r.provider for r in enforcer.usage_records] == ["anthropic", "openai"]
+        assert enforcer.get_usage_report(days=60)["total_requests"] == 2
+        assert enforcer.get_usage_report(days=30)["total_requests"] == 1
+
+    def test_usage_report_period_boundary(self, monkeypatch):
+        """Test a record exactly ``days`` days old falls outside the period."""
+        from netrun.llm import policies
+
+        enforcer = PolicyEnforcer(TenantPolicy(tenant_id="test"))
+        now = time.time()
+        for age in (7, 0):
+            monkeypatch.setattr(policies.time, "time", lambda age=age: now - age * 86400)
+            enforcer.record_usage(
+                provider="openai",
+                model="gpt-4o-mini",
+                tokens_input=100,
+                tokens_output=50,
+                cost_usd=0.001,
+                latency_ms=500,
+                success=True,
+            )
+        monkeypatch.setattr(policies.time, "time", lambda: now)
+        enforcer.usage_records.append(
+            UsageRecord(
+                timestamp=datetime.utcfromtimestamp(now) - timedelta(days=45),
+                tenant_id="test",
+                provider="anthropic",
+                model="claude-3-haiku",
+                tokens_input=100,
+                tokens_output=50,
+                tokens_total=150,
+                cost_usd=0.0002,
+                latency_ms=500,
+                success=True,
+            )
+        )
+
+        assert enforcer.get_usage_report(days=1)["total_requests"] == 1
+        assert enforcer.get_usage_report(days=7)["total_requests"] == 1
+        assert enforcer.get_usage_report(days=8)["total_requests"] == 2
+        assert enforcer.get_usage_report(days=45)["total_requests"] == 2
+        assert enforcer.get_usage_report(days=46)["total_requests"] == 3
+
+    def test_usage_log_rollup_matches_python_loop(self, monkeypatch):
+        """Test the numpy rollup matches the plain Python one."""
+        pytest.importorskip("numpy")
+        from netrun.llm import policies
+
+        enforcer = PolicyEnforcer(TenantPolicy(tenant_id="test"))
+        for i, (provider, model) in enumerate(
+            [("openai", "gpt-4o-mini"), ("anthropic", "claude-3-haiku"), ("openai", "gpt-4o")] * 3
+        ):
+            enforcer.record_usage(
+                provider=provider,
+                model=model,
+                tokens_input=100 * i,
+                tokens_output=50,
+                cost_usd=0.001 * i,
+                latency_ms=500 + i,
+                success=i % 4 != 0,
+            )
+        first_day = datetime.utcnow().date().toordinal() - 60
+
+        rollup = enforcer.usage_records.rollup_since(first_day)
+        monkeypatch.setattr(policies, "_np", None)
+        expected = enforcer.usage_records.rollup_since(first_day)
+
+        assert rollup.requests == expected.requests == 9
+        assert rollup.tokens == expected.tokens
+        assert rollup.cost_usd == pytest.approx(expected.cost_usd)
+        for groups, expected_groups in (
+            (rollup.by_provider, expected.by_provider),
+            (rollup.by_model, expected.by_model),
+        ):
+            assert groups.keys() == expected_groups.keys()
+            for name, stats in expected_groups.items():
+                assert groups[name] == pytest.approx(stats)
+
     def test_usage_tracking_disabled(self):
         """Test usage tracking can be disabled."""
         policy = TenantPolicy(tenant_id="test", track_usage=False)
@@ -670,6 +943,59 @@ class TestUsageTracking:
         assert report["budget_remaining_usd"] == pytest.approx(99.981)
         assert report["budget_used_pct"] == pytest.approx(0.019)
 
+    def test_usage_report_per_provider_averages(self):
+        """Test latency and success rate are aggregated per provider."""
+        policy = TenantPolicy(tenant_id="test")
+        enforcer = PolicyEnforcer(policy)
+
+        for provider, model, latency, success in [
+            ("openai", "gpt-4o-mini", 1000, True),
+            ("openai", "gpt-4o-mini", 2000, False),
+            ("anthropic", "claude-3-5-sonnet", 500, True),
+        ]:
+            enforcer.record_usage(
+                provider=provider,
+                model=model,
+                tokens_input=100,
+                tokens_output=100,
+                cost_usd=0.001,
+                latency_ms=latency,
+                success=success,
+            )
+
+        report = enforcer.get_usage_report(days=30)
+
+        assert report["by_provider"]["openai"]["avg_latency_ms"] == 1500
+        assert report["by_provider"]["openai"]["success_rate"] == 50.0
+        assert report["by_provider"]["anthropic"]["avg_latency_ms"] == 500
+        assert report["by_provider"]["anthropic"]["success_rate"] == 100.0
+        assert report["by_model"]["gpt-4o-mini"]["tokens"] == 400
+
+        # Periods beyond the retained daily rollups aggregate the raw records
+        assert enforcer.get_usage_report(days=90)["by_provider"] == report["by_provider"]
+
+    def test_usage_report_json_cached_until_usage(self):
+        """Test the serialized report is reused until usage is recorded."""
+        enforcer = PolicyEnforcer(TenantPolicy(tenant_id="test"))
+        usage = dict(
+            provider="openai",
+            model="gpt-4o-mini",
+            tokens_input=500,
+            tokens_output=300,
+            cost_usd=0.001,
+            latency_ms=1000,
+            success=True,
+        )
+        enforcer.record_usage(**usage)
+
+        first = enforcer.get_usage_report_json(ttl=60.0)
+        assert json.loads(first) == enforcer.get_usage_report()
+        assert enforcer.get_usage_report_json(ttl=60.0) is first
+
+        enforcer.record_usage(**usage)
+
+        assert json.loads(enforcer.get_usage_report_json(ttl=60.0))["total_requests"] == 2
+
     def test_daily_budget_reset(self):
         """Test daily budget resets at midnight."""
         policy = TenantPolicy(
@@ -693,11 +1019,32 @@ class TestUsageTracking:
         assert enforcer._daily_spend == 5.0
 
         # Simulate day change
-        enforcer._last_daily_reset = (datetime.utcnow() - timedelta(days=1)).date()
+        enforcer._day_idx -= 1
         enforcer._reset_daily_budget_if_needed()
 
         assert enforcer._daily_spend == 0.0
 
+    def test_daily_budget_reset_on_record(self):
+        """Test the first usage recorded on a new day starts a fresh daily total."""
+        policy = TenantPolicy(tenant_id="test", daily_budget_usd=10.0)
+        enforcer = PolicyEnforcer(policy)
+        usage = dict(
+            provider="openai",
+            model="gpt-4o-mini",
+            tokens_input=500,
+            tokens_output=300,
+            cost_usd=5.0,
+            latency_ms=1000,
+            success=True,
+        )
+        enforcer.record_usage(**usage)
+
+        enforcer._day_idx -= 1
+        enforcer.record_usage(**usage)
+
+        assert enforcer._daily_spend == 5.0
+        assert enforcer._monthly_spend == 10.0
+
     def test_monthly_budget_reset(self):
         """Test manual monthly budget reset."""
         policy = TenantPolicy(tenant_id="test", monthly_budget_usd=100.0)
@@ -722,6 +1069,203 @@ class TestUsageTracking:
         assert enforcer._monthly_spend == 0.0
 
 
+class TestUsageReservation:
+    """Tests for the enforcer.request() validate/reserve/commit flow."""
+
+    def test_commit_records_usage(self):
+        """Test committing a reservation records the actual usage."""
+        enforcer = PolicyEnforcer(TenantPolicy(tenant_id="test"))
+
+        with enforcer.request("openai", "gpt-4o-mini", 1000, reason="Test") as usage:
+            assert enforcer._reserved_spend == pytest.approx(usage.reserved_usd)
+            usage.commit(cost_usd=0.002, tokens_input=600, tokens_output=400, latency_ms=900)
+
+        assert enforcer._reserved_spend == 0.0
+        assert enforcer._monthly_spend == pytest.approx(0.002)
+        record = enforcer.usage_records[0]
+        assert record.reason == "Test"
+        assert record.tokens_total == 1000
+
+    def test_reservation_counts_against_budget(self):
+        """Test concurrent requests cannot all pass on the same budget headroom."""
+        policy = TenantPolicy(tenant_id="test", monthly_budget_usd=0.1, fallback_to_local=False)
+        enforcer = PolicyEnforcer(policy)
+
+        # ~$0.066 estimated: one fits within $0.10, two do not
+        with enforcer.request("anthropic", "claude-3-opus", 2000):
+            with pytest.raises(BudgetExceededError, match="Monthly budget"):
+                with enforcer.request("anthropic", "claude-3-opus", 2000):
+                    pass
+
+        # Reservation released without usage being recorded
+        enforcer.validate_request("anthropic", "claude-3-opus", 2000)
+
+    def test_reservation_released_on_error(self):
+        """Test the reservation is refunded when the request fails."""
+        enforcer = PolicyEnforcer(TenantPolicy(tenant_id="test"))
+
+        with pytest.raises(ValueError):
+            with enforcer.request("openai", "gpt-4o-mini", 1000):
+                raise ValueError("provider error")
+
+        assert enforcer._reserved_spend == 0.0
+        assert enforcer.usage_records == []
+
+    async def test_reserve_across_tasks(self):
+        """Test a reservation can be committed by another task."""
+        policy = TenantPolicy(tenant_id="test", monthly_budget_usd=0.1, fallback_to_local=False)
+        enforcer = PolicyEnforcer(policy)
+
+        reservation = enforcer.reserve("anthropic", "claude-3-opus", 2000)
+        with pytest.raises(BudgetExceededError):
+            enforcer.reserve("anthropic", "claude-3-opus", 2000)
+
+        async def finish():
+            reservation.commit(cost_usd=0.01, tokens_input=1000, tokens_output=1000, latency_ms=800)
+
+        await asyncio.create_task(finish())
+
+        assert enforcer._reserved_spend == 0.0
+        assert enforcer._monthly_spend == pytest.approx(0.01)
+        with pytest.raises(RuntimeError, match="already committed"):
+            reservation.commit(cost_usd=0.01, tokens_input=1000, tokens_output=1000, latency_ms=800)
+
+
+class TestUsagePersistence:
+    """Tests for batched usage persistence through a usage sink."""
+
+    @staticmethod
+    def _record(enforcer, cost_usd=0.001):
+        return enforcer.enqueue_usage(
+            provider="openai",
+            model="gpt-4o-mini",
+            tokens_input=500,
+            tokens_output=300,
+            cost_usd=cost_usd,
+            latency_ms=1000,
+            success=True,
+        )
+
+    async def test_usage_flushed_in_batches(self):
+        """Test queued usage reaches the sink in batches on drain."""
+        batches = []
+        policy = TenantPolicy(tenant_id="test", monthly_budget_usd=100.0)
+        enforcer = PolicyEnforcer(
+            policy,
+            usage_sink=batches.append,
+            usage_batch_size=2,
+            usage_flush_interval=60.0,
+        )
+
+        for _ in range(3):
+            await self._record(enforcer)
+
+        # Spend is tracked immediately, independent of persistence
+        assert enforcer._monthly_spend == pytest.approx(0.003)
+
+        await enforcer.drain()
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert all(record.tenant_id == "test" for batch in batches for record in batch)
+
+    async def test_async_sink(self):
+        """Test an async sink is awaited."""
+        persisted = []
+
+        async def sink(records):
+            persisted.extend(records)
+
+        enforcer = PolicyEnforcer(TenantPolicy(tenant_id="test"), usage_sink=sink)
+        await self._record(enforcer)
+        await enforcer.drain()
+
+        assert len(persisted) == 1
+
+    def test_enforcer_used_across_event_loops(self):
+        """Test an enforcer built outside a loop flushes under successive asyncio.run calls."""
+        batches = []
+        enforcer = PolicyEnforcer(
+            TenantPolicy(tenant_id="test"),
+            usage_sink=batches.append,
+            usage_flush_interval=0.01,
+        )
+
+        async def run():
+            await self._record(enforcer)
+            await asyncio.sleep(0.05)
+            await enforcer.drain()
+
+        asyncio.run(run())
+        asyncio.run(run())
+
+        assert sum(len(batch) for batch in batches) == 2
+
+    def test_flush_task_restarted_after_loop_ends(self):
+        """Test a loop closed without drain() doesn't strand queued usage."""
+        batches = []
+        enforcer = PolicyEnforcer(
+            TenantPolicy(tenant_id="test"),
+            usage_sink=batches.append,
+            usage_flush_interval=60.0,
+        )
+
+        async def record_only():
+            await self._record(enforcer)
+
+        async def record_and_drain():
+            await self._record(enforcer)
+            # The first loop's (cancelled) task is replaced on this loop
+            assert enforcer._flush_task.get_loop() is asyncio.get_running_loop()
+            await enforcer.drain()
+
+        asyncio.run(record_only())
+        asyncio.run(record_and_drain())
+
+        assert sum(len(batch) for batch in batches) == 2
+        assert not enforcer._pending_usage
+
+    async def test_overflow_is_counted(self):
+        """Test records beyond max_pending_usage are dropped and counted."""
+        batches = []
+        enforcer = PolicyEnforcer(
+            TenantPolicy(tenant_id="test"),
+            usage_sink=batches.append,
+            max_pending_usage=1,
+        )
+
+        await self._record(enforcer)
+        await self._record(enforcer)
+        await enforcer.drain()
+
+        assert enforcer.dropped_usage == 1
+        assert sum(len(batch) for batch in batches) == 1
+        assert len(enforcer.usage_records) == 2
+
+    def test_pack_usage_batch_round_trip(self):
+        """Test a packed batch unpacks to the same records."""
+        records = [
+            UsageRecord(
+                tenant_id="test",
+                provider="openai",
+                model="gpt-4o-mini",
+                tokens_input=500 + i,
+                tokens_output=300,
+                tokens_total=800 + i,
+                cost_usd=0.001,
+                latency_ms=1000,
+                success=True,
+                reason="Test request" if i else None,
+            )
+            for i in range(3)
+        ]
+
+        blob = pack_usage_batch(records)
+
+        assert isinstance(blob, bytes)
+        assert unpack_usage_batch(blob) == records
+        assert unpack_usage_batch(pack_usage_batch([])) == []
+
+
 class TestCostTiers:
     """Tests for cost tier classification."""
 
@@ -733,6 +1277,37 @@ class TestCostTiers:
         assert MODEL_COST_TIERS["gpt-4"] == CostTier.HIGH
         assert MODEL_COST_TIERS["o1-preview"] == CostTier.PREMIUM
 
+    def test_cost_tiers_are_ordered(self):
+        """Test tiers compare as ints and still parse from tier names."""
+        assert CostTier.FREE < CostTier.LOW < CostTier.MEDIUM < CostTier.HIGH < CostTier.PREMIUM
+        assert CostTier("medium") is CostTier.MEDIUM
+        assert ProviderPolicy(provider="openai", cost_tier_limit="low").cost_tier_limit is CostTier.LOW
+
+    def test_cost_tier_serialized_by_name(self):
+        """Test exported policies keep tier names and load back."""
+        policy = ProviderPolicy(provider="openai", cost_tier_limit=CostTier.MEDIUM)
+
+        data = json.loads(policy.model_dump_json())
+
+        assert data["cost_tier_limit"] == "medium"
+        assert policy.model_dump()["cost_tier_limit"] == "medium"
+        assert ProviderPolicy(**data).cost_tier_limit is CostTier.MEDIUM
+        assert json.loads(ProviderPolicy(provider="openai").model_dump_json())["cost_tier_limit"] is None
+
+    def test_free_tier_limit_enforced(self):
+        """Test a FREE limit (tier value 0) is still applied."""
+        policy = TenantPolicy(
+            tenant_id="test",
+            provider_policies={
+                "ollama": ProviderPolicy(provider="ollama", cost_tier_limit=CostTier.FREE),
+            },
+        )
+        enforcer = PolicyEnforcer(policy)
+
+        enforcer.validate_request(provider="ollama", model="llama3", estimated_tokens=1000)
+        with pytest.raises(PolicyViolationError, match=r"tier \(low\) exceeds limit \(free\)"):
+            enforcer.validate_request(provider="ollama", model="gpt-4o-mini", estimated_tokens=1000)
+
     def test_cost_tier_enforcement(self):
         """Test cost tier limit enforcement."""
         openai_policy = ProviderPolicy(
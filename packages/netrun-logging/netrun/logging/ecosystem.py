@@ -6,6 +6,7 @@ v1.2.0: Added ecosystem integration for netrun-errors, netrun-auth, netrun-confi
 """
 
 import functools
+import logging
 import time
 from contextlib import contextmanager
 from typing import Any, Callable, Dict, Optional, TypeVar
@@ -13,7 +14,6 @@ from typing import Any, Callable, Dict, Optional, TypeVar
 from netrun.logging.correlation import (
     bind_context,
     get_correlation_id,
-    set_correlation_id,
     generate_correlation_id,
 )
 from netrun.logging.logger import get_logger
@@ -22,6 +22,18 @@ from netrun.logging.logger import get_logger
 T = TypeVar("T")
 
 
+def _is_level_enabled(logger: Any, level: str) -> bool:
+    """
+    Check whether a logger would emit records at the given level.
+
+    Loggers that cannot report their level are treated as enabled.
+    """
+    is_enabled_for = getattr(logger, "is_enabled_for", None)
+    if is_enabled_for is None:
+        return True
+    return is_enabled_for(getattr(logging, level.upper(), logging.INFO))
+
+
 def bind_error_context(
     error_code: str,
     status_code: int,
@@ -104,7 +116,7 @@ def bind_request_context(
     if tenant_id:
         context["tenant_id"] = tenant_id
 
-    set_correlation_id(cid)
+    # correlation_id is part of context, so a single bind covers it
     bind_context(**context)
 
 
@@ -176,15 +188,16 @@ def log_operation_timing(
 
     try:
         yield
-        duration_ms = (time.perf_counter() - start_time) * 1000
-        log_method = getattr(logger, level, logger.info)
-        log_method(
-            "operation_completed",
-            operation=operation,
-            duration_ms=round(duration_ms, 2),
-            success=True,
-            **context,
-        )
+        if _is_level_enabled(logger, level):
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            log_method = getattr(logger, level, logger.info)
+            log_method(
+                "operation_completed",
+                operation=operation,
+                duration_ms=round(duration_ms, 2),
+                success=True,
+                **context,
+            )
     except Exception as e:
         duration_ms = (time.perf_counter() - start_time) * 1000
         logger.error(
@@ -225,69 +238,59 @@ def log_timing(
         op_name = operation or func.__name__
         logger = get_logger(func.__module__)
 
-        @functools.wraps(func)
-        def sync_wrapper(*args, **kwargs) -> T:
+        def build_context(args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
             context: Dict[str, Any] = {"function": func.__name__}
             if include_args:
                 context["args_count"] = len(args)
                 context["kwargs_keys"] = list(kwargs.keys())
+            return context
+
+        def log_completed(start_time: float, args: tuple, kwargs: Dict[str, Any]) -> None:
+            # Skip building the event entirely when the level is filtered out
+            if not _is_level_enabled(logger, level):
+                return
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            log_method = getattr(logger, level, logger.info)
+            log_method(
+                "operation_completed",
+                operation=op_name,
+                duration_ms=round(duration_ms, 2),
+                success=True,
+                **build_context(args, kwargs),
+            )
+
+        def log_failed(start_time: float, error: Exception, args: tuple, kwargs: Dict[str, Any]) -> None:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            logger.error(
+                "operation_failed",
+                operation=op_name,
+                duration_ms=round(duration_ms, 2),
+                success=False,
+                error_type=type(error).__name__,
+                **build_context(args, kwargs),
+            )
 
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs) -> T:
             start_time = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
-                duration_ms = (time.perf_counter() - start_time) * 1000
-                log_method = getattr(logger, level, logger.info)
-                log_method(
-                    "operation_completed",
-                    operation=op_name,
-                    duration_ms=round(duration_ms, 2),
-                    success=True,
-                    **context,
-                )
-                return result
             except Exception as e:
-                duration_ms = (time.perf_counter() - start_time) * 1000
-                logger.error(
-                    "operation_failed",
-                    operation=op_name,
-                    duration_ms=round(duration_ms, 2),
-                    success=False,
-                    error_type=type(e).__name__,
-                    **context,
-                )
+                log_failed(start_time, e, args, kwargs)
                 raise
+            log_completed(start_time, args, kwargs)
+            return result
 
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs) -> T:
-            context: Dict[str, Any] = {"function": func.__name__}
-            if include_args:
-                context["args_count"] = len(args)
-                context["kwargs_keys"] = list(kwargs.keys())
-
             start_time = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
-                duration_ms = (time.perf_counter() - start_time) * 1000
-                log_method = getattr(logger, level, logger.info)
-                log_method(
-                    "operation_completed",
-                    operation=op_name,
-                    duration_ms=round(duration_ms, 2),
-                    success=True,
-                    **context,
-                )
-                return result
             except Exception as e:
-                duration_ms = (time.perf_counter() - start_time) * 1000
-                logger.error(
-                    "operation_failed",
-                    operation=op_name,
-                    duration_ms=round(duration_ms, 2),
-                    success=False,
-                    error_type=type(e).__name__,
-                    **context,
-                )
+                log_failed(start_time, e, args, kwargs)
                 raise
+            log_completed(start_time, args, kwargs)
+            return result
 
         # Return appropriate wrapper based on function type
         import asyncio